@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite for the spider parsers and the analysis engine.
+
+Runs against saved HTML fixtures and events scaled from data/ (or seeded
+generated events with --synthetic), writes timings to a JSON file and
+optionally compares them to a baseline.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+BENCHMARKS_DIR = Path(__file__).parent
+FIXTURES_DIR = BENCHMARKS_DIR / "fixtures"
+BASELINE_FILE = BENCHMARKS_DIR / "baseline.json"
+INDEX_FIXTURE = FIXTURES_DIR / "decklists-index.html"
+ROUND_FIXTURE = FIXTURES_DIR / "round-4-results.html"
+ROUND_FIXTURE_NUMBER = 4
+
+# Scripts directory on the path so the pipeline modules import
+sys.path.insert(0, str(BENCHMARKS_DIR.parent / "scripts"))
+
+from bs4 import BeautifulSoup
+
+from analyze import PlayerNameIndex, analyze_metagame, get_player_archetype, load_data, normalize_player_name
+from decklist_parser import iter_chunks, iter_decklists_from_html
+from generate import generate_event
+from names import name_tokens, strip_accents
+from spider import MagicSpider
+
+DEFAULT_SCALES = (10, 100, 1000)
+# Players per synthetic event at scale 1 (about the size of data/)
+SYNTHETIC_PLAYERS = 128
+# A case fails the comparison when its median is this much slower than the baseline
+DEFAULT_THRESHOLD = 1.25
+# <deck-list> blocks as the pre-streaming parser matched them
+DECK_LIST_PATTERN = re.compile(r'<deck-list[^>]*deck-title=["\']([^"\']+)["\'][^>]*subtitle=["\']([^"\']+)["\']'
+                               r'([^>]*)>([\s\S]*?)</deck-list>', re.I)
+
+
+class FixtureSpider(MagicSpider):
+    """Spider that serves saved fixtures instead of touching the network"""
+
+    def __init__(self, pages: Dict[str, bytes]):
+        super().__init__(max_workers=1, use_cache=False)
+        self.pages = pages
+
+    def fetch_content(self, url: str) -> bytes:
+        for marker, content in self.pages.items():
+            if marker in url:
+                return content
+        return b'<html></html>'
+
+    def fetch_json(self, url: str) -> Optional[Dict]:
+        return None
+
+
+def regex_decklists(content: bytes, url: str) -> List[Dict]:
+    """
+    The regex extraction parse_decklist_index_page did before the streaming
+    parser: serialize the parsed page, then match <deck-list> blocks and card
+    lines. Kept to compare the two.
+    """
+    decklists = []
+    for player, archetype, _, body in DECK_LIST_PATTERN.findall(str(BeautifulSoup(content, 'html.parser'))):
+        player = player.strip()
+        archetype = archetype.strip()
+        if not player or not archetype:
+            continue
+        sections = {}
+        for tag in ('main-deck', 'side-board'):
+            cards = []
+            section = re.search(rf'<{tag}>([\s\S]*?)</{tag}>', body, re.I)
+            for line in section.group(1).split('\n') if section else []:
+                card_match = re.match(r'(\d+)\s+(.+)', line.strip())
+                if card_match:
+                    cards.append({'count': int(card_match.group(1)), 'name': card_match.group(2).strip()})
+            sections[tag] = cards
+        decklists.append({
+            'player': player,
+            'archetype': archetype,
+            'url': url,
+            'main_deck': sections['main-deck'],
+            'sideboard': sections['side-board']
+        })
+    return decklists
+
+
+def scale_event(decklists: Dict, results: List, factor: int) -> Tuple[Dict, List]:
+    """
+    Replicate the event factor times with distinct players. Copies share card
+    lists, and results keep their 'Last, First' format so name resolution
+    does the same work as on real data.
+    """
+    if factor == 1:
+        return decklists, results
+
+    def suffix(copy: int) -> str:
+        return f"-{copy:x}" if copy else ''
+
+    scaled_decklists = {}
+    for copy in range(factor):
+        for key, decklist in decklists.items():
+            scaled = dict(decklist)
+            scaled['player'] = decklist.get('player', '') + suffix(copy)
+            scaled_decklists[f"{key}{suffix(copy)}"] = scaled
+
+    def rename(name: str, copy: int) -> str:
+        if ',' in name:
+            last, first = name.split(',', 1)
+            return f"{first.strip()} {last.strip()}{suffix(copy)}"
+        return name + suffix(copy)
+
+    scaled_results = []
+    for copy in range(factor):
+        for result in results:
+            scaled = dict(result)
+            scaled['player1'] = rename(result.get('player1', ''), copy)
+            scaled['player2'] = rename(result.get('player2', ''), copy)
+            scaled_results.append(scaled)
+    return scaled_decklists, scaled_results
+
+
+def measure(func: Callable, repeat: int) -> Dict:
+    """Time func, returning min/median wall time over repeat runs"""
+    timings = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+    return {
+        'min': min(timings),
+        'median': statistics.median(timings),
+        'repeat': repeat
+    }
+
+
+def fixture_cases() -> Dict[str, Callable]:
+    """Benchmarks over the saved HTML fixtures"""
+    index_page = INDEX_FIXTURE.read_bytes()
+    round_page = ROUND_FIXTURE.read_bytes()
+    spider = FixtureSpider({
+        'decklists': index_page,
+        f'round-{ROUND_FIXTURE_NUMBER}-results': round_page,
+    })
+
+    def round_results():
+        # Drop parsed pages so each run parses the fixture again
+        spider.soups.clear()
+        spider.get_round_results(ROUND_FIXTURE_NUMBER)
+
+    return {
+        'parse_decklist_index_page': lambda: spider.parse_decklist_index_page(f"fixture://{INDEX_FIXTURE.name}/decklists"),
+        'get_round_results[table]': round_results,
+        # The streaming parser against the regex extraction it replaced, both over the raw page
+        'decklists_from_html[stream]': lambda: list(iter_decklists_from_html(iter_chunks(index_page))),
+        'decklists_from_html[regex]': lambda: regex_decklists(index_page, ''),
+    }
+
+
+def clear_name_caches():
+    """Empty the memoized name functions, so repeated runs don't time cache hits"""
+    for func in (strip_accents, normalize_player_name, name_tokens):
+        func.cache_clear()
+
+
+def event_cases(decklists: Dict, results: List, scale: int) -> Dict[str, Callable]:
+    """Benchmarks over the event data scaled by the given factor; every run starts with cold name caches"""
+    names = [result.get(field, '') for result in results for field in ('player1', 'player2')]
+    distinct_names = list(dict.fromkeys(names))
+
+    def normalize():
+        clear_name_caches()
+        for name in names:
+            normalize_player_name(name)
+
+    def resolve():
+        clear_name_caches()
+        name_index = PlayerNameIndex(decklists)
+        for name in distinct_names:
+            get_player_archetype(name, decklists, name_index)
+
+    def analyze(engine: str) -> Callable:
+        def run_engine():
+            clear_name_caches()
+            analyze_metagame(decklists, results, engine)
+        return run_engine
+
+    cases = {
+        f'normalize_player_name[x{scale}]': normalize,
+        f'get_player_archetype[x{scale}]': resolve,
+        f'analyze_metagame[x{scale}]': analyze('dict'),
+        f'analyze_metagame[sqlite,x{scale}]': analyze('sqlite'),
+    }
+    try:
+        import numpy  # noqa: F401
+        cases[f'analyze_metagame[columnar,x{scale}]'] = analyze('columnar')
+    except ImportError:
+        pass
+    return cases
+
+
+def synthetic_event(factor: int) -> Tuple[Dict, List]:
+    """Seeded synthetic event with factor times the players of data/"""
+    return generate_event(players=SYNTHETIC_PLAYERS * factor, seed=factor)
+
+
+def run(scales: List[int], repeat: int, synthetic: bool = False) -> Dict:
+    """Run every benchmark case and collect timings"""
+    timings = {}
+    for name, func in fixture_cases().items():
+        timings[name] = measure(func, repeat)
+        print(f"  {name}: {timings[name]['median'] * 1000:.2f} ms")
+
+    decklists, results = synthetic_event(1) if synthetic else load_data()
+    for scale in [1] + [scale for scale in scales if scale != 1]:
+        if synthetic:
+            scaled_decklists, scaled_results = synthetic_event(scale)
+        else:
+            scaled_decklists, scaled_results = scale_event(decklists, results, scale)
+        # Large scales are slow enough that fewer repeats are representative
+        scale_repeat = max(1, repeat // scale) if scale > 1 else repeat
+        for name, func in event_cases(scaled_decklists, scaled_results, scale).items():
+            timings[name] = measure(func, scale_repeat)
+            print(f"  {name}: {timings[name]['median'] * 1000:.2f} ms")
+
+    return {
+        'source': 'synthetic' if synthetic else 'data',
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'decklists': len(decklists),
+        'results': len(results),
+        'timings': timings
+    }
+
+
+def compare(report: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """List cases whose median regressed past threshold relative to the baseline"""
+    if baseline.get('source', 'data') != report['source']:
+        return [f"baseline was recorded on {baseline.get('source', 'data')} events, not {report['source']}"]
+    regressions = []
+    for name, timing in report['timings'].items():
+        previous = baseline.get('timings', {}).get(name)
+        if previous and timing['median'] > previous['median'] * threshold:
+            regressions.append(
+                f"{name}: {timing['median'] * 1000:.2f} ms vs {previous['median'] * 1000:.2f} ms baseline"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the offline benchmark suite")
+    parser.add_argument('--scales', type=int, nargs='*', default=list(DEFAULT_SCALES),
+                        help="Synthetic event sizes as multiples of data/ (current data always runs)")
+    parser.add_argument('--synthetic', action='store_true',
+                        help="Use seeded generated events instead of scaled copies of data/")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per case at the current data size")
+    parser.add_argument('--output', type=Path, default=None,
+                        help="Write the timing report to this JSON file")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help=f"Write the timing report to {BASELINE_FILE.name}")
+    parser.add_argument('--compare', type=Path, nargs='?', const=BASELINE_FILE, default=None,
+                        help="Fail if any case is slower than this baseline by more than --threshold")
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args()
+
+    print("Running benchmarks...")
+    report = run(args.scales, args.repeat, args.synthetic)
+
+    if args.output:
+        json.dump(report, open(args.output, 'w'), indent=2)
+        print(f"\nReport saved to {args.output}")
+    if args.save_baseline:
+        json.dump(report, open(BASELINE_FILE, 'w'), indent=2)
+        print(f"\nBaseline saved to {BASELINE_FILE}")
+
+    if args.compare:
+        regressions = compare(report, json.load(open(args.compare)), args.threshold)
+        if regressions:
+            print("\nRegressions:")
+            for regression in regressions:
+                print(f"  {regression}")
+            sys.exit(1)
+        print("\nNo regressions against baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,166 +3,203 @@
 Analyze Magic World Championship 31 data and generate statistics
 """
 
+import argparse
+import contextlib
+import hashlib
 import json
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from archetype_rules import ArchetypeRules, load_rules
+from instrumentation import PROFILE_FILE, count, profiled, timed, timed_function
+from matchups import MatchupMatrix
+from names import normalize_player_name
+from storage import (ANALYSIS_FILE, CARDS_FILE, DB_FILE, DEFAULT_DRAFT_ROUNDS, DEFAULT_EVENT, PLAYERS_FILE,
+                     append_json_lines, event_cache_dir, event_data_dir, event_draft_rounds, iter_decklists, iter_results,
+                     read_json_lines, results_path, write_json_atomic)
+from uncertainty import BOOTSTRAP_RESAMPLES, add_confidence_intervals
 
 # Data directory relative to project root
 DATA_DIR = Path(__file__).parent.parent / "data"
 DECKLISTS_FILE = DATA_DIR / "decklists.json"
 RESULTS_FILE = DATA_DIR / "results.json"
-OUTPUT_FILE = DATA_DIR / "analysis.json"
+OUTPUT_FILE = ANALYSIS_FILE
+# Aggregate counters and watermark saved between incremental runs (matches go to a log next to it)
+STATE_FILE = event_cache_dir(DEFAULT_EVENT) / "analysis_state.json"
+STATE_VERSION = 4
 
-# Draft rounds to exclude from archetype statistics
-DRAFT_ROUNDS = {1, 2, 3, 8, 9, 10}
+# Aggregation engines for analyze_metagame
+ENGINES = ('dict', 'columnar', 'sqlite')
 
 
-def load_data() -> Tuple[Dict, List]:
+def load_data(data_dir: Path = DATA_DIR) -> Tuple[Dict, List]:
     """Load decklists and results from cache"""
-    decklists = {}
-    if DECKLISTS_FILE.exists():
-        decklists = json.load(open(DECKLISTS_FILE))
-    
-    results = []
-    if RESULTS_FILE.exists():
-        results = json.load(open(RESULTS_FILE))
-    
+    decklists = dict(iter_decklists(Path(data_dir) / DECKLISTS_FILE.name))
+    results = list(iter_results(results_path(data_dir)))
     return decklists, results
 
 
-def normalize_player_name(name: str) -> str:
-    """Normalize player name for matching - handles both 'First Last' and 'Last, First' formats"""
-    import unicodedata
-    
-    name = name.strip()
-    if not name:
-        return ''
-    
-    # Remove accents/diacritics for better matching
-    nfd = unicodedata.normalize('NFD', name)
-    name = ''.join(c for c in nfd if unicodedata.category(c) != 'Mn')
-    
-    # If it's in "Last, First" format, convert to "First Last"
-    if ',' in name:
-        parts = [p.strip() for p in name.split(',')]
-        if len(parts) == 2:
-            # Convert "Last, First" to "First Last"
-            name = f"{parts[1]} {parts[0]}"
-        elif len(parts) > 2:
-            # Handle "Last, First Middle" format
-            name = f"{' '.join(parts[1:])} {parts[0]}"
-    
-    # Normalize to lowercase and remove extra spaces
-    return ' '.join(name.lower().split())
+def detect_special_archetypes(decklists: Dict, rules: Optional[ArchetypeRules] = None) -> Dict:
+    """
+    Detect special archetype variants based on card presence, using the
+    rules in archetype_rules.json unless others are given.
+    Returns a modified copy of decklists with updated archetypes.
+    """
+    if rules is None:
+        rules = load_rules()
+    return rules.apply(decklists)
 
 
-def detect_special_archetypes(decklists: Dict) -> Dict:
+class PlayerNameIndex:
     """
-    Detect special archetype variants based on card presence.
-    Returns a modified copy of decklists with updated archetypes.
+    Name-resolution index over decklist players, built once per run.
+    Resolves names with the same three tiers as a linear scan (exact,
+    first + last name, substring) and returns the first decklist in
+    iteration order that matches the winning tier.
     """
-    modified_decklists = {}
-    
-    for key, decklist in decklists.items():
-        archetype = decklist.get('archetype', '')
-        main_deck = decklist.get('main_deck', [])
-        sideboard = decklist.get('sideboard', [])
-        
-        # Check for Izzet Lessons with Monument to Endurance
-        if 'izzet lessons' in archetype.lower():
-            # Check if Monument to Endurance is in main deck or sideboard
-            has_monument = False
-            for card in main_deck + sideboard:
-                if card.get('name', '').lower() == 'monument to endurance':
-                    has_monument = True
-                    break
-            
-            if has_monument:
-                # Rename to Izzet Lessons (Monument)
-                decklist_copy = decklist.copy()
-                decklist_copy['archetype'] = 'Izzet Lessons (Monument)'
-                modified_decklists[key] = decklist_copy
-            else:
-                modified_decklists[key] = decklist
+
+    NGRAM = 3
+
+    def __init__(self, decklists: Dict):
+        self.archetypes: List[str] = []
+        self.names: List[str] = []
+        # Exact normalized name -> first decklist position
+        self.exact: Dict[str, int] = {}
+        # (first, last) name key -> first decklist position
+        self.first_last: Dict[Tuple[str, str], int] = {}
+        # Character n-gram -> decklist positions, used to find substring candidates
+        self.ngrams: Dict[str, List[int]] = defaultdict(list)
+        # Position of the first decklist with an empty name (matches any substring query)
+        self.first_empty: Optional[int] = None
+        self._cache: Dict[str, str] = {}
+        self._positions: Dict[str, Optional[int]] = {}
+
+        for pos, decklist in enumerate(decklists.values()):
+            name = normalize_player_name(decklist.get('player', ''))
+            self.names.append(name)
+            self.archetypes.append(decklist.get('archetype', 'Unknown'))
+
+            if not name:
+                if self.first_empty is None:
+                    self.first_empty = pos
+                continue
+
+            self.exact.setdefault(name, pos)
+
+            parts = name.split()
+            if len(parts) >= 2:
+                self.first_last.setdefault((parts[0], parts[-1]), pos)
+
+            for gram in {name[i:i + self.NGRAM] for i in range(len(name) - self.NGRAM + 1)}:
+                self.ngrams[gram].append(pos)
+
+    def _substring_match(self, normalized: str) -> Optional[int]:
+        """Find the first decklist whose name contains, or is contained in, the query"""
+        best = self.first_empty
+
+        # Decklist names contained in the query: every such name is a substring of it
+        length = len(normalized)
+        for start in range(length):
+            for end in range(start + 1, length + 1):
+                pos = self.exact.get(normalized[start:end])
+                if pos is not None and (best is None or pos < best):
+                    best = pos
+
+        # Decklist names containing the query: they must share all of its n-grams
+        if length >= self.NGRAM:
+            grams = {normalized[i:i + self.NGRAM] for i in range(length - self.NGRAM + 1)}
+            postings = [self.ngrams.get(gram, []) for gram in grams]
+            candidates = min(postings, key=len)
         else:
-            modified_decklists[key] = decklist
-    
-    return modified_decklists
+            candidates = range(len(self.names))
 
+        for pos in candidates:
+            if best is not None and pos >= best:
+                break
+            if normalized in self.names[pos]:
+                best = pos
+                break
 
-def get_player_archetype(player_name: str, decklists: Dict) -> str:
+        return best
+
+    def position(self, player_name: str) -> Optional[int]:
+        """Get the position of the decklist a player name resolves to, if any"""
+        if player_name in self._positions:
+            return self._positions[player_name]
+
+        with timed('name_resolution'):
+            pos = None
+            normalized = normalize_player_name(player_name)
+            if normalized:
+                pos = self.exact.get(normalized)
+
+                if pos is None:
+                    name_parts = normalized.split()
+                    if len(name_parts) >= 2:
+                        pos = self.first_last.get((name_parts[0], name_parts[-1]))
+
+                if pos is None:
+                    pos = self._substring_match(normalized)
+        if pos is None:
+            count('names.unresolved')
+
+        self._positions[player_name] = pos
+        return pos
+
+    def lookup(self, player_name: str) -> str:
+        """Get archetype for a player name"""
+        cached = self._cache.get(player_name)
+        if cached is not None:
+            return cached
+
+        pos = self.position(player_name)
+        archetype = 'Unknown' if pos is None else self.archetypes[pos]
+
+        self._cache[player_name] = archetype
+        return archetype
+
+
+@timed_function('get_player_archetype')
+def get_player_archetype(player_name: str, decklists: Dict, name_index: Optional[PlayerNameIndex] = None) -> str:
     """Get archetype for a player"""
-    normalized = normalize_player_name(player_name)
-    if not normalized:
-        return 'Unknown'
-    
-    # Try exact match first
-    for decklist in decklists.values():
-        decklist_player = normalize_player_name(decklist.get('player', ''))
-        if decklist_player == normalized:
-            return decklist.get('archetype', 'Unknown')
-    
-    # Try matching by last name (for cases with middle names, etc.)
-    # Extract last name from normalized name
-    name_parts = normalized.split()
-    if len(name_parts) >= 2:
-        last_name = name_parts[-1]
-        for decklist in decklists.values():
-            decklist_player = normalize_player_name(decklist.get('player', ''))
-            decklist_parts = decklist_player.split()
-            if len(decklist_parts) >= 2 and decklist_parts[-1] == last_name:
-                # Also check first name matches
-                if name_parts[0] == decklist_parts[0]:
-                    return decklist.get('archetype', 'Unknown')
-    
-    # Try partial match as fallback
-    for decklist in decklists.values():
-        decklist_player = normalize_player_name(decklist.get('player', ''))
-        if normalized in decklist_player or decklist_player in normalized:
-            return decklist.get('archetype', 'Unknown')
-    
-    return 'Unknown'
+    if name_index is None:
+        name_index = PlayerNameIndex(decklists)
+    return name_index.lookup(player_name)
 
 
-def analyze_metagame(decklists: Dict, results: List) -> Dict:
-    """Analyze the metagame and generate statistics"""
-    
-    # Detect and rename special archetype variants
-    decklists = detect_special_archetypes(decklists)
-    
-    # Build player -> archetype mapping
-    player_archetypes = {}
-    for decklist in decklists.values():
-        player = decklist.get('player', '')
-        if player:
-            player_archetypes[normalize_player_name(player)] = decklist.get('archetype', 'Unknown')
-    
-    # Archetype statistics
-    archetype_counts = defaultdict(int)
-    for archetype in player_archetypes.values():
-        archetype_counts[archetype] += 1
-    
-    # Match statistics
-    match_stats = defaultdict(lambda: {
-        'wins': 0,
-        'losses': 0,
-        'draws': 0,
-        'games_won': 0,
-        'games_lost': 0,
-        'matches': []
-    })
-    
-    # Matchup statistics: archetype1 vs archetype2
-    matchup_stats = defaultdict(lambda: {
+def new_match_stats() -> Dict:
+    """Empty win/loss/game counters for an archetype"""
+    return {
         'wins': 0,
         'losses': 0,
         'draws': 0,
         'games_won': 0,
         'games_lost': 0,
         'matches': []
-    })
-    
+    }
+
+
+def build_player_archetypes(decklists: Dict) -> Dict[str, str]:
+    """Build normalized player name -> archetype mapping"""
+    player_archetypes = {}
+    for decklist in decklists.values():
+        player = decklist.get('player', '')
+        if player:
+            player_archetypes[normalize_player_name(player)] = decklist.get('archetype', 'Unknown')
+    return player_archetypes
+
+
+def accumulate_results(match_stats: Dict, matchups: MatchupMatrix, match_table: List[Dict], results: List,
+                       name_index: PlayerNameIndex, draft_rounds: Iterable[int] = DEFAULT_DRAFT_ROUNDS):
+    """
+    Fold match results into per-archetype counters and the matchup matrix,
+    skipping the event's draft rounds.
+    Each processed match is appended to match_table once and referenced from
+    the counters' 'matches' lists by its index. Counters are updated in
+    place, so results can be applied in batches.
+    """
+    draft_rounds = set(draft_rounds)
     # Process each match result
     for result in results:
         round_num = result.get('round', 0)
@@ -175,16 +212,12 @@ def analyze_metagame(decklists: Dict, results: List) -> Dict:
             continue
         
         # Skip draft rounds for archetype statistics
-        if round_num in DRAFT_ROUNDS:
+        if round_num in draft_rounds:
             continue
         
         # Get archetypes
-        p1_arch = get_player_archetype(p1_name, decklists)
-        p2_arch = get_player_archetype(p2_name, decklists)
-        
-        # Update archetype match stats
-        arch1_key = f"{p1_arch} vs {p2_arch}"
-        arch2_key = f"{p2_arch} vs {p1_arch}"
+        p1_arch = name_index.lookup(p1_name)
+        p2_arch = name_index.lookup(p2_name)
         
         # Skip mirror matches for win rate calculations
         is_mirror = p1_arch == p2_arch
@@ -195,21 +228,15 @@ def analyze_metagame(decklists: Dict, results: List) -> Dict:
             if not is_mirror:
                 match_stats[p1_arch]['wins'] += 1
                 match_stats[p2_arch]['losses'] += 1
-            matchup_stats[arch1_key]['wins'] += 1
-            matchup_stats[arch2_key]['losses'] += 1
         elif p2_wins > p1_wins:
             # Player 2 won
             if not is_mirror:
                 match_stats[p2_arch]['wins'] += 1
                 match_stats[p1_arch]['losses'] += 1
-            matchup_stats[arch2_key]['wins'] += 1
-            matchup_stats[arch1_key]['losses'] += 1
         else:
             # Draw - count draws even for mirror matches
             match_stats[p1_arch]['draws'] += 1
             match_stats[p2_arch]['draws'] += 1
-            matchup_stats[arch1_key]['draws'] = matchup_stats[arch1_key].get('draws', 0) + 1
-            matchup_stats[arch2_key]['draws'] = matchup_stats[arch2_key].get('draws', 0) + 1
         
         # Update game stats (mirrors still count for game stats)
         match_stats[p1_arch]['games_won'] += p1_wins
@@ -217,13 +244,10 @@ def analyze_metagame(decklists: Dict, results: List) -> Dict:
         match_stats[p2_arch]['games_won'] += p2_wins
         match_stats[p2_arch]['games_lost'] += p1_wins
         
-        matchup_stats[arch1_key]['games_won'] += p1_wins
-        matchup_stats[arch1_key]['games_lost'] += p2_wins
-        matchup_stats[arch2_key]['games_won'] += p2_wins
-        matchup_stats[arch2_key]['games_lost'] += p1_wins
-        
-        # Store match details
-        match_info = {
+        # Store match details once and reference them by match id
+        match_id = len(match_table)
+        matchups.record(matchups.intern(p1_arch), matchups.intern(p2_arch), p1_wins, p2_wins, match_id)
+        match_table.append({
             'round': round_num,
             'player1': p1_name,
             'player2': p2_name,
@@ -231,15 +255,45 @@ def analyze_metagame(decklists: Dict, results: List) -> Dict:
             'archetype2': p2_arch,
             'p1_wins': p1_wins,
             'p2_wins': p2_wins
-        }
+        })
         
-        match_stats[p1_arch]['matches'].append(match_info)
-        match_stats[p2_arch]['matches'].append(match_info)
-        matchup_stats[arch1_key]['matches'].append(match_info)
-        matchup_stats[arch2_key]['matches'].append(match_info)
+        match_stats[p1_arch]['matches'].append(match_id)
+        match_stats[p2_arch]['matches'].append(match_id)
+
+
+def summarize_metagame(match_stats: Dict, matchups: MatchupMatrix, match_table: List[Dict],
+                       player_archetypes: Dict[str, str], total_matches: int, legacy_format: bool = False,
+                       bootstrap_resamples: int = 0, previous: Optional[Dict] = None) -> Dict:
+    """
+    Derive win rates and canonical matchup summaries from accumulated counters.
+    By default matches are emitted once in a top-level 'matches' table and
+    archetype and matchup entries hold match ids, the matchup matrix is
+    emitted as 'matchup_matrix', and win rates get Wilson confidence
+    intervals, plus bootstrap intervals when bootstrap_resamples is set.
+    legacy_format embeds full match records in every archetype entry instead.
+
+    previous holds derived fields from an earlier summary (archetype ->
+    fields, sorted archetype pair -> matchup) for entries whose counters
+    haven't changed since; they're reused instead of derived again.
+    """
+    previous = previous or {'archetype_stats': {}, 'matchup_stats': {}}
+    
+    # Archetype statistics
+    archetype_counts = defaultdict(int)
+    for archetype in player_archetypes.values():
+        archetype_counts[archetype] += 1
     
     # Calculate win rates
     for arch, stats in match_stats.items():
+        if legacy_format:
+            stats['matches'] = [match_table[match_id] for match_id in stats['matches']]
+        else:
+            # Mirror matches are listed twice in the counters
+            stats['matches'] = list(dict.fromkeys(stats['matches']))
+        derived = previous['archetype_stats'].get(arch)
+        if derived is not None:
+            stats.update(derived)
+            continue
         total = stats['wins'] + stats['losses']
         if total > 0:
             stats['win_rate'] = stats['wins'] / total
@@ -249,98 +303,494 @@ def analyze_metagame(decklists: Dict, results: List) -> Dict:
             stats['game_win_rate'] = 0
         stats['total_matches'] = total
     
-    # Calculate matchup win rates
-    matchup_summary = {}
-    for matchup_key, stats in matchup_stats.items():
-        total = stats['wins'] + stats['losses']
-        if total > 0:
-            arch1, arch2 = matchup_key.split(' vs ', 1)
-            # Use canonical form (alphabetically sorted)
-            canonical = ' vs '.join(sorted([arch1, arch2]))
-            
-            if canonical not in matchup_summary:
-                matchup_summary[canonical] = {
-                    'archetype1': arch1,
-                    'archetype2': arch2,
-                    'arch1_wins': 0,
-                    'arch2_wins': 0,
-                    'arch1_games': 0,
-                    'arch2_games': 0,
-                    'total_matches': 0
-                }
-            
-            if arch1 == matchup_summary[canonical]['archetype1']:
-                matchup_summary[canonical]['arch1_wins'] += stats['wins']
-                matchup_summary[canonical]['arch1_games'] += stats['games_won']
-                matchup_summary[canonical]['arch2_wins'] += stats['losses']
-                matchup_summary[canonical]['arch2_games'] += stats['games_lost']
-            else:
-                matchup_summary[canonical]['arch2_wins'] += stats['wins']
-                matchup_summary[canonical]['arch2_games'] += stats['games_won']
-                matchup_summary[canonical]['arch1_wins'] += stats['losses']
-                matchup_summary[canonical]['arch1_games'] += stats['games_lost']
-            
-            matchup_summary[canonical]['total_matches'] += total
-    
-    # Calculate matchup win rates
-    for matchup_key, matchup in matchup_summary.items():
-        total = matchup['total_matches']
-        if total > 0:
-            matchup['arch1_win_rate'] = matchup['arch1_wins'] / total
-            matchup['arch2_win_rate'] = matchup['arch2_wins'] / total
-            total_games = matchup['arch1_games'] + matchup['arch2_games']
-            if total_games > 0:
-                matchup['arch1_game_win_rate'] = matchup['arch1_games'] / total_games
-                matchup['arch2_game_win_rate'] = matchup['arch2_games'] / total_games
-            else:
-                matchup['arch1_game_win_rate'] = 0
-                matchup['arch2_game_win_rate'] = 0
+    matchup_summary = matchups.summary(legacy_format, previous['matchup_stats'])
     
-    return {
+    analysis = {
         'archetype_counts': dict(archetype_counts),
         'archetype_stats': dict(match_stats),
         'matchup_stats': matchup_summary,
         'total_players': len(player_archetypes),
-        'total_matches': len(results)
+        'total_matches': total_matches
     }
+    if not legacy_format:
+        analysis['matches'] = match_table
+        analysis['matchup_matrix'] = matchups.to_json()
+        with timed('uncertainty'):
+            add_confidence_intervals(analysis['archetype_stats'], matchup_summary, analysis['matchup_matrix'],
+                                     bootstrap_resamples)
+    return analysis
 
 
-def main():
-    """Main analysis function"""
-    print("Loading data...")
-    decklists, results = load_data()
+@timed_function('analyze_metagame')
+def analyze_metagame(decklists: Dict, results: List, engine: str = 'dict', legacy_format: bool = False,
+                     bootstrap_resamples: int = 0, db_path: Optional[Path] = None,
+                     event: str = DEFAULT_EVENT, draft_rounds: Iterable[int] = DEFAULT_DRAFT_ROUNDS) -> Dict:
+    """
+    Analyze the metagame and generate statistics; draft_rounds are left out
+    of the archetype statistics.
+    engine='columnar' aggregates with NumPy over an array-backed match store
+    (requires numpy) and engine='sqlite' with GROUP BY queries over a SQLite
+    store; both produce identical output. The sqlite engine copies the
+    decklists and results into an in-memory store, unless db_path is given:
+    then it aggregates the event as stored in that database, which the
+    decklists and results must have been loaded from. The sqlite engine is
+    for checking the store, not for speed: with the in-memory copy it runs
+    about ten times slower than the dict engine.
+    """
+    
+    # Detect and rename special archetype variants
+    decklists = detect_special_archetypes(decklists)
+    
+    # Build player name index once for archetype lookups
+    name_index = PlayerNameIndex(decklists)
+    
+    if engine == 'columnar':
+        from columnar import MatchColumns, aggregate_columnar
+        columns = MatchColumns.from_results(results, name_index, set(draft_rounds))
+        match_stats, matchups, match_table = aggregate_columnar(columns)
+    elif engine == 'sqlite':
+        from sqlite_store import MetagameStore
+        if db_path:
+            with MetagameStore(db_path) as store:
+                match_stats, matchups, match_table = store.aggregate(event, draft_rounds)
+        else:
+            with MetagameStore(':memory:') as store:
+                store.import_event(event, decklists, results, name_index)
+                match_stats, matchups, match_table = store.aggregate(event, draft_rounds)
+    elif engine == 'dict':
+        # Match statistics
+        match_stats = defaultdict(new_match_stats)
+        
+        # Matchup statistics: archetype1 vs archetype2
+        matchups = MatchupMatrix()
+        
+        match_table = []
+        accumulate_results(match_stats, matchups, match_table, results, name_index, draft_rounds)
+    else:
+        raise ValueError(f"Unknown analysis engine: {engine}")
+    
+    return summarize_metagame(match_stats, matchups, match_table, build_player_archetypes(decklists),
+                              len(results), legacy_format, bootstrap_resamples)
+
+
+def new_card_usage() -> Dict:
+    """Empty copy and deck counters for a card"""
+    return {
+        'total_copies': 0,
+        'main_copies': 0,
+        'side_copies': 0,
+        'decks': 0,
+        'main_decks': 0,
+        'side_decks': 0
+    }
+
+
+@timed_function('aggregate_cards')
+def aggregate_cards(decklists: Dict) -> Dict:
+    """
+    Aggregate card usage across decklists: total copies, decks played,
+    main/side split, average copies per deck playing the card, and the same
+    counters per archetype with the share of that archetype's decks.
+    """
+    archetype_decks = defaultdict(int)
+    cards = {}
+    
+    for decklist in decklists.values():
+        archetype = decklist.get('archetype', 'Unknown')
+        archetype_decks[archetype] += 1
+        
+        # Copies per card in each half of this deck
+        deck_cards = defaultdict(lambda: [0, 0])
+        for card in decklist.get('main_deck', []):
+            deck_cards[card['name']][0] += card['count']
+        for card in decklist.get('sideboard', []):
+            deck_cards[card['name']][1] += card['count']
+        
+        for name, (main_copies, side_copies) in deck_cards.items():
+            card = cards.get(name)
+            if card is None:
+                card = cards[name] = new_card_usage()
+                card['archetypes'] = {}
+            by_archetype = card['archetypes'].get(archetype)
+            if by_archetype is None:
+                by_archetype = card['archetypes'][archetype] = new_card_usage()
+            
+            for usage in (card, by_archetype):
+                usage['total_copies'] += main_copies + side_copies
+                usage['main_copies'] += main_copies
+                usage['side_copies'] += side_copies
+                usage['decks'] += 1
+                usage['main_decks'] += 1 if main_copies else 0
+                usage['side_decks'] += 1 if side_copies else 0
+    
+    for card in cards.values():
+        card['avg_copies'] = card['total_copies'] / card['decks']
+        for archetype, usage in card['archetypes'].items():
+            usage['avg_copies'] = usage['total_copies'] / usage['decks']
+            usage['share'] = usage['decks'] / archetype_decks[archetype]
+    
+    return {
+        'total_decks': len(decklists),
+        'archetype_decks': dict(archetype_decks),
+        'cards': cards
+    }
+
+
+def new_player_record() -> Dict:
+    """Empty match and game record for a player"""
+    return {
+        'wins': 0,
+        'losses': 0,
+        'draws': 0,
+        'games_won': 0,
+        'games_lost': 0,
+        'total_matches': 0
+    }
+
+
+@timed_function('build_player_table')
+def build_player_table(decklists: Dict, results: List, name_index: Optional[PlayerNameIndex] = None,
+                       draft_rounds: Iterable[int] = DEFAULT_DRAFT_ROUNDS) -> Dict:
+    """
+    Build per-player records keyed by normalized name. Each player has their
+    decklist name and archetype, constructed and draft records, the last round
+    played, and ids into a match table holding every result (draft rounds
+    included) with both players' archetypes resolved.
+    """
+    if name_index is None:
+        name_index = PlayerNameIndex(decklists)
+    draft_rounds = set(draft_rounds)
+    
+    players = {}
+    # Decklist position -> player key, for resolving result names
+    position_keys = {}
+    for pos, decklist in enumerate(decklists.values()):
+        key = normalize_player_name(decklist.get('player', ''))
+        if not key or key in players:
+            continue
+        position_keys[pos] = key
+        players[key] = {
+            'player': decklist.get('player', ''),
+            'archetype': decklist.get('archetype', 'Unknown'),
+            'constructed': new_player_record(),
+            'draft': new_player_record(),
+            'last_round': 0,
+            'matches': []
+        }
+    
+    match_table = []
+    for result in results:
+        round_num = result.get('round', 0)
+        p1_name = result.get('player1', '').strip()
+        p2_name = result.get('player2', '').strip()
+        p1_wins = result.get('p1_wins', 0)
+        p2_wins = result.get('p2_wins', 0)
+        
+        if not p1_name or not p2_name:
+            continue
+        
+        match_id = len(match_table)
+        match_table.append({
+            'round': round_num,
+            'player1': p1_name,
+            'player2': p2_name,
+            'archetype1': name_index.lookup(p1_name),
+            'archetype2': name_index.lookup(p2_name),
+            'p1_wins': p1_wins,
+            'p2_wins': p2_wins
+        })
+        
+        stage = 'draft' if round_num in draft_rounds else 'constructed'
+        for name, won, lost in ((p1_name, p1_wins, p2_wins), (p2_name, p2_wins, p1_wins)):
+            key = position_keys.get(name_index.position(name))
+            if key is None:
+                continue
+            player = players[key]
+            record = player[stage]
+            if won > lost:
+                record['wins'] += 1
+            elif lost > won:
+                record['losses'] += 1
+            else:
+                record['draws'] += 1
+            record['games_won'] += won
+            record['games_lost'] += lost
+            record['total_matches'] += 1
+            player['last_round'] = max(player['last_round'], round_num)
+            player['matches'].append(match_id)
+    
+    return {
+        'players': players,
+        'matches': match_table
+    }
+
+
+def fingerprint(data) -> str:
+    """Stable content hash of JSON-serializable data"""
+    return hashlib.sha256(json.dumps(data, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def file_stamp(path: Path) -> Dict:
+    """Size and modification time of a file, which change whenever it is rewritten"""
+    stat = Path(path).stat()
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+class SavedNameLookups:
+    """
+    Player name -> archetype lookups kept between incremental runs. The name
+    index over the decklists is only built when a name hasn't been resolved
+    before.
+    """
+
+    def __init__(self, decklists: Dict, resolved: Dict[str, str]):
+        self.decklists = decklists
+        self.resolved = resolved
+        self.name_index: Optional[PlayerNameIndex] = None
+
+    def lookup(self, player_name: str) -> str:
+        archetype = self.resolved.get(player_name)
+        if archetype is None:
+            if self.name_index is None:
+                self.name_index = PlayerNameIndex(detect_special_archetypes(self.decklists))
+            archetype = self.resolved[player_name] = self.name_index.lookup(player_name)
+        return archetype
+
+
+def derived_fields(analysis: Dict) -> Dict:
+    """
+    Fields summarize_metagame derived from the counters, per archetype and
+    per matchup, without match ids. Bootstrap intervals are left out, as
+    they're redrawn for every group whenever they are requested.
+    """
+    counters = new_match_stats()
+    return {
+        'archetype_stats': {
+            arch: {field: value for field, value in stats.items()
+                   if field not in counters and not field.endswith('_bootstrap')}
+            for arch, stats in analysis['archetype_stats'].items()
+        },
+        'matchup_stats': [
+            {field: value for field, value in matchup.items()
+             if field != 'matches' and not field.endswith('_bootstrap')}
+            for matchup in analysis['matchup_stats'].values()
+        ]
+    }
+
+
+@timed_function('analyze_metagame_incremental')
+def analyze_metagame_incremental(decklists: Dict, results: List, state_file: Path = STATE_FILE,
+                                 legacy_format: bool = False, bootstrap_resamples: int = 0,
+                                 decklists_path: Optional[Path] = DECKLISTS_FILE,
+                                 draft_rounds: Iterable[int] = DEFAULT_DRAFT_ROUNDS) -> Dict:
+    """
+    Analyze the metagame, reusing aggregate state saved by the previous run.
+    Only results past the saved watermark are processed, and only the
+    archetypes and matchups they touch are derived again. The state is
+    rebuilt from scratch when decklists change (by decklists_path's size and
+    modification time, or by content when decklists don't come from a file),
+    the draft rounds change or previously ingested results differ.
+
+    The state file holds counters, resolved player names and derived fields;
+    processed matches are appended to a JSON Lines match log next to it.
+    The output is identical to analyze_metagame(decklists, results).
+    """
+    match_log = state_file.with_name(state_file.stem + '.matches.jsonl')
+    decklists_watermark = file_stamp(decklists_path) if decklists_path else fingerprint(decklists)
+    draft_rounds = sorted(set(draft_rounds))
+    
+    state = None
+    if state_file.exists() and match_log.exists():
+        state = json.load(open(state_file))
+        watermark = state.get('watermark', {})
+        ingested = watermark.get('matches', 0)
+        if (state.get('version') != STATE_VERSION
+                or watermark.get('decklists') != decklists_watermark
+                or watermark.get('draft_rounds') != draft_rounds
+                or ingested > len(results)
+                or (ingested and watermark.get('last_match') != fingerprint(results[ingested - 1]))):
+            state = None
+        else:
+            match_table = read_json_lines(match_log)
+            if len(match_table) != watermark['match_log']:
+                state = None
+        if state is None:
+            print("Saved analysis state is stale, rebuilding from scratch")
+    
+    if state is None:
+        ingested = 0
+        match_stats = defaultdict(new_match_stats)
+        matchups = MatchupMatrix()
+        match_table = []
+        rounds = set()
+        names = SavedNameLookups(decklists, {})
+        player_archetypes = build_player_archetypes(detect_special_archetypes(decklists))
+        previous = None
+        match_log.write_text('', encoding='utf-8')
+    else:
+        match_stats = defaultdict(new_match_stats, state['match_stats'])
+        matchups = MatchupMatrix.from_state(state['matchups'])
+        # Counters are saved without match ids; list the logged matches again
+        for match_id, match in enumerate(match_table):
+            arch1, arch2 = match['archetype1'], match['archetype2']
+            match_stats[arch1]['matches'].append(match_id)
+            match_stats[arch2]['matches'].append(match_id)
+            matchups.list_match(matchups.ids[arch1], matchups.ids[arch2], match_id)
+        rounds = set(watermark['rounds'])
+        names = SavedNameLookups(decklists, state['players'])
+        player_archetypes = state['player_archetypes']
+        previous = state['derived']
+    
+    delta = results[ingested:]
+    print(f"Applying {len(delta)} new match results ({ingested} already ingested)")
+    logged = len(match_table)
+    accumulate_results(match_stats, matchups, match_table, delta, names, draft_rounds)
+    rounds.update(result.get('round', 0) for result in delta)
+    append_json_lines(match_log, match_table[logged:])
+    
+    if previous is not None:
+        # Archetypes and matchups the new matches touched are derived again
+        touched = set()
+        for match in match_table[logged:]:
+            touched.update((match['archetype1'], match['archetype2']))
+        previous = {
+            'archetype_stats': {arch: fields for arch, fields in previous['archetype_stats'].items()
+                                if arch not in touched},
+            'matchup_stats': {tuple(sorted((matchup['archetype1'], matchup['archetype2']))): matchup
+                              for matchup in previous['matchup_stats']}
+        }
+        for match in match_table[logged:]:
+            previous['matchup_stats'].pop(tuple(sorted((match['archetype1'], match['archetype2']))), None)
+    
+    # Save counters before summarizing, which adds derived fields in place
+    saved_stats = {arch: dict(stats, matches=[]) for arch, stats in match_stats.items()}
+    analysis = summarize_metagame(match_stats, matchups, match_table, player_archetypes, len(results),
+                                  legacy_format, bootstrap_resamples, previous)
+    
+    state = {
+        'version': STATE_VERSION,
+        'watermark': {
+            'decklists': decklists_watermark,
+            'draft_rounds': draft_rounds,
+            'rounds': sorted(rounds),
+            'matches': len(results),
+            'last_match': fingerprint(results[-1]) if results else None,
+            'match_log': len(match_table)
+        },
+        'match_stats': saved_stats,
+        'matchups': matchups.to_state(include_matches=False),
+        'players': names.resolved,
+        'player_archetypes': player_archetypes,
+        'derived': derived_fields(analysis)
+    }
+    write_json_atomic(state_file, state, indent=None)
+    
+    return analysis
+
+
+def main(incremental: bool = False, engine: str = 'dict', legacy_format: bool = False,
+         db_path: Optional[Path] = None, event: str = DEFAULT_EVENT, bootstrap_resamples: int = 0):
+    """Main analysis function; outputs go to the event's data directory and incremental state to its cache"""
+    data_dir = event_data_dir(event)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    decklists_file = data_dir / DECKLISTS_FILE.name
+    draft_rounds = event_draft_rounds(data_dir)
+    if db_path:
+        from sqlite_store import MetagameStore
+        print(f"Loading {event} from {db_path}...")
+        with MetagameStore(db_path) as store:
+            decklists, results = store.load_event(event)
+    else:
+        print("Loading data...")
+        decklists, results = load_data(data_dir)
     
     print(f"Loaded {len(decklists)} decklists")
     print(f"Loaded {len(results)} match results")
+    print(f"Draft rounds: {', '.join(map(str, sorted(draft_rounds)))}")
     
     print("\nDetecting special archetypes...")
-    decklists = detect_special_archetypes(decklists)
+    detected = detect_special_archetypes(decklists)
     
-    # Save updated decklists with detected archetypes
-    json.dump(decklists, open(DECKLISTS_FILE, 'w'), indent=2)
-    print(f"Updated decklists saved to {DECKLISTS_FILE}")
+    # Save updated decklists with detected archetypes (renamed decklists are copies)
+    if any(detected[key] is not decklists[key] for key in decklists):
+        if db_path:
+            with MetagameStore(db_path) as store:
+                store.import_event(event, detected, results)
+            print(f"Updated decklists saved to {db_path}")
+        else:
+            write_json_atomic(decklists_file, detected)
+            print(f"Updated decklists saved to {decklists_file}")
+    decklists = detected
     
     print("\nAnalyzing metagame...")
-    analysis = analyze_metagame(decklists, results)
+    if incremental:
+        state_file = event_cache_dir(event) / STATE_FILE.name
+        state_file.parent.mkdir(parents=True, exist_ok=True)
+        analysis = analyze_metagame_incremental(decklists, results, state_file,
+                                                legacy_format=legacy_format,
+                                                bootstrap_resamples=bootstrap_resamples,
+                                                decklists_path=None if db_path else decklists_file,
+                                                draft_rounds=draft_rounds)
+    else:
+        analysis = analyze_metagame(decklists, results, engine, legacy_format, bootstrap_resamples,
+                                    db_path=db_path, event=event, draft_rounds=draft_rounds)
     
     print(f"\nFound {analysis['total_players']} players")
     print(f"Found {len(analysis['archetype_counts'])} archetypes")
     print(f"Processed {analysis['total_matches']} matches")
     
     print("\nArchetype Representation:")
-    for arch, count in sorted(analysis['archetype_counts'].items(), key=lambda x: -x[1]):
-        print(f"  {arch}: {count}")
+    for arch, n in sorted(analysis['archetype_counts'].items(), key=lambda x: -x[1]):
+        print(f"  {arch}: {n}")
     
     print("\nArchetype Win Rates:")
     for arch, stats in sorted(analysis['archetype_stats'].items(), key=lambda x: -x[1].get('win_rate', 0)):
         if stats['total_matches'] > 0:
             print(f"  {arch}: {stats['wins']}-{stats['losses']} ({stats['win_rate']:.1%})")
     
-    # Save analysis
-    json.dump(analysis, open(OUTPUT_FILE, 'w'), indent=2)
-    print(f"\nAnalysis saved to {OUTPUT_FILE}")
+    print("\nAggregating card usage...")
+    card_usage = aggregate_cards(decklists)
+    cards_file = data_dir / CARDS_FILE.name
+    json.dump(card_usage, open(cards_file, 'w'), separators=(',', ':'))
+    print(f"Card usage for {len(card_usage['cards'])} cards saved to {cards_file}")
+    
+    print("\nBuilding player table...")
+    player_table = build_player_table(decklists, results, draft_rounds=draft_rounds)
+    players_file = data_dir / PLAYERS_FILE.name
+    json.dump(player_table, open(players_file, 'w'), separators=(',', ':'))
+    print(f"Records for {len(player_table['players'])} players saved to {players_file}")
+    
+    # Save analysis - the normalized format is written compactly for the dashboard
+    output_file = data_dir / OUTPUT_FILE.name
+    if legacy_format:
+        json.dump(analysis, open(output_file, 'w'), indent=2)
+    else:
+        json.dump(analysis, open(output_file, 'w'), separators=(',', ':'))
+    print(f"\nAnalysis saved to {output_file}")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Analyze the metagame from cached decklists and results")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only process results added since the last incremental run")
+    parser.add_argument('--engine', choices=ENGINES, default='dict',
+                        help="Aggregation engine; 'columnar' uses NumPy arrays and 'sqlite' SQL queries "
+                             "(full rebuilds only, about 10x slower than 'dict')")
+    parser.add_argument('--legacy-format', action='store_true',
+                        help="Embed full match records in each archetype instead of a shared match table")
+    parser.add_argument('--db', type=Path, nargs='?', const=DB_FILE, default=None,
+                        help=f"Read decklists and results from the SQLite store (default: {DB_FILE.name} in .cache/)")
+    parser.add_argument('--event', default=DEFAULT_EVENT,
+                        help=f"Event to analyze, read from --db or data/<event>/; outputs are written next to "
+                             f"its data (default: {DEFAULT_EVENT} in data/)")
+    parser.add_argument('--profile', action='store_true',
+                        help=f"Profile the analysis with cProfile and save the stats to {PROFILE_FILE}")
+    parser.add_argument('--bootstrap', type=int, nargs='?', const=BOOTSTRAP_RESAMPLES, default=0,
+                        metavar='RESAMPLES',
+                        help=f"Add bootstrap confidence intervals (default {BOOTSTRAP_RESAMPLES} resamples, "
+                             "requires numpy)")
+    args = parser.parse_args()
+    with profiled(PROFILE_FILE) if args.profile else contextlib.nullcontext():
+        main(incremental=args.incremental, engine=args.engine, legacy_format=args.legacy_format,
+             db_path=args.db, event=args.event, bootstrap_resamples=args.bootstrap)
 
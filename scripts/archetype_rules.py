@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Declarative archetype variant rules, compiled for one-pass evaluation.
+
+Rules live in archetype_rules.json. Each one names a base archetype
+(matched case-insensitively as a substring of the deck's archetype), the
+archetype to assign, and the cards it requires:
+
+    {"base": "Izzet Lessons", "archetype": "Izzet Lessons (Monument)",
+     "require": [{"card": "Monument to Endurance", "min_copies": 1, "board": "any"}]}
+
+board is 'main', 'side' or 'any' (both combined). The first matching rule
+wins. Every distinct card requirement across all rules is compiled to an
+id, each deck is reduced to the set of requirement ids it meets in a
+single pass over its cards, and a rule matches when its requirement set is
+a subset of the deck's.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+RULES_FILE = Path(__file__).parent / "archetype_rules.json"
+BOARDS = ('main', 'side', 'any')
+
+
+class ArchetypeRules:
+    """A compiled set of archetype variant rules"""
+
+    def __init__(self, rules: List[Dict]):
+        # Requirement (card, board, min_copies) -> id
+        self.requirements: Dict[Tuple[str, str, int], int] = {}
+        # Lowercased card name -> [(requirement id, board, min_copies)]
+        self.card_requirements: Dict[str, List[Tuple[int, str, int]]] = {}
+        # (lowercased base archetype, archetype to assign, requirement ids), in priority order
+        self.rules: List[Tuple[str, str, FrozenSet[int]]] = []
+        # Lowercased base archetype -> base archetype as written in the rules
+        self.base_names: Dict[str, str] = {}
+        # Deck archetype -> indexes of the rules whose base it matches
+        self._candidates: Dict[str, List[int]] = {}
+
+        for rule in rules:
+            if 'base' not in rule or 'archetype' not in rule or not rule.get('require'):
+                raise ValueError(f"Archetype rule needs base, archetype and require: {rule}")
+            requirement_ids = frozenset(self._compile_requirement(requirement) for requirement in rule['require'])
+            self.rules.append((rule['base'].lower(), rule['archetype'], requirement_ids))
+            self.base_names.setdefault(rule['base'].lower(), rule['base'])
+
+    @classmethod
+    def from_file(cls, path: Path = RULES_FILE) -> 'ArchetypeRules':
+        return cls(json.load(open(path))['rules'])
+
+    def _compile_requirement(self, requirement: Dict) -> int:
+        card = requirement['card'].lower()
+        board = requirement.get('board', 'any')
+        min_copies = requirement.get('min_copies', 1)
+        if board not in BOARDS:
+            raise ValueError(f"Unknown board '{board}' in archetype rule, expected one of {BOARDS}")
+
+        key = (card, board, min_copies)
+        requirement_id = self.requirements.get(key)
+        if requirement_id is None:
+            requirement_id = self.requirements[key] = len(self.requirements)
+            self.card_requirements.setdefault(card, []).append((requirement_id, board, min_copies))
+        return requirement_id
+
+    def base_archetype(self, archetype: str) -> str:
+        """Base archetype of a variant a rule assigns; other archetypes are returned unchanged"""
+        for base, variant, _ in self.rules:
+            if archetype == variant:
+                return self.base_names[base]
+        return archetype
+
+    def candidate_rules(self, archetype: str) -> List[int]:
+        """Rules whose base archetype matches, computed once per distinct archetype"""
+        candidates = self._candidates.get(archetype)
+        if candidates is None:
+            lowered = archetype.lower()
+            candidates = self._candidates[archetype] = [
+                index for index, (base, _, _) in enumerate(self.rules) if base in lowered
+            ]
+        return candidates
+
+    def met_requirements(self, decklist: Dict) -> FrozenSet[int]:
+        """Ids of the card requirements a deck meets, in one pass over its cards"""
+        # Lowercased card name -> [main copies, side copies], for cards some rule mentions
+        copies: Dict[str, List[int]] = {}
+        for board_index, field in enumerate(('main_deck', 'sideboard')):
+            for card in decklist.get(field, []):
+                name = card.get('name', '').lower()
+                if name in self.card_requirements:
+                    copies.setdefault(name, [0, 0])[board_index] += card.get('count', 1)
+
+        met = set()
+        for name, (main_copies, side_copies) in copies.items():
+            for requirement_id, board, min_copies in self.card_requirements[name]:
+                count = main_copies if board == 'main' else side_copies if board == 'side' else main_copies + side_copies
+                if count >= min_copies:
+                    met.add(requirement_id)
+        return frozenset(met)
+
+    def classify(self, decklist: Dict) -> Optional[str]:
+        """Archetype assigned by the first matching rule, or None"""
+        candidates = self.candidate_rules(decklist.get('archetype', ''))
+        if not candidates:
+            return None
+        met = self.met_requirements(decklist)
+        for index in candidates:
+            _, archetype, requirement_ids = self.rules[index]
+            if requirement_ids <= met:
+                return archetype
+        return None
+
+    def apply(self, decklists: Dict) -> Dict:
+        """
+        Copy of decklists with rule archetypes assigned. Reclassified decks
+        are copies; every other deck, including one that already has its
+        rule's archetype, is the original object.
+        """
+        classified = {}
+        for key, decklist in decklists.items():
+            archetype = self.classify(decklist)
+            if archetype is None or archetype == decklist.get('archetype'):
+                classified[key] = decklist
+            else:
+                decklist_copy = decklist.copy()
+                decklist_copy['archetype'] = archetype
+                classified[key] = decklist_copy
+        return classified
+
+
+@lru_cache(maxsize=None)
+def load_rules(path: Path = RULES_FILE) -> ArchetypeRules:
+    """Compiled rules from a config file, loaded once per process"""
+    return ArchetypeRules.from_file(path)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Resolve card metadata offline from a Scryfall bulk data dump.
+
+Every distinct card name in decklists.json is matched in one streaming pass
+over the dump, and the type line, image URI and colors are written to a
+compact name -> metadata index for the dashboard.
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Set
+
+import requests
+
+from names import strip_accents
+from storage import CARD_INDEX_FILE, DECKLISTS_FILE, iter_decklists, iter_json_array
+
+# Kept outside data/ so the dump is never served with the dashboard
+CARD_DUMP_FILE = Path(__file__).parent.parent / ".cache" / "oracle-cards.json"
+BULK_DATA_URL = "https://api.scryfall.com/bulk-data/oracle-cards"
+
+# Unresolved names listed in the build output
+MAX_MISSING_SHOWN = 20
+
+# Layouts that share names with real cards but aren't played in decks
+SKIPPED_LAYOUTS = {'art_series', 'token', 'double_faced_token', 'emblem'}
+
+
+def normalize_card_name(name: str) -> str:
+    """Normalize a card name for matching: no accents, lowercase, ' // ' between faces"""
+    faces = [' '.join(face.lower().split()) for face in strip_accents(name).split('//')]
+    return ' // '.join(face for face in faces if face)
+
+
+def collect_card_names(decklists: Iterable[Dict]) -> Set[str]:
+    """Distinct card names across main decks and sideboards"""
+    names = set()
+    for decklist in decklists:
+        for card in decklist.get('main_deck', []) + decklist.get('sideboard', []):
+            names.add(card['name'])
+    return names
+
+
+def card_metadata(card: Dict) -> Dict:
+    """Type line, normal image URI and colors of a card, reading the front face where needed"""
+    faces = card.get('card_faces') or []
+    image = (card.get('image_uris') or {}).get('normal')
+    if image is None and faces:
+        image = (faces[0].get('image_uris') or {}).get('normal')
+
+    colors = card.get('colors')
+    if colors is None:
+        colors = sorted({color for face in faces for color in face.get('colors', [])})
+
+    return {
+        'type_line': card.get('type_line') or ' // '.join(face.get('type_line', '') for face in faces),
+        'image': image,
+        'colors': colors
+    }
+
+
+def resolve_cards(names: Iterable[str], cards: Iterable[Dict]) -> Dict[str, Dict]:
+    """
+    Match card names against a stream of Scryfall card objects in one pass.
+    A full-name match wins over a match on a single face (decklists often list
+    only the front face of split and double-faced cards); otherwise the first
+    matching card in the dump is used.
+    """
+    wanted: Dict[str, Set[str]] = {}
+    for name in names:
+        wanted.setdefault(normalize_card_name(name), set()).add(name)
+
+    # Normalized name -> (priority, metadata); lower priority is better
+    found: Dict[str, tuple] = {}
+    for card in cards:
+        if card.get('layout') in SKIPPED_LAYOUTS or 'name' not in card:
+            continue
+
+        full_name = normalize_card_name(card['name'])
+        candidates = [(full_name, 0)]
+        if ' // ' in full_name:
+            candidates += [(face, 1) for face in full_name.split(' // ')]
+
+        for key, priority in candidates:
+            if key in wanted and (key not in found or priority < found[key][0]):
+                found[key] = (priority, card_metadata(card))
+
+    index = {}
+    for key, originals in wanted.items():
+        if key in found:
+            for name in originals:
+                index[name] = found[key][1]
+    return index
+
+
+def download_card_dump(path: Path = CARD_DUMP_FILE, url: str = BULK_DATA_URL) -> Path:
+    """Download the current Scryfall bulk data file to path"""
+    session = requests.Session()
+    session.headers.update({'User-Agent': 'magic-worlds-metagame/1.0', 'Accept': 'application/json'})
+    response = session.get(url, timeout=30)
+    response.raise_for_status()
+    download_uri = response.json()['download_uri']
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with session.get(download_uri, stream=True, timeout=60) as download:
+        download.raise_for_status()
+        with open(tmp_path, 'wb') as f:
+            for chunk in download.iter_content(chunk_size=1024 * 1024):
+                f.write(chunk)
+    tmp_path.replace(path)
+    return path
+
+
+def build_card_index(dump_path: Path = CARD_DUMP_FILE, decklists_path: Path = DECKLISTS_FILE,
+                     output_path: Path = CARD_INDEX_FILE) -> Optional[Dict[str, Dict]]:
+    """Resolve every card in decklists.json against the dump and write the index"""
+    if not Path(dump_path).exists():
+        print(f"No card dump at {dump_path} - run card_db.py --download first")
+        return None
+
+    names = collect_card_names(decklist for _, decklist in iter_decklists(decklists_path))
+    index = resolve_cards(names, iter_json_array(Path(dump_path)))
+
+    missing = sorted(names - index.keys())
+    if missing:
+        print(f"Could not resolve {len(missing)} cards:")
+        for name in missing[:MAX_MISSING_SHOWN]:
+            print(f"  {name}")
+        if len(missing) > MAX_MISSING_SHOWN:
+            print(f"  ... and {len(missing) - MAX_MISSING_SHOWN} more")
+
+    json.dump(index, open(output_path, 'w'), separators=(',', ':'))
+    print(f"Metadata for {len(index)} of {len(names)} cards saved to {output_path}")
+    return index
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the card metadata index from a Scryfall bulk data dump")
+    parser.add_argument('--dump', type=Path, default=CARD_DUMP_FILE, help="Scryfall bulk data JSON file")
+    parser.add_argument('--download', action='store_true',
+                        help="Download the current oracle cards dump to --dump first")
+    args = parser.parse_args()
+
+    if args.download:
+        print(f"Downloading card data to {args.dump}...")
+        download_card_dump(args.dump)
+    build_card_index(args.dump)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Deck similarity index and archetype clustering.
+
+Each deck's main deck becomes a weighted card set (a card with 4 copies
+contributes 4 elements), summarized by a MinHash signature whose agreement
+rate estimates the weighted Jaccard similarity of two decks. Signatures are
+split into LSH bands, so near-duplicate decks share a bucket and candidate
+pairs come from buckets instead of all pairs. Decks joined by similar
+candidates form clusters, each labelled with its most common archetype, and
+decks whose label disagrees with their cluster are flagged.
+"""
+
+import argparse
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from archetype_rules import load_rules
+from storage import DATA_DIR, DECKLISTS_FILE, iter_decklists
+
+CLUSTERS_FILE = DATA_DIR / "clusters.json"
+
+NUM_PERMUTATIONS = 128
+# 32 bands of 4 rows: pairs above ~0.4 similarity almost always share a bucket
+BANDS = 32
+# Estimated similarity at which two decks are joined into one cluster
+SIMILARITY_THRESHOLD = 0.55
+# Clusters smaller than this don't get to overrule a deck's label
+MIN_CLUSTER_SIZE = 3
+# Mersenne prime for the universal hash family; products stay within int64
+HASH_PRIME = (1 << 31) - 1
+UNLABELED = {'', 'Unknown'}
+
+
+def deck_elements(decklist: Dict) -> List[Tuple[str, int]]:
+    """Main deck as (card, copy number) elements, so copies weight the similarity"""
+    elements = []
+    for card in decklist.get('main_deck', []):
+        name = card['name'].lower()
+        elements.extend((name, copy) for copy in range(card['count']))
+    return elements
+
+
+class DeckIndex:
+    """MinHash/LSH index over decklists"""
+
+    def __init__(self, decklists: Dict, num_permutations: int = NUM_PERMUTATIONS, bands: int = BANDS,
+                 seed: int = 0):
+        if num_permutations % bands:
+            raise ValueError(f"{num_permutations} permutations can't be split into {bands} bands")
+        self.keys = list(decklists)
+        self.decklists = decklists
+        self.bands = bands
+        self.rows = num_permutations // bands
+
+        rng = np.random.default_rng(seed)
+        self.hash_a = rng.integers(1, HASH_PRIME, size=(num_permutations, 1), dtype=np.int64)
+        self.hash_b = rng.integers(0, HASH_PRIME, size=(num_permutations, 1), dtype=np.int64)
+
+        element_ids: Dict[Tuple[str, int], int] = {}
+        self.signatures = np.full((len(self.keys), num_permutations), HASH_PRIME, dtype=np.int64)
+        for row, key in enumerate(self.keys):
+            ids = [element_ids.setdefault(element, len(element_ids)) for element in deck_elements(decklists[key])]
+            if ids:
+                hashes = (self.hash_a * np.array(ids, dtype=np.int64) + self.hash_b) % HASH_PRIME
+                self.signatures[row] = hashes.min(axis=1)
+
+        # Band -> bucket (the band's signature rows) -> deck rows, in deck order
+        self.buckets: List[Dict[bytes, List[int]]] = []
+        for band in range(bands):
+            buckets: Dict[bytes, List[int]] = {}
+            band_signatures = self.signatures[:, band * self.rows:(band + 1) * self.rows]
+            for row in range(len(self.keys)):
+                buckets.setdefault(band_signatures[row].tobytes(), []).append(row)
+            self.buckets.append(buckets)
+
+    def similarity(self, row1: int, row2: int) -> float:
+        """Estimated weighted Jaccard similarity of two decks"""
+        return float(np.mean(self.signatures[row1] == self.signatures[row2]))
+
+    def candidates(self, row: int) -> List[int]:
+        """Decks sharing at least one LSH bucket with a deck"""
+        found = set()
+        for band, buckets in enumerate(self.buckets):
+            band_signature = self.signatures[row, band * self.rows:(band + 1) * self.rows].tobytes()
+            found.update(buckets[band_signature])
+        found.discard(row)
+        return sorted(found)
+
+    def nearest(self, key: str, count: int = 5) -> List[Tuple[str, float]]:
+        """Most similar decks to a deck among its LSH candidates"""
+        row = self.keys.index(key)
+        scored = [(self.keys[other], self.similarity(row, other)) for other in self.candidates(row)]
+        return sorted(scored, key=lambda item: -item[1])[:count]
+
+    def cluster(self, threshold: float = SIMILARITY_THRESHOLD) -> List[int]:
+        """
+        Cluster id of each deck. Within every bucket, members similar enough
+        to the bucket's first deck are joined to it, so the work is linear
+        in the bucket sizes rather than quadratic.
+        """
+        parent = list(range(len(self.keys)))
+
+        def find(row: int) -> int:
+            while parent[row] != row:
+                parent[row] = parent[parent[row]]
+                row = parent[row]
+            return row
+
+        for buckets in self.buckets:
+            for members in buckets.values():
+                first = members[0]
+                for other in members[1:]:
+                    root1, root2 = find(first), find(other)
+                    if root1 != root2 and self.similarity(first, other) >= threshold:
+                        parent[max(root1, root2)] = min(root1, root2)
+
+        return [find(row) for row in range(len(self.keys))]
+
+
+def cluster_archetypes(decklists: Dict, threshold: float = SIMILARITY_THRESHOLD,
+                       min_cluster_size: int = MIN_CLUSTER_SIZE, index: Optional[DeckIndex] = None) -> Dict:
+    """
+    Cluster decks and compare each deck's label with its cluster's.
+    Variant archetypes from archetype_rules.json count as their base
+    archetype, since variants differ by a card or two and share a cluster.
+    """
+    if index is None:
+        index = DeckIndex(decklists)
+    rules = load_rules()
+    labels = [rules.base_archetype(decklists[key].get('archetype', '')) for key in index.keys]
+
+    members: Dict[int, List[int]] = {}
+    for row, cluster_id in enumerate(index.cluster(threshold)):
+        members.setdefault(cluster_id, []).append(row)
+
+    clusters = []
+    flagged = []
+    for rows in sorted(members.values(), key=lambda rows: (-len(rows), rows[0])):
+        label_counts = Counter(labels[row] for row in rows if labels[row] not in UNLABELED)
+        label, label_decks = label_counts.most_common(1)[0] if label_counts else ('Unknown', 0)
+        clusters.append({
+            'archetype': label,
+            'size': len(rows),
+            'label_share': label_decks / len(rows),
+            'labels': dict(label_counts),
+            'decks': [index.keys[row] for row in rows]
+        })
+        if len(rows) < min_cluster_size:
+            continue
+        for row in rows:
+            if labels[row] != label:
+                decklist = decklists[index.keys[row]]
+                flagged.append({
+                    'key': index.keys[row],
+                    'player': decklist.get('player', ''),
+                    'archetype': decklist.get('archetype', ''),
+                    'cluster_archetype': label,
+                    'cluster_size': len(rows)
+                })
+
+    return {
+        'threshold': threshold,
+        'clusters': clusters,
+        'flagged': flagged
+    }
+
+
+def main(decklists_path: Path = DECKLISTS_FILE, output_path: Path = CLUSTERS_FILE,
+         threshold: float = SIMILARITY_THRESHOLD):
+    """Cluster the decks in decklists.json and report label disagreements"""
+    decklists = dict(iter_decklists(decklists_path))
+    print(f"Clustering {len(decklists)} decklists...")
+    result = cluster_archetypes(decklists, threshold)
+
+    print(f"Found {len(result['clusters'])} clusters")
+    for cluster in result['clusters']:
+        if cluster['size'] >= MIN_CLUSTER_SIZE:
+            print(f"  {cluster['archetype']}: {cluster['size']} decks ({cluster['label_share']:.0%} labelled so)")
+    if result['flagged']:
+        print(f"\n{len(result['flagged'])} decks labelled differently from their cluster:")
+        for deck in result['flagged']:
+            print(f"  {deck['player']}: {deck['archetype'] or 'unlabeled'} -> {deck['cluster_archetype']}")
+
+    json.dump(result, open(output_path, 'w'), separators=(',', ':'))
+    print(f"\nClusters saved to {output_path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cluster decklists by card similarity and flag mislabeled decks")
+    parser.add_argument('--decklists', type=Path, default=DECKLISTS_FILE)
+    parser.add_argument('--output', type=Path, default=CLUSTERS_FILE)
+    parser.add_argument('--threshold', type=float, default=SIMILARITY_THRESHOLD,
+                        help="Estimated similarity at which decks are joined into a cluster")
+    args = parser.parse_args()
+    main(args.decklists, args.output, args.threshold)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Columnar, array-backed match store and vectorized metagame aggregation
+"""
+
+from operator import itemgetter
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from matchups import MatchupMatrix
+
+# Result fields read into columns, with the defaults accumulate_results assumes
+RESULT_DEFAULTS = {'round': 0, 'player1': '', 'player2': '', 'p1_wins': 0, 'p2_wins': 0}
+
+
+class MatchColumns:
+    """
+    Constructed-round matches stored as NumPy columns. Each distinct player
+    name is resolved to an archetype once, and the per-match columns are
+    filled in bulk from those ids, so building them costs a few C-level
+    passes over the results rather than Python work per match.
+    """
+
+    def __init__(self, archetypes: List[str], result_index: np.ndarray, arch1: np.ndarray, arch2: np.ndarray,
+                 p1_wins: np.ndarray, p2_wins: np.ndarray, rows: Tuple[List, ...]):
+        # Archetype names by id, in the order the matches first touch them
+        self.archetypes = archetypes
+        # Index of each match in the original results list
+        self.result_index = result_index
+        self.arch1 = arch1
+        self.arch2 = arch2
+        self.p1_wins = p1_wins
+        self.p2_wins = p2_wins
+        # Round, player names and game wins of every result, for the match table
+        self.rows = rows
+
+    @classmethod
+    def from_results(cls, results: List, name_index, skip_rounds=frozenset()) -> 'MatchColumns':
+        """Build columns from match results, resolving archetypes once per distinct player"""
+        total = len(results)
+        rounds, player1, player2, p1_wins, p2_wins = (_column(results, field, default)
+                                                      for field, default in RESULT_DEFAULTS.items())
+
+        # Resolve each distinct player name once; -1 marks a blank name
+        archetype_ids: Dict[str, int] = {}
+        player_archetype = dict.fromkeys(player1)
+        player_archetype.update(dict.fromkeys(player2))
+        for name in player_archetype:
+            stripped = name.strip()
+            player_archetype[name] = (archetype_ids.setdefault(name_index.lookup(stripped), len(archetype_ids))
+                                      if stripped else -1)
+        arch1 = np.fromiter(map(player_archetype.__getitem__, player1), dtype=np.int64, count=total)
+        arch2 = np.fromiter(map(player_archetype.__getitem__, player2), dtype=np.int64, count=total)
+
+        # Constructed matches between two named players
+        keep = (arch1 >= 0) & (arch2 >= 0)
+        if skip_rounds:
+            keep &= ~np.isin(np.array(rounds), list(skip_rounds))
+        result_index = np.flatnonzero(keep)
+        arch1 = arch1[result_index]
+        arch2 = arch2[result_index]
+
+        # Renumber archetypes in the order the kept matches first touch them
+        names = list(archetype_ids)
+        order = _first_seen_order(arch1, arch2)
+        renumber = np.zeros(len(names), dtype=np.int64)
+        renumber[order] = np.arange(len(order))
+        return cls(
+            [names[arch] for arch in order.tolist()], result_index, renumber[arch1], renumber[arch2],
+            np.array(p1_wins, dtype=np.int64)[result_index], np.array(p2_wins, dtype=np.int64)[result_index],
+            (rounds, player1, player2, p1_wins, p2_wins)
+        )
+
+    def __len__(self) -> int:
+        return len(self.result_index)
+
+    def arrays(self) -> Tuple[np.ndarray, ...]:
+        """Archetype and game columns"""
+        return self.arch1, self.arch2, self.p1_wins, self.p2_wins
+
+    def match_table(self) -> List[Dict]:
+        """Match records of the kept matches, in the shape accumulate_results stores"""
+        rounds, player1, player2, p1_wins, p2_wins = self.rows
+        names = self.archetypes
+        return [
+            {
+                'round': rounds[index],
+                'player1': player1[index].strip(),
+                'player2': player2[index].strip(),
+                'archetype1': names[a1],
+                'archetype2': names[a2],
+                'p1_wins': p1_wins[index],
+                'p2_wins': p2_wins[index]
+            }
+            for index, a1, a2 in zip(self.result_index.tolist(), self.arch1.tolist(), self.arch2.tolist())
+        ]
+
+
+def _column(results: List, field: str, default) -> List:
+    """One field of every result; itemgetter runs in C, .get only when some result lacks the field"""
+    try:
+        return list(map(itemgetter(field), results))
+    except KeyError:
+        return [result.get(field, default) for result in results]
+
+
+def _count(ids: np.ndarray, weights: np.ndarray, size: int) -> np.ndarray:
+    return np.bincount(ids, weights=weights, minlength=size).astype(np.int64)
+
+
+def _first_seen_order(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+    """Ids ordered by first appearance in the interleaved sequence first[0], second[0], first[1], ..."""
+    sequence = np.column_stack((first, second)).ravel()
+    ids, positions = np.unique(sequence, return_index=True)
+    return ids[np.argsort(positions, kind='stable')]
+
+
+def _group_matches(keys1: np.ndarray, keys2: np.ndarray) -> Dict[int, List[int]]:
+    """Group match ids by key, in match order, listing a match twice when both keys agree"""
+    count = len(keys1)
+    keys = np.concatenate((keys1, keys2))
+    match_ids = np.concatenate((np.arange(count), np.arange(count)))
+    order = np.lexsort((match_ids, keys))
+    keys = keys[order]
+    match_ids = match_ids[order]
+    boundaries = np.flatnonzero(np.diff(keys)) + 1
+    groups = {}
+    for key_ids, ids in zip(np.split(keys, boundaries), np.split(match_ids, boundaries)):
+        if len(key_ids):
+            groups[int(key_ids[0])] = ids.tolist()
+    return groups
+
+
+def _stats_entry(wins, losses, draws, games_won, games_lost, matches) -> Dict:
+    return {
+        'wins': int(wins),
+        'losses': int(losses),
+        'draws': int(draws),
+        'games_won': int(games_won),
+        'games_lost': int(games_lost),
+        'matches': matches
+    }
+
+
+def aggregate_columnar(columns: MatchColumns) -> Tuple[Dict, MatchupMatrix, List[Dict]]:
+    """
+    Compute per-archetype and directed matchup counters with vectorized
+    reductions. Returns (match_stats, matchups, match_table) with the same
+    contents and order as analyze.accumulate_results.
+    """
+    if not len(columns):
+        return {}, MatchupMatrix(), []
+
+    names = columns.archetypes
+    size = len(names)
+    arch1, arch2, p1_wins, p2_wins = columns.arrays()
+
+    p1_won = p1_wins > p2_wins
+    p2_won = p2_wins > p1_wins
+    drawn = ~(p1_won | p2_won)
+    not_mirror = arch1 != arch2
+
+    # Per-archetype counters (mirror wins/losses don't count, mirror draws do)
+    wins = _count(arch1, p1_won & not_mirror, size) + _count(arch2, p2_won & not_mirror, size)
+    losses = _count(arch2, p1_won & not_mirror, size) + _count(arch1, p2_won & not_mirror, size)
+    draws = _count(arch1, drawn, size) + _count(arch2, drawn, size)
+    games_won = _count(arch1, p1_wins, size) + _count(arch2, p2_wins, size)
+    games_lost = _count(arch1, p2_wins, size) + _count(arch2, p1_wins, size)
+
+    # Directed matchup counters over dense pair ids: forward is p1's view, reverse is p2's
+    pair_size = size * size
+    forward = arch1 * size + arch2
+    reverse = arch2 * size + arch1
+    pair_wins = _count(forward, p1_won, pair_size) + _count(reverse, p2_won, pair_size)
+    pair_losses = _count(reverse, p1_won, pair_size) + _count(forward, p2_won, pair_size)
+    pair_draws = _count(forward, drawn, pair_size) + _count(reverse, drawn, pair_size)
+    pair_games_won = _count(forward, p1_wins, pair_size) + _count(reverse, p2_wins, pair_size)
+    pair_games_lost = _count(forward, p2_wins, pair_size) + _count(reverse, p1_wins, pair_size)
+
+    match_table = columns.match_table()
+
+    # The winner's side is touched first, except that mirrors always start with player 1
+    winner_first = p2_won & not_mirror
+    arch_order = _first_seen_order(np.where(winner_first, arch2, arch1), np.where(winner_first, arch1, arch2))
+    arch_matches = _group_matches(arch1, arch2)
+    match_stats = {}
+    for arch in arch_order.tolist():
+        match_stats[names[arch]] = _stats_entry(
+            wins[arch], losses[arch], draws[arch], games_won[arch], games_lost[arch], arch_matches[arch]
+        )
+
+    pair_order = _first_seen_order(np.where(p2_won, reverse, forward), np.where(p2_won, forward, reverse))
+    pair_matches = _group_matches(forward, reverse)
+    counts = np.stack((pair_wins, pair_losses, pair_draws, pair_games_won, pair_games_lost)).reshape(-1, size, size)
+    matchups = MatchupMatrix.from_counts(
+        names, counts.tolist(), {(pair // size, pair % size): pair_matches[pair] for pair in pair_order.tolist()}
+    )
+
+    return match_stats, matchups, match_table
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Single-pass streaming parser for <deck-list> blocks on magic.gg decklist pages
+"""
+
+import codecs
+import re
+from html.parser import HTMLParser
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+CARD_LINE_PATTERN = re.compile(r'(\d+)\s+(.+)')
+CHUNK_SIZE = 64 * 1024
+
+# Card sections inside a <deck-list> and the decklist field each one fills
+SECTIONS = {
+    'main-deck': 'main_deck',
+    'side-board': 'sideboard',
+}
+
+
+def parse_card_lines(text: str) -> List[Dict]:
+    """Parse card lines of the form '4 Card Name'"""
+    cards = []
+    for line in text.split('\n'):
+        card_match = CARD_LINE_PATTERN.match(line.strip())
+        if card_match:
+            cards.append({'count': int(card_match.group(1)), 'name': card_match.group(2).strip()})
+    return cards
+
+
+class DecklistParser(HTMLParser):
+    """
+    Incremental HTML parser that collects <deck-list> elements as they close.
+    Only text inside <main-deck>/<side-board> is buffered, so memory is bounded
+    by a single decklist rather than the whole document.
+    """
+
+    def __init__(self, url: str = ''):
+        super().__init__(convert_charrefs=True)
+        self.url = url
+        self.completed: List[Dict] = []
+        self.deck: Optional[Dict] = None
+        self.section: Optional[str] = None
+        self.section_text: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'deck-list':
+            attributes = dict(attrs)
+            self.deck = {
+                'player': (attributes.get('deck-title') or '').strip(),
+                'archetype': (attributes.get('subtitle') or '').strip(),
+                'main_deck': [],
+                'sideboard': [],
+            }
+        elif self.deck is not None and tag in SECTIONS:
+            self.section = tag
+            self.section_text = []
+
+    def handle_endtag(self, tag):
+        if self.deck is None:
+            return
+        if tag == self.section:
+            self.deck[SECTIONS[tag]] = parse_card_lines(''.join(self.section_text))
+            self.section = None
+            self.section_text = []
+        elif tag == 'deck-list':
+            deck = self.deck
+            self.deck = None
+            self.section = None
+            if deck['player'] and deck['archetype']:
+                self.completed.append({
+                    'player': deck['player'],
+                    'archetype': deck['archetype'],
+                    'url': self.url,
+                    'main_deck': deck['main_deck'],
+                    'sideboard': deck['sideboard']
+                })
+
+    def handle_data(self, data):
+        if self.section is not None:
+            self.section_text.append(data)
+
+    def drain(self) -> List[Dict]:
+        """Return and clear the decklists completed so far"""
+        completed, self.completed = self.completed, []
+        return completed
+
+
+def iter_decklists_from_html(chunks: Iterable[Union[str, bytes]], url: str = '') -> Iterator[Dict]:
+    """Yield decklists from an HTML document given as a sequence of chunks"""
+    parser = DecklistParser(url)
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        parser.feed(chunk)
+        yield from parser.drain()
+    parser.feed(decoder.decode(b'', final=True))
+    parser.close()
+    yield from parser.drain()
+
+
+def iter_chunks(content: Union[str, bytes], chunk_size: int = CHUNK_SIZE) -> Iterator[Union[str, bytes]]:
+    """Split a document into fixed-size chunks for incremental parsing"""
+    for start in range(0, len(content), chunk_size):
+        yield content[start:start + chunk_size]
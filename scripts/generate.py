@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Generate synthetic tournaments in the decklists.json/results.json schemas
+produced by MagicSpider, for load-testing the pipeline
+"""
+
+import argparse
+import random
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from names import strip_accents
+from storage import write_json_atomic
+
+SYNTHETIC_INDEX_URL = "https://magic.gg/decklists/synthetic-event-standard-decklists"
+
+# Archetype weights modelled on the World Championship 31 field
+DEFAULT_ARCHETYPES = {
+    'Temur Otters': 20,
+    'Izzet Lessons': 23,
+    'Bant Airbending': 16,
+    'Izzet Looting': 14,
+    'Jeskai Control': 10,
+    'Izzet Prowess': 9,
+    'Simic Ouroboroid': 7,
+    'Sultai Reanimator': 6,
+    'Golgari Ouroboroid': 5,
+    'Jeskai Artifacts': 4,
+    'Mono-Red Aggro': 3,
+    'Dimir Bounce': 3,
+    'Dimir Midrange': 2,
+    'Boros Mobilize': 1,
+    'Golgari Dragons': 1,
+    'Simic Otters': 1,
+    'Orzhov Demons': 1,
+}
+
+FIRST_NAMES = [
+    'Adam', 'Alejandro', 'Andrea', 'Anna', 'Björn', 'Camille', 'Chen', 'Corey', 'Daniel', 'Élodie',
+    'Emma', 'François', 'Gabriel', 'Hana', 'Ivan', 'Javier', 'José', 'Julia', 'Kenji', 'Lucía',
+    'Luis', 'Marco', 'María', 'Mikko', 'Nam', 'Noah', 'Olivia', 'Pedro', 'Rafael', 'Reid',
+    'Sam', 'Samuel', 'Simon', 'Søren', 'Thiago', 'Toru', 'Valentin', 'Yuki', 'Zoë', 'Åsa',
+]
+LAST_NAMES = [
+    'Airaksinen', 'Almeida', 'Becker', 'Brandão', 'Burkhart', 'Castillo', 'Dang', 'Duarte', 'Flores', 'García',
+    'Gómez', 'Hori', 'Inoue', 'Jensen', 'Kowalski', 'Lévesque', 'Lindqvist', 'Martínez', 'Müller', 'Nielsen',
+    'Novák', 'Okafor', 'Pardee', 'Peña', 'Rossi', 'Sanfeliu', 'Schäfer', 'Silva', 'Takahashi', 'Tran',
+    'Vázquez', 'Wagner', 'Watanabe', 'Weiß', 'Yamamoto', 'Zieliński',
+]
+MIDDLE_NAMES = ['Alejandro', 'Anne', 'James', 'Luis', 'Marie', 'Paulo', 'Sofía', 'Thomas']
+
+# Shared staples and basic lands for synthetic card pools
+STAPLES = ['Fatal Push', 'Spell Pierce', 'Duress', 'Negate', 'Pick Your Poison', 'Disdainful Stroke']
+BASIC_LANDS = {'W': 'Plains', 'U': 'Island', 'B': 'Swamp', 'R': 'Mountain', 'G': 'Forest'}
+GUILD_COLORS = {
+    'Mono-Red': 'R', 'Boros': 'RW', 'Dimir': 'UB', 'Golgari': 'BG', 'Izzet': 'UR', 'Orzhov': 'WB',
+    'Simic': 'GU', 'Bant': 'GWU', 'Jeskai': 'URW', 'Sultai': 'BGU', 'Temur': 'GUR',
+}
+
+
+def generate_players(count: int, rng: random.Random, middle_name_rate: float) -> List[Tuple[str, str, str]]:
+    """Generate players as (first, middle, last) with distinct first + last names; middle may be empty"""
+    players = []
+    seen = set()
+    while len(players) < count:
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+        # Once simple names collide, fall back to longer double-barrelled surnames
+        while strip_accents(f"{first} {last}").lower() in seen:
+            last = f"{last}-{rng.choice(LAST_NAMES)}"
+        seen.add(strip_accents(f"{first} {last}").lower())
+        middle = rng.choice(MIDDLE_NAMES) if rng.random() < middle_name_rate else ''
+        players.append((first, middle, last))
+    return players
+
+
+def results_name(first: str, middle: str, last: str, rng: random.Random, name_noise: float) -> str:
+    """
+    Player name as it appears in a results table. Normally 'Last, First';
+    with probability name_noise it drops accents, adds the middle name or
+    uses 'First Last' order.
+    """
+    if rng.random() >= name_noise:
+        return f"{last}, {first}"
+    variant = rng.randrange(3)
+    if variant == 0:
+        return strip_accents(f"{last}, {first}")
+    if variant == 1 and middle:
+        return f"{last}, {first} {middle}"
+    return f"{first} {last}"
+
+
+def build_card_pools(archetypes: List[str]) -> Dict[str, List[str]]:
+    """Core card names per archetype, plus basic lands for its colors"""
+    pools = {}
+    for archetype in archetypes:
+        guild = next((guild for guild in GUILD_COLORS if archetype.startswith(guild)), None)
+        colors = GUILD_COLORS.get(guild, 'U')
+        core = [f"{archetype} Card {i}" for i in range(1, 13)]
+        pools[archetype] = core + [BASIC_LANDS[color] for color in colors]
+    return pools
+
+
+def build_decklist(archetype: str, pools: Dict[str, List[str]], rng: random.Random) -> Tuple[List[Dict], List[Dict]]:
+    """Build a 60-card main deck and 15-card sideboard"""
+    pool = pools[archetype]
+    main_counts: Dict[str, int] = {}
+    for name in pool[:12]:
+        main_counts[name] = rng.choice((2, 3, 4, 4))
+    lands = pool[12:]
+    while sum(main_counts.values()) < 60:
+        name = rng.choice(lands + STAPLES)
+        main_counts[name] = main_counts.get(name, 0) + 1
+    # Some Izzet Lessons decks run Monument to Endurance (detected as a variant)
+    sideboard_counts: Dict[str, int] = {}
+    if archetype == 'Izzet Lessons' and rng.random() < 0.5:
+        sideboard_counts['Monument to Endurance'] = 2
+    while sum(sideboard_counts.values()) < 15:
+        name = rng.choice(STAPLES)
+        sideboard_counts[name] = sideboard_counts.get(name, 0) + 1
+    main_deck = [{'count': count, 'name': name} for name, count in main_counts.items()]
+    sideboard = [{'count': count, 'name': name} for name, count in sideboard_counts.items()]
+    return main_deck, sideboard
+
+
+def play_match(rng: random.Random, draw_rate: float) -> Tuple[int, int]:
+    """Game wins for each player in a best-of-three match"""
+    if rng.random() < draw_rate:
+        return rng.choice(((1, 1), (0, 0)))
+    loser_games = rng.choice((0, 1))
+    return (2, loser_games) if rng.random() < 0.5 else (loser_games, 2)
+
+
+def swiss_pairings(points: List[int], rng: random.Random) -> List[Tuple[int, int]]:
+    """Pair players by record, shuffling within equal records. The odd player out gets a bye."""
+    order = list(range(len(points)))
+    rng.shuffle(order)
+    order.sort(key=lambda player: -points[player])
+    return [(order[i], order[i + 1]) for i in range(0, len(order) - 1, 2)]
+
+
+def generate_event(players: int = 128, rounds: int = 14, archetypes: Optional[Dict[str, float]] = None,
+                   draw_rate: float = 0.03, name_noise: float = 0.2, middle_name_rate: float = 0.1,
+                   seed: int = 0) -> Tuple[Dict, List]:
+    """
+    Generate (decklists, results) for a Swiss event. The same arguments and
+    seed always produce the same event.
+    """
+    rng = random.Random(seed)
+    archetypes = archetypes or DEFAULT_ARCHETYPES
+    names = list(archetypes)
+    weights = [archetypes[name] for name in names]
+    pools = build_card_pools(names)
+
+    roster = generate_players(players, rng, middle_name_rate)
+
+    decklists = {}
+    for first, middle, last in roster:
+        player = ' '.join(part for part in (first, middle, last) if part)
+        archetype = rng.choices(names, weights)[0]
+        main_deck, sideboard = build_decklist(archetype, pools, rng)
+        decklists[f"{SYNTHETIC_INDEX_URL}::{player}"] = {
+            'player': player,
+            'archetype': archetype,
+            'url': SYNTHETIC_INDEX_URL,
+            'main_deck': main_deck,
+            'sideboard': sideboard
+        }
+
+    results = []
+    points = [0] * len(roster)
+    for round_num in range(1, rounds + 1):
+        for p1, p2 in swiss_pairings(points, rng):
+            p1_wins, p2_wins = play_match(rng, draw_rate)
+            if p1_wins > p2_wins:
+                points[p1] += 3
+            elif p2_wins > p1_wins:
+                points[p2] += 3
+            else:
+                points[p1] += 1
+                points[p2] += 1
+            results.append({
+                'round': round_num,
+                'player1': results_name(*roster[p1], rng, name_noise),
+                'player2': results_name(*roster[p2], rng, name_noise),
+                'p1_wins': p1_wins,
+                'p2_wins': p2_wins,
+                'p1_games': p1_wins,
+                'p2_games': p2_wins
+            })
+
+    return decklists, results
+
+
+def parse_archetypes(spec: str) -> Dict[str, float]:
+    """Parse 'Name=weight,Name=weight' into an archetype distribution"""
+    archetypes = {}
+    for item in spec.split(','):
+        name, _, weight = item.rpartition('=')
+        archetypes[name.strip()] = float(weight)
+    return archetypes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic tournament for load testing")
+    parser.add_argument('output_dir', type=Path, help="Directory for decklists.json and results.json")
+    parser.add_argument('--players', type=int, default=128)
+    parser.add_argument('--rounds', type=int, default=14)
+    parser.add_argument('--archetypes', type=parse_archetypes, default=None,
+                        help="Archetype distribution as 'Name=weight,Name=weight'")
+    parser.add_argument('--draw-rate', type=float, default=0.03)
+    parser.add_argument('--name-noise', type=float, default=0.2,
+                        help="Share of result names with accent, middle name or order variations")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    decklists, results = generate_event(args.players, args.rounds, args.archetypes, args.draw_rate,
+                                        args.name_noise, seed=args.seed)
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    write_json_atomic(args.output_dir / "decklists.json", decklists)
+    write_json_atomic(args.output_dir / "results.json", results)
+    print(f"Generated {len(decklists)} decklists and {len(results)} match results in {args.output_dir}")
+
+
+if __name__ == "__main__":
+    main()
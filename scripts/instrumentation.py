@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Process-wide timing and counters for the pipeline stages.
+
+Stages record wall time and call counts, counters accumulate totals such as
+requests made, bytes downloaded, cache hits and rows parsed. Everything is
+thread-safe, since the spider fetches on a worker pool, and cheap enough to
+stay enabled. report() returns a JSON-serializable summary of the run.
+"""
+
+import cProfile
+import functools
+import io
+import json
+import pstats
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator
+
+# Kept outside data/ so reports are never served with the dashboard
+CACHE_DIR = Path(__file__).parent.parent / ".cache"
+REPORT_FILE = CACHE_DIR / "run_report.json"
+PROFILE_FILE = CACHE_DIR / "analysis.prof"
+REPORT_VERSION = 1
+# Functions listed when a profile is printed
+PROFILE_LIMIT = 25
+
+_lock = threading.Lock()
+_stages: Dict[str, Dict] = {}
+_counters: Dict[str, int] = {}
+_started = time.time()
+
+
+def reset():
+    """Forget everything recorded so far"""
+    global _started
+    with _lock:
+        _stages.clear()
+        _counters.clear()
+        _started = time.time()
+
+
+def count(name: str, amount: int = 1):
+    """Add amount to a counter"""
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def record(stage: str, seconds: float):
+    """Add one call taking seconds to a stage"""
+    with _lock:
+        entry = _stages.get(stage)
+        if entry is None:
+            entry = _stages[stage] = {'calls': 0, 'seconds': 0.0, 'max_seconds': 0.0}
+        entry['calls'] += 1
+        entry['seconds'] += seconds
+        entry['max_seconds'] = max(entry['max_seconds'], seconds)
+
+
+class timed:
+    """Context manager timing the enclosed block as one call of a stage"""
+
+    __slots__ = ('stage', 'start')
+
+    def __init__(self, stage: str):
+        self.stage = stage
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc):
+        record(self.stage, time.perf_counter() - self.start)
+
+
+def timed_function(stage: str):
+    """Decorator timing every call of a function as a stage"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record(stage, time.perf_counter() - start)
+        return wrapper
+    return decorator
+
+
+def report() -> Dict:
+    """
+    Summary of the run: stages with call counts and total/max wall time,
+    and counters. Stage times are summed over calls, so stages running on
+    several threads can add up to more than the run's wall time.
+    """
+    with _lock:
+        stages = {name: dict(entry) for name, entry in sorted(_stages.items())}
+        counters = dict(sorted(_counters.items()))
+    return {
+        'version': REPORT_VERSION,
+        'started_at': _started,
+        'wall_seconds': time.time() - _started,
+        'stages': stages,
+        'counters': counters
+    }
+
+
+def write_report(path: Path) -> Dict:
+    """Write the run report to path"""
+    run_report = report()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    json.dump(run_report, open(path, 'w'), indent=2)
+    return run_report
+
+
+@contextmanager
+def profiled(path: Path, limit: int = PROFILE_LIMIT) -> Iterator[None]:
+    """Profile the enclosed block, saving pstats data to path and printing the top functions"""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(str(path))
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats('cumulative').print_stats(limit)
+        print(output.getvalue())
+        print(f"Profile saved to {path} (python -m pstats {path})")
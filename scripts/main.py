@@ -3,6 +3,8 @@
 Main script to run spider, analysis, and generate dashboard
 """
 
+import argparse
+import contextlib
 import sys
 from pathlib import Path
 
@@ -10,11 +12,14 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from analyze import main as analyze_main
+from card_db import CARD_DUMP_FILE, build_card_index
+from instrumentation import PROFILE_FILE, REPORT_FILE, profiled, timed, write_report
+from publish import main as publish_main
 from spider import MagicSpider
 
 
-def main():
-    """Run the full pipeline"""
+def main(incremental: bool = False, profile: bool = False, report_file: Path = REPORT_FILE):
+    """Run the full pipeline, ending with a JSON report of stage timings and counters"""
     print("=" * 60)
     print("Magic World Championship 31 Metagame Analyzer")
     print("=" * 60)
@@ -24,8 +29,9 @@ def main():
     print("Step 1: Spidering magic.gg...")
     print("-" * 60)
     try:
-        spider = MagicSpider()
-        spider.run()
+        with timed('step.spider'):
+            spider = MagicSpider()
+            spider.run()
         print()
     except Exception as e:
         print(f"Error during spidering: {e}")
@@ -36,12 +42,39 @@ def main():
     print("Step 2: Analyzing metagame...")
     print("-" * 60)
     try:
-        analyze_main()
+        with timed('step.analyze'), profiled(PROFILE_FILE) if profile else contextlib.nullcontext():
+            analyze_main(incremental=incremental)
         print()
     except Exception as e:
         print(f"Error during analysis: {e}")
         sys.exit(1)
     
+    # Step 3: Resolve card metadata from the local card dump
+    print("Step 3: Resolving card metadata...")
+    print("-" * 60)
+    if CARD_DUMP_FILE.exists():
+        with timed('step.card_index'):
+            build_card_index()
+    else:
+        print(f"Skipped - no card dump at {CARD_DUMP_FILE} (run scripts/card_db.py --download)")
+    print()
+    
+    # Step 4: Publish sharded bundles for the dashboard
+    print("Step 4: Publishing data bundles...")
+    print("-" * 60)
+    try:
+        with timed('step.publish'):
+            publish_main()
+        print()
+    except Exception as e:
+        print(f"Error during publishing: {e}")
+        sys.exit(1)
+    
+    run_report = write_report(report_file)
+    print(f"Run report saved to {report_file} ({run_report['wall_seconds']:.1f}s, "
+          f"{run_report['counters'].get('http.requests', 0)} requests)")
+    print()
+    
     print("=" * 60)
     print("Complete! Data has been collected and analyzed.")
     print("=" * 60)
@@ -53,5 +86,13 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Spider magic.gg and analyze the metagame")
+    parser.add_argument('--incremental', action='store_true',
+                        help="Only analyze results added since the last incremental run")
+    parser.add_argument('--profile', action='store_true',
+                        help=f"Profile the analysis step with cProfile and save the stats to {PROFILE_FILE}")
+    parser.add_argument('--report', type=Path, default=REPORT_FILE,
+                        help=f"Where to write the JSON run report (default: {REPORT_FILE})")
+    args = parser.parse_args()
+    main(incremental=args.incremental, profile=args.profile, report_file=args.report)
 
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Dense matchup counters indexed by interned archetype ids.
+
+Directed matchup counters live in one nested list per counter:
+counts[f][i][j] is archetype i's counter against archetype j. Every match
+is counted from both sides, so a decisive mirror adds a win and a loss on
+the diagonal. Match ids are kept per directed pair in the order pairs were
+first touched, which fixes the order of the canonical matchup summary.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+COUNTER_FIELDS = ('wins', 'losses', 'draws', 'games_won', 'games_lost')
+WINS, LOSSES, DRAWS, GAMES_WON, GAMES_LOST = range(len(COUNTER_FIELDS))
+
+
+class MatchupMatrix:
+    """Directed matchup counters over interned archetypes"""
+
+    def __init__(self, archetypes: Iterable[str] = ()):
+        self.archetypes: List[str] = []
+        self.ids: Dict[str, int] = {}
+        # Counter -> N x N rows, grown by a row and a column per new archetype
+        self.counts: List[List[List[int]]] = [[] for _ in COUNTER_FIELDS]
+        # Directed pair -> match ids, in the order pairs were first touched
+        self.matches: Dict[Tuple[int, int], List[int]] = {}
+        for archetype in archetypes:
+            self.intern(archetype)
+
+    def __len__(self) -> int:
+        return len(self.archetypes)
+
+    def intern(self, archetype: str) -> int:
+        """Id of an archetype, assigning the next one on first sight"""
+        archetype_id = self.ids.get(archetype)
+        if archetype_id is None:
+            archetype_id = self.ids[archetype] = len(self.archetypes)
+            self.archetypes.append(archetype)
+            for rows in self.counts:
+                for row in rows:
+                    row.append(0)
+                rows.append([0] * (archetype_id + 1))
+        return archetype_id
+
+    def record(self, arch1: int, arch2: int, p1_wins: int, p2_wins: int, match_id: int):
+        """Count one match between archetype ids arch1 (player 1) and arch2 (player 2) from both sides"""
+        counts = self.counts
+        if p1_wins > p2_wins:
+            counts[WINS][arch1][arch2] += 1
+            counts[LOSSES][arch2][arch1] += 1
+            first, second = (arch1, arch2), (arch2, arch1)
+        elif p2_wins > p1_wins:
+            counts[WINS][arch2][arch1] += 1
+            counts[LOSSES][arch1][arch2] += 1
+            first, second = (arch2, arch1), (arch1, arch2)
+        else:
+            counts[DRAWS][arch1][arch2] += 1
+            counts[DRAWS][arch2][arch1] += 1
+            first, second = (arch1, arch2), (arch2, arch1)
+        counts[GAMES_WON][arch1][arch2] += p1_wins
+        counts[GAMES_LOST][arch1][arch2] += p2_wins
+        counts[GAMES_WON][arch2][arch1] += p2_wins
+        counts[GAMES_LOST][arch2][arch1] += p1_wins
+
+        # The winner's side is touched first; a mirror lists the match twice
+        self.matches.setdefault(first, [])
+        self.matches.setdefault(second, [])
+        self.list_match(arch1, arch2, match_id)
+
+    def list_match(self, arch1: int, arch2: int, match_id: int):
+        """List a match id under both directed pairs without counting it, e.g. to restore saved counters"""
+        self.matches.setdefault((arch1, arch2), []).append(match_id)
+        self.matches.setdefault((arch2, arch1), []).append(match_id)
+
+    def add_pair(self, archetype: str, opponent: str, counters: Iterable[int], match_ids: List[int]):
+        """Add pre-aggregated counters (in COUNTER_FIELDS order) for one directed pair"""
+        arch1, arch2 = self.intern(archetype), self.intern(opponent)
+        for rows, value in zip(self.counts, counters):
+            rows[arch1][arch2] += value
+        self.matches.setdefault((arch1, arch2), []).extend(match_ids)
+
+    @classmethod
+    def from_counts(cls, archetypes: List[str], counts: List[List[List[int]]],
+                    matches: Dict[Tuple[int, int], List[int]]) -> 'MatchupMatrix':
+        """Matrix over already-interned archetypes from per-counter N x N rows"""
+        matchups = cls(archetypes)
+        matchups.counts = [[list(row) for row in rows] for rows in counts]
+        matchups.matches = matches
+        return matchups
+
+    def merge(self, other: 'MatchupMatrix'):
+        """Add another matrix's counters, matching archetypes by name"""
+        mapping = [self.intern(archetype) for archetype in other.archetypes]
+        for rows, other_rows in zip(self.counts, other.counts):
+            for arch1, other_row in zip(mapping, other_rows):
+                row = rows[arch1]
+                for arch2, value in zip(mapping, other_row):
+                    row[arch2] += value
+        for (arch1, arch2), match_ids in other.matches.items():
+            self.matches.setdefault((mapping[arch1], mapping[arch2]), []).extend(match_ids)
+
+    def summary(self, legacy_format: bool = False, previous: Optional[Dict[Tuple[str, str], Dict]] = None) -> Dict:
+        """
+        Canonical matchup summaries keyed "A vs B" (names sorted), with both
+        archetypes' wins, games and win rates. Raises ValueError if two
+        matchups would share a key. Each summary sums the two
+        directed pairs, so a match adds two to total_matches. By default each
+        summary also lists its match ids.
+
+        previous maps sorted archetype name pairs to an earlier summary without
+        its match ids, for matchups whose counters haven't changed since;
+        those are reused rather than summed and derived again.
+        """
+        wins, losses, _, games_won, games_lost = self.counts
+        names = self.archetypes
+        previous = previous or {}
+        # Canonical pair (ids ordered by name) -> summary
+        summaries: Dict[Tuple[int, int], Dict] = {}
+        reused = set()
+        for (arch1, arch2), match_ids in self.matches.items():
+            total = wins[arch1][arch2] + losses[arch1][arch2]
+            if not total:
+                continue
+            canonical = (arch1, arch2) if names[arch1] <= names[arch2] else (arch2, arch1)
+            if canonical in reused:
+                continue
+
+            summary = summaries.get(canonical)
+            cached = previous.get((names[canonical[0]], names[canonical[1]])) if summary is None else None
+            if cached is not None:
+                summary = summaries[canonical] = {}
+                for field, value in cached.items():
+                    summary[field] = value
+                    # Match ids go where a freshly built summary has them
+                    if field == 'total_matches' and not legacy_format:
+                        summary['matches'] = list(dict.fromkeys(match_ids))
+                reused.add(canonical)
+                continue
+            if summary is None:
+                summary = summaries[canonical] = {
+                    'archetype1': names[arch1],
+                    'archetype2': names[arch2],
+                    'arch1_wins': 0,
+                    'arch2_wins': 0,
+                    'arch1_games': 0,
+                    'arch2_games': 0,
+                    'total_matches': 0
+                }
+                if not legacy_format:
+                    # Both directions list the same matches
+                    summary['matches'] = list(dict.fromkeys(match_ids))
+
+            if names[arch1] == summary['archetype1']:
+                summary['arch1_wins'] += wins[arch1][arch2]
+                summary['arch1_games'] += games_won[arch1][arch2]
+                summary['arch2_wins'] += losses[arch1][arch2]
+                summary['arch2_games'] += games_lost[arch1][arch2]
+            else:
+                summary['arch2_wins'] += wins[arch1][arch2]
+                summary['arch2_games'] += games_won[arch1][arch2]
+                summary['arch1_wins'] += losses[arch1][arch2]
+                summary['arch1_games'] += games_lost[arch1][arch2]
+
+            summary['total_matches'] += total
+
+        for canonical, summary in summaries.items():
+            if canonical in reused:
+                continue
+            total = summary['total_matches']
+            summary['arch1_win_rate'] = summary['arch1_wins'] / total
+            summary['arch2_win_rate'] = summary['arch2_wins'] / total
+            total_games = summary['arch1_games'] + summary['arch2_games']
+            if total_games > 0:
+                summary['arch1_game_win_rate'] = summary['arch1_games'] / total_games
+                summary['arch2_game_win_rate'] = summary['arch2_games'] / total_games
+            else:
+                summary['arch1_game_win_rate'] = 0
+                summary['arch2_game_win_rate'] = 0
+
+        keyed = {}
+        for (arch1, arch2), summary in summaries.items():
+            key = f"{names[arch1]} vs {names[arch2]}"
+            if key in keyed:
+                # Only possible when an archetype name itself contains " vs "
+                other = keyed[key]
+                raise ValueError(f"Matchups {other['archetype1']!r} / {other['archetype2']!r} and "
+                                 f"{summary['archetype1']!r} / {summary['archetype2']!r} both have the key {key!r}")
+            keyed[key] = summary
+        return keyed
+
+    def to_json(self) -> Dict:
+        """
+        Archetypes sorted by name and one N x N matrix per counter, row
+        archetype against column archetype, for the dashboard's matchup grid
+        """
+        order = sorted(range(len(self)), key=lambda archetype_id: self.archetypes[archetype_id])
+        matrix = {'archetypes': [self.archetypes[archetype_id] for archetype_id in order]}
+        for field, rows in zip(COUNTER_FIELDS, self.counts):
+            matrix[field] = [[rows[arch1][arch2] for arch2 in order] for arch1 in order]
+        return matrix
+
+    def to_state(self, include_matches: bool = True) -> Dict:
+        """JSON-serializable counters, restored by from_state"""
+        return {
+            'archetypes': self.archetypes,
+            'counts': self.counts,
+            'pairs': [[arch1, arch2, match_ids if include_matches else []]
+                      for (arch1, arch2), match_ids in self.matches.items()]
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict) -> 'MatchupMatrix':
+        matches = {(arch1, arch2): match_ids for arch1, arch2, match_ids in state['pairs']}
+        return cls.from_counts(state['archetypes'], state['counts'], matches)
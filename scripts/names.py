@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Player name canonicalization shared by the spider and the analyzer.
+
+Every function is memoized, so each distinct name is normalized once per
+process however many comparisons it takes part in. WinnerResolver matches
+the winner named in a results row to one of the row's players.
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional, Tuple
+
+# Distinct names kept per cache; an event has a few thousand at most
+CACHE_SIZE = 1 << 16
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def strip_accents(name: str) -> str:
+    """Remove accents/diacritics (é -> e, ñ -> n)"""
+    if name.isascii():
+        return name
+    nfd = unicodedata.normalize('NFD', name)
+    return ''.join(c for c in nfd if unicodedata.category(c) != 'Mn')
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def normalize_player_name(name: str) -> str:
+    """
+    Canonical key for a player name: no accents, 'Last, First Middle' turned
+    into 'First Middle Last', lowercase with single spaces. Keys players.json
+    (mirrored by src/utils/playerName.ts).
+    """
+    name = strip_accents(name.strip())
+    if not name:
+        return ''
+
+    # If it's in "Last, First" format, convert to "First Last"
+    if ',' in name:
+        parts = [p.strip() for p in name.split(',')]
+        name = f"{' '.join(parts[1:])} {parts[0]}"
+
+    return ' '.join(name.lower().split())
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def name_tokens(name: str) -> Tuple[str, ...]:
+    """Words of the canonical name with punctuation (hyphens, periods, apostrophes) split out"""
+    return tuple(PUNCTUATION_PATTERN.sub(' ', normalize_player_name(name)).split())
+
+
+class WinnerResolver:
+    """
+    Resolves the winner named in a results row to one of the row's players.
+    Each player name is tokenized once per resolver, along with every prefix
+    of its tokens, so scoring a row against its two players costs a few set
+    lookups per winner token rather than comparing every pair of tokens.
+    """
+
+    # Score of a winner token equal to, or a prefix relation of ("Sam"/"Samuel"), a player token
+    EXACT_SCORE = 2
+    PREFIX_SCORE = 1
+
+    def __init__(self, names: Iterable[str] = ()):
+        self.entries: Dict[str, Tuple[str, FrozenSet[str], FrozenSet[str]]] = {}
+        for name in names:
+            self._entry(name)
+
+    def _entry(self, name: str) -> Tuple[str, FrozenSet[str], FrozenSet[str]]:
+        """(canonical name, tokens, token prefixes) of a player name"""
+        entry = self.entries.get(name)
+        if entry is None:
+            tokens = frozenset(name_tokens(name))
+            prefixes = frozenset(token[:end] for token in tokens for end in range(1, len(token)))
+            entry = self.entries[name] = (normalize_player_name(name), tokens, prefixes)
+        return entry
+
+    def names_match(self, winner: str, player: str) -> bool:
+        """Same person: equal canonical names, one containing the other, or matching first/last names"""
+        winner_norm = normalize_player_name(winner)
+        player_norm = self._entry(player)[0]
+        if not winner_norm or not player_norm:
+            return False
+        # One name contained in the other handles middle names
+        if winner_norm in player_norm or player_norm in winner_norm:
+            return True
+        winner_parts = winner_norm.split()
+        player_parts = player_norm.split()
+        return (winner_parts[-1] == player_parts[-1]
+                and (winner_parts[0] in player_parts[0] or player_parts[0] in winner_parts[0]))
+
+    def score(self, winner: str, player: str) -> int:
+        """How well the winner's name tokens match a player's, token by token"""
+        _, tokens, prefixes = self._entry(player)
+        total = 0
+        for token in name_tokens(winner):
+            if token in tokens:
+                total += self.EXACT_SCORE
+            elif token in prefixes or any(token[:end] in tokens for end in range(1, len(token))):
+                total += self.PREFIX_SCORE
+        return total
+
+    def resolve(self, winner: str, player1: str, player2: str) -> Tuple[Optional[str], float]:
+        """
+        The player the winner string names and a confidence in [0, 1]:
+        1 for a direct name match, the score margin for a fuzzy match, and
+        (None, 0) when the names can't tell the players apart.
+        """
+        p1_match = self.names_match(winner, player1)
+        p2_match = self.names_match(winner, player2)
+        if p1_match != p2_match:
+            return (player1 if p1_match else player2), 1.0
+
+        p1_score = self.score(winner, player1)
+        p2_score = self.score(winner, player2)
+        if p1_score == p2_score and p1_score:
+            # Tie - prefer the player with more of their name matched
+            # (e.g. "Mario Alejandro Flores Silva" vs "Mario Flores")
+            p1_score /= max(len(self._entry(player1)[1]), 1)
+            p2_score /= max(len(self._entry(player2)[1]), 1)
+        if p1_score == p2_score:
+            return None, 0.0
+
+        best, other = max(p1_score, p2_score), min(p1_score, p2_score)
+        return (player1 if p1_score > p2_score else player2), (best - other) / best
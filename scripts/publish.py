@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Publish analysis outputs as sharded, content-hashed bundles for the dashboard.
+
+Splits analysis.json, cards.json, players.json and decklists.json into
+per-archetype, per-player and per-card shards under data/bundles/, next to
+card_index.json when it has been built. Each shard
+is named after a hash of its content, and larger shards are precompressed
+with gzip (and brotli when the brotli package is installed).
+data/manifest.json maps the top-level bundles to shard paths and each section
+of per-card, per-archetype or per-player bundles to a section manifest, itself
+a content-hashed shard, so the root manifest stays small. It is the only file
+that changes on every publish.
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Optional
+
+from names import normalize_player_name
+from storage import (ANALYSIS_FILE, CARD_INDEX_FILE, CARDS_FILE, DATA_DIR, DECKLISTS_FILE, PLAYERS_FILE,
+                     iter_decklists, write_json_atomic)
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BUNDLES_DIR = DATA_DIR / "bundles"
+MANIFEST_FILE = DATA_DIR / "manifest.json"
+MANIFEST_VERSION = 2
+HASH_LENGTH = 12
+# Shards smaller than this are not worth precompressing
+MIN_COMPRESS_SIZE = 1024
+
+
+def slugify(name: str) -> str:
+    """Filename-safe form of a bundle name"""
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-') or 'bundle'
+
+
+def bundle_section(name: str) -> Optional[str]:
+    """Section of a per-card, per-archetype or per-player bundle ('cards/card' for 'cards/card/<name>')"""
+    parts = name.split('/', 2)
+    return '/'.join(parts[:2]) if len(parts) == 3 else None
+
+
+def build_bundles(analysis: Dict, cards: Dict, players: Dict, decklists: Dict,
+                  card_index: Optional[Dict] = None) -> Dict[str, object]:
+    """
+    Split the outputs into bundles keyed by name. Shards keep the shape of
+    the file they come from, filtered to one card, archetype or player, so the
+    dashboard can read the full file in their place.
+    """
+    bundles = {'analysis': analysis}
+
+    # Card usage: totals for the card table, one shard per card and per archetype
+    card_header = {'total_decks': cards['total_decks'], 'archetype_decks': cards['archetype_decks']}
+    bundles['cards'] = dict(card_header, cards={
+        name: {field: value for field, value in usage.items() if field != 'archetypes'}
+        for name, usage in cards['cards'].items()
+    })
+    archetype_cards = {archetype: {} for archetype in cards['archetype_decks']}
+    for name, usage in cards['cards'].items():
+        bundles[f"cards/card/{name}"] = dict(card_header, cards={name: usage})
+        for archetype, archetype_usage in usage['archetypes'].items():
+            archetype_cards[archetype][name] = dict(usage, archetypes={archetype: archetype_usage})
+    for archetype, archetype_usage in archetype_cards.items():
+        bundles[f"cards/archetype/{archetype}"] = dict(card_header, cards=archetype_usage)
+
+    # Player records: the table without match ids, one shard per archetype and per player
+    matches = players['matches']
+    records = {key: dict(info, matches=[]) for key, info in players['players'].items()}
+    bundles['players'] = {'players': records, 'matches': []}
+    by_archetype = {}
+    for key, info in records.items():
+        by_archetype.setdefault(info['archetype'], {})[key] = info
+    for archetype, archetype_players in by_archetype.items():
+        bundles[f"players/archetype/{archetype}"] = {'players': archetype_players, 'matches': []}
+    for key, info in players['players'].items():
+        # Renumber match ids into the shard's own match table
+        bundles[f"players/player/{key}"] = {
+            'players': {key: dict(info, matches=list(range(len(info['matches']))))},
+            'matches': [matches[match_id] for match_id in info['matches']]
+        }
+
+    # Decklists, one shard per player
+    for decklist_key, decklist in decklists.items():
+        key = normalize_player_name(decklist.get('player', ''))
+        if key:
+            bundles.setdefault(f"decklists/player/{key}", {decklist_key: decklist})
+
+    # Card metadata is small and shared by every page showing cards
+    if card_index is not None:
+        bundles['card-index'] = card_index
+
+    return bundles
+
+
+def write_shard(name: str, data, bundles_dir: Path = BUNDLES_DIR) -> str:
+    """Write one content-hashed shard with precompressed copies, returning its filename"""
+    content = json.dumps(data, separators=(',', ':')).encode('utf-8')
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    filename = f"{slugify(name)}.{digest}.json"
+    path = bundles_dir / filename
+
+    # Identical content is already published under the same name
+    if not path.exists():
+        path.write_bytes(content)
+        if len(content) < MIN_COMPRESS_SIZE:
+            return filename
+        path.with_name(filename + '.gz').write_bytes(gzip.compress(content, compresslevel=9, mtime=0))
+        if brotli is not None:
+            path.with_name(filename + '.br').write_bytes(brotli.compress(content))
+    return filename
+
+
+def prune_shards(keep: set, bundles_dir: Path = BUNDLES_DIR) -> int:
+    """Remove shards (and their compressed copies) no longer referenced by the manifest"""
+    removed = 0
+    for path in bundles_dir.iterdir():
+        base = path.name
+        for suffix in ('.gz', '.br'):
+            if base.endswith(suffix):
+                base = base[:-len(suffix)]
+        if base not in keep:
+            os.remove(path)
+            removed += 1
+    return removed
+
+
+def publish(bundles_dir: Path = BUNDLES_DIR, manifest_file: Path = MANIFEST_FILE, prune: bool = True) -> Dict:
+    """Write bundles for the current outputs and swap in a new manifest"""
+    analysis = json.load(open(ANALYSIS_FILE))
+    cards = json.load(open(CARDS_FILE))
+    players = json.load(open(PLAYERS_FILE))
+    decklists = dict(iter_decklists(DECKLISTS_FILE))
+    card_index = json.load(open(CARD_INDEX_FILE)) if CARD_INDEX_FILE.exists() else None
+
+    bundles_dir.mkdir(parents=True, exist_ok=True)
+    files = {}
+    section_files: Dict[str, Dict[str, str]] = {}
+    for name, data in build_bundles(analysis, cards, players, decklists, card_index).items():
+        path = f"{bundles_dir.name}/{write_shard(name, data, bundles_dir)}"
+        section = bundle_section(name)
+        if section is None:
+            files[name] = path
+        else:
+            section_files.setdefault(section, {})[name] = path
+    sections = {
+        section: f"{bundles_dir.name}/{write_shard(f'manifest/{section}', {'files': paths}, bundles_dir)}"
+        for section, paths in section_files.items()
+    }
+
+    manifest = {'version': MANIFEST_VERSION, 'files': files, 'sections': sections}
+    write_json_atomic(manifest_file, manifest, indent=None)
+
+    # Pruning after the manifest swap never removes a shard the new manifest needs
+    if prune:
+        published = list(files.values()) + list(sections.values())
+        published += [path for paths in section_files.values() for path in paths.values()]
+        removed = prune_shards({Path(path).name for path in published}, bundles_dir)
+        if removed:
+            print(f"Removed {removed} stale shard files")
+    return manifest
+
+
+def main(prune: bool = True):
+    """Publish bundles from the files written by analyze.py"""
+    print("Publishing data bundles...")
+    manifest = publish(prune=prune)
+    print(f"Published {len(manifest['files'])} bundles and {len(manifest['sections'])} bundle sections "
+          f"to {BUNDLES_DIR}")
+    if brotli is None:
+        print("brotli is not installed - only gzip copies were written")
+    print(f"Manifest saved to {MANIFEST_FILE}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Publish sharded, content-hashed data bundles for the dashboard")
+    parser.add_argument('--keep-stale', action='store_true',
+                        help="Keep shards from earlier publishes (e.g. while old pages may still request them)")
+    args = parser.parse_args()
+    main(prune=not args.keep_stale)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Persistent HTTP response cache for the spider, with conditional revalidation
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+# Kept out of data/, which the dashboard build publishes
+CACHE_DIR = Path(__file__).parent.parent / ".cache" / "http"
+INDEX_FILE_NAME = "index.json"
+
+# Responses younger than this are served without contacting the server.
+# Zero means every run revalidates (a 304 when the page hasn't changed).
+DEFAULT_TTL = 0
+# Total size of cached bodies before least-recently-used entries are evicted
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+
+class ResponseCache:
+    """
+    URL-keyed on-disk cache of response bodies. Entries remember their
+    ETag/Last-Modified validators so stale entries can be revalidated with a
+    conditional request, and total size is bounded with LRU eviction.
+    """
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, ttl: float = DEFAULT_TTL, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_file = self.cache_dir / INDEX_FILE_NAME
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries: Dict[str, Dict] = {}
+        if self.index_file.exists():
+            try:
+                self.entries = json.load(open(self.index_file))
+            except ValueError:
+                self.entries = {}
+
+    def _body_path(self, url: str) -> Path:
+        return self.cache_dir / hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _save_index(self):
+        """Atomically rewrite the cache index"""
+        tmp_file = self.index_file.with_suffix('.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(self.entries, f)
+        os.replace(tmp_file, self.index_file)
+
+    def is_fresh(self, url: str) -> bool:
+        """Check whether a cached response can be used without revalidation"""
+        with self.lock:
+            entry = self.entries.get(url)
+            return entry is not None and time.time() - entry['fetched_at'] < self.ttl
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers for a cached URL"""
+        with self.lock:
+            entry = self.entries.get(url)
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def read(self, url: str) -> Optional[bytes]:
+        """Read a cached body and mark it as recently used"""
+        with self.lock:
+            entry = self.entries.get(url)
+            if entry is None:
+                return None
+            try:
+                content = self._body_path(url).read_bytes()
+            except OSError:
+                del self.entries[url]
+                return None
+            entry['last_access'] = time.time()
+            return content
+
+    def revalidated(self, url: str):
+        """Record a 304 Not Modified response for a cached URL"""
+        with self.lock:
+            entry = self.entries.get(url)
+            if entry is not None:
+                entry['fetched_at'] = time.time()
+                self._save_index()
+
+    def store(self, url: str, content: bytes, headers: Dict[str, str]):
+        """Store a response body with its validators, evicting old entries if needed"""
+        with self.lock:
+            self._body_path(url).write_bytes(content)
+            now = time.time()
+            self.entries[url] = {
+                'etag': headers.get('ETag'),
+                'last_modified': headers.get('Last-Modified'),
+                'fetched_at': now,
+                'last_access': now,
+                'size': len(content)
+            }
+            self._evict()
+            self._save_index()
+
+    def _evict(self):
+        """Drop least-recently-used entries until the cache fits in max_bytes"""
+        total = sum(entry['size'] for entry in self.entries.values())
+        if total <= self.max_bytes:
+            return
+        for url, entry in sorted(self.entries.items(), key=lambda item: item[1]['last_access']):
+            if total <= self.max_bytes:
+                break
+            self._body_path(url).unlink(missing_ok=True)
+            del self.entries[url]
+            total -= entry['size']
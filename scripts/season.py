@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Analyze several events in parallel and merge them into season statistics.
+
+Each event (the dashboard's event in data/ and every partition in
+data/<event>/) is analyzed in its own process, skipping the event's own
+draft rounds. A partition's analysis.json is written alongside; the
+dashboard's event keeps the one analyze.py writes. Each event's raw counters
+are saved to aggregates.json in its .cache/ directory, and the season merge
+only sums those counters, so events whose inputs haven't changed are never
+reloaded.
+"""
+
+import argparse
+import json
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from analyze import (PlayerNameIndex, accumulate_results, build_player_archetypes, detect_special_archetypes,
+                     load_data, new_match_stats, summarize_metagame)
+from matchups import MatchupMatrix
+from storage import (DATA_DIR, DECKLISTS_NAME, DEFAULT_EVENT, EVENT_INFO_NAME, event_cache_dir, event_data_dir,
+                     event_draft_rounds, iter_events, results_path, write_json_atomic)
+
+SEASON_FILE = DATA_DIR / "season.json"
+AGGREGATES_NAME = "aggregates.json"
+ANALYSIS_NAME = "analysis.json"
+AGGREGATES_VERSION = 2
+COUNTER_FIELDS = ('wins', 'losses', 'draws', 'games_won', 'games_lost')
+
+
+def input_signature(event_dir: Path) -> Dict[str, List[int]]:
+    """Size and modification time of an event's input files"""
+    signature = {}
+    for path in (event_dir / DECKLISTS_NAME, results_path(event_dir), event_dir / EVENT_INFO_NAME):
+        if path.exists():
+            stat = path.stat()
+            signature[path.name] = [stat.st_size, stat.st_mtime_ns]
+    return signature
+
+
+def analyze_event(event: str) -> Dict:
+    """
+    Analyze one event and return its counters without match ids.
+    Saved aggregates are reused while the event's inputs are unchanged.
+    """
+    event_dir = event_data_dir(event)
+    aggregates_file = event_cache_dir(event) / AGGREGATES_NAME
+    signature = input_signature(event_dir)
+    # A partition's analysis.json is written from the same pass, so a missing one is recomputed too
+    analysis_written = event == DEFAULT_EVENT or (event_dir / ANALYSIS_NAME).exists()
+    if analysis_written and aggregates_file.exists():
+        aggregates = json.load(open(aggregates_file))
+        if aggregates.get('version') == AGGREGATES_VERSION and aggregates.get('inputs') == signature:
+            return aggregates
+
+    decklists, results = load_data(event_dir)
+    decklists = detect_special_archetypes(decklists)
+    match_stats = defaultdict(new_match_stats)
+    matchups = MatchupMatrix()
+    match_table = []
+    accumulate_results(match_stats, matchups, match_table, results, PlayerNameIndex(decklists),
+                       event_draft_rounds(event_dir))
+
+    aggregates = {
+        'version': AGGREGATES_VERSION,
+        'event': event,
+        'inputs': signature,
+        'match_stats': {arch: {field: stats[field] for field in COUNTER_FIELDS}
+                        for arch, stats in match_stats.items()},
+        'matchups': matchups.to_state(include_matches=False),
+        'player_archetypes': build_player_archetypes(decklists),
+        'total_matches': len(results)
+    }
+
+    if event != DEFAULT_EVENT:
+        # Summarizing adds derived fields in place, so the counters are copied above first
+        analysis = summarize_metagame(match_stats, matchups, match_table, aggregates['player_archetypes'],
+                                      len(results))
+        write_json_atomic(event_dir / ANALYSIS_NAME, analysis, indent=None, separators=(',', ':'))
+    aggregates_file.parent.mkdir(parents=True, exist_ok=True)
+    write_json_atomic(aggregates_file, aggregates, indent=None)
+    return aggregates
+
+
+def merge_aggregates(event_aggregates: List[Dict]) -> Dict:
+    """Sum per-event counters into season statistics"""
+    match_stats = defaultdict(new_match_stats)
+    matchups = MatchupMatrix()
+    player_archetypes = {}
+    total_matches = 0
+
+    for aggregates in event_aggregates:
+        for arch, stats in aggregates['match_stats'].items():
+            for field in COUNTER_FIELDS:
+                match_stats[arch][field] += stats[field]
+        matchups.merge(MatchupMatrix.from_state(aggregates['matchups']))
+        # A player entering several events counts once per event
+        for player, archetype in aggregates['player_archetypes'].items():
+            player_archetypes[f"{aggregates['event']}/{player}"] = archetype
+        total_matches += aggregates['total_matches']
+
+    season = summarize_metagame(match_stats, matchups, [], player_archetypes, total_matches)
+    # Match ids only make sense within one event's analysis.json
+    del season['matches']
+    for stats in season['archetype_stats'].values():
+        del stats['matches']
+    for matchup in season['matchup_stats'].values():
+        matchup.pop('matches', None)
+    season['events'] = [aggregates['event'] for aggregates in event_aggregates]
+    return season
+
+
+def run_season(events: List[str], workers: Optional[int] = None) -> Dict:
+    """Analyze events in a process pool and merge them into the season summary"""
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        event_aggregates = list(executor.map(analyze_event, events))
+    for aggregates in event_aggregates:
+        print(f"  {aggregates['event']}: {len(aggregates['player_archetypes'])} players, "
+              f"{aggregates['total_matches']} matches")
+    return merge_aggregates(event_aggregates)
+
+
+def main(events: Optional[List[str]] = None, workers: Optional[int] = None):
+    """Analyze every stored event (or the given events) and write season.json"""
+    events = events or list(iter_events())
+    if not events:
+        print(f"No events found in {DATA_DIR} - run spider.py first")
+        return
+
+    print(f"Analyzing {len(events)} events...")
+    season = run_season(events, workers)
+
+    print(f"\nFound {season['total_players']} decks across {len(season['events'])} events")
+    print(f"Processed {season['total_matches']} matches")
+    write_json_atomic(SEASON_FILE, season, indent=None, separators=(',', ':'))
+    print(f"\nSeason analysis saved to {SEASON_FILE}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Analyze event partitions in parallel and merge season statistics")
+    parser.add_argument('events', nargs='*',
+                        help="Event slugs (default: the dashboard's event and every partition in data/)")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: one per CPU)")
+    args = parser.parse_args()
+    main(args.events, args.workers)
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Monte Carlo Swiss tournament simulator driven by the measured matchups.
+
+Answers "which deck should I bring" by playing many simulated events with a
+given field. Match win probabilities come from analysis.json's matchup
+matrix, shrunk toward 50% by a prior so that matchups seen a handful of
+times don't dominate. Each batch of tournaments is simulated at once as
+(tournaments, players) NumPy arrays: every Swiss round sorts each
+tournament by points, pairs neighbours and plays all matches with one
+random draw. The top 8 then play a single-elimination bracket. Batches run
+in a process pool.
+"""
+
+import argparse
+import json
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil, log2
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from analyze import OUTPUT_FILE
+
+TOURNAMENTS = 100000
+# Tournaments simulated together in one process
+BATCH_SIZE = 5000
+# Pseudo-matches at 50% blended into every matchup
+PRIOR_MATCHES = 4
+TOP_CUT = 8
+# Quarterfinal pairings of the top 8 by seed, winners meeting in bracket order
+BRACKET = [(0, 7), (3, 4), (1, 6), (2, 5)]
+
+
+def win_probabilities(matchup_matrix: Dict, archetypes: List[str], prior_matches: float = PRIOR_MATCHES) -> np.ndarray:
+    """
+    Probability that the row archetype beats the column archetype in a
+    match, (wins + prior / 2) / (matches + prior), from a matchup matrix
+    (MatchupMatrix.to_json). Unplayed matchups and mirrors are 50%.
+    """
+    measured = {archetype: i for i, archetype in enumerate(matchup_matrix['archetypes'])}
+    rows = np.array([measured.get(archetype, -1) for archetype in archetypes], dtype=np.int64)
+    known = rows >= 0
+    # Reshaped so a matrix without archetypes still indexes as (0, 0)
+    measured_wins = np.array(matchup_matrix['wins'], dtype=np.float64).reshape(len(measured), len(measured))
+    wins = np.zeros((len(archetypes), len(archetypes)))
+    wins[np.ix_(known, known)] = measured_wins[np.ix_(rows[known], rows[known])]
+    np.fill_diagonal(wins, 0)
+    return (wins + prior_matches / 2) / (wins + wins.T + prior_matches)
+
+
+def play(win_probability: np.ndarray, decks: np.ndarray, player1: np.ndarray, player2: np.ndarray,
+         rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Play the matches player1[t, k] vs player2[t, k] of every tournament t, returning (winners, losers)"""
+    rows = np.arange(len(decks))[:, None]
+    p1_wins = rng.random(player1.shape) < win_probability[decks[rows, player1], decks[rows, player2]]
+    return np.where(p1_wins, player1, player2), np.where(p1_wins, player2, player1)
+
+
+def standings(points: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Players of each tournament ordered by points, ties broken at random"""
+    return np.lexsort((rng.random(points.shape), -points), axis=1)
+
+
+def simulate_batch(win_probability: np.ndarray, field: np.ndarray, tournaments: int, rounds: int,
+                   seed) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Simulate tournaments with the given field (one archetype id per player).
+    Returns top 8 appearances and tournament wins per archetype.
+    """
+    rng = np.random.default_rng(seed)
+    players = len(field)
+    if players < TOP_CUT:
+        raise ValueError(f"A field of {players} players can't fill a top {TOP_CUT}")
+    rows = np.arange(tournaments)[:, None]
+    decks = np.tile(field, (tournaments, 1))
+    points = np.zeros((tournaments, players), dtype=np.int64)
+
+    for _ in range(rounds):
+        order = standings(points, rng)
+        # An odd player out (the last in the standings) gets a bye
+        if players % 2:
+            points[rows[:, 0], order[:, -1]] += 1
+            order = order[:, :-1]
+        winners, _ = play(win_probability, decks, order[:, 0::2], order[:, 1::2], rng)
+        points[rows, winners] += 1
+
+    top = standings(points, rng)[:, :TOP_CUT]
+    bracket = np.column_stack([top[:, rank] for pairing in BRACKET for rank in pairing])
+    while bracket.shape[1] > 1:
+        bracket, _ = play(win_probability, decks, bracket[:, 0::2], bracket[:, 1::2], rng)
+
+    archetype_count = int(field.max()) + 1
+    top_decks = np.take_along_axis(decks, top, axis=1)
+    top8 = np.bincount(top_decks.ravel(), minlength=archetype_count)
+    wins = np.bincount(decks[rows[:, 0], bracket[:, 0]], minlength=archetype_count)
+    return top8, wins
+
+
+def simulate(archetype_counts: Dict[str, int], matchup_matrix: Dict, tournaments: int = TOURNAMENTS,
+             rounds: Optional[int] = None, prior_matches: float = PRIOR_MATCHES, workers: Optional[int] = None,
+             seed: int = 0) -> Dict:
+    """
+    Run Swiss tournaments with the field given by archetype_counts (Swiss
+    rounds default to ceil(log2(players))) and report each archetype's
+    top 8 and win probabilities, per player and for the archetype as a whole.
+    """
+    archetypes = sorted(archetype for archetype, count in archetype_counts.items() if count > 0)
+    field = np.repeat(np.arange(len(archetypes)), [archetype_counts[archetype] for archetype in archetypes])
+    if rounds is None:
+        rounds = ceil(log2(len(field)))
+    win_probability = win_probabilities(matchup_matrix, archetypes, prior_matches)
+
+    batches = [min(BATCH_SIZE, tournaments - start) for start in range(0, tournaments, BATCH_SIZE)]
+    seeds = np.random.SeedSequence(seed).spawn(len(batches))
+    top8 = np.zeros(len(archetypes), dtype=np.int64)
+    wins = np.zeros(len(archetypes), dtype=np.int64)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for batch_top8, batch_wins in executor.map(simulate_batch, [win_probability] * len(batches),
+                                                   [field] * len(batches), batches, [rounds] * len(batches),
+                                                   seeds):
+            top8 += batch_top8
+            wins += batch_wins
+
+    results = {}
+    for i, archetype in enumerate(archetypes):
+        players = archetype_counts[archetype]
+        results[archetype] = {
+            'players': players,
+            'top8_probability': float(top8[i] / (tournaments * players)),
+            'win_probability': float(wins[i] / (tournaments * players)),
+            'expected_top8': float(top8[i] / tournaments),
+            'archetype_win_probability': float(wins[i] / tournaments)
+        }
+    return {
+        'tournaments': tournaments,
+        'players': len(field),
+        'rounds': rounds,
+        'prior_matches': prior_matches,
+        'archetypes': results
+    }
+
+
+def parse_field(specs: List[str]) -> Dict[str, int]:
+    """'Archetype=count' arguments as a field composition"""
+    field = {}
+    for spec in specs:
+        archetype, sep, count = spec.rpartition('=')
+        if not sep or not count.isdigit():
+            raise ValueError(f"Expected Archetype=count, got '{spec}'")
+        field[archetype] = int(count)
+    return field
+
+
+def main(field: Optional[Dict[str, int]] = None, tournaments: int = TOURNAMENTS, rounds: Optional[int] = None,
+         prior_matches: float = PRIOR_MATCHES, workers: Optional[int] = None, seed: int = 0,
+         output_path=None):
+    """Simulate the analyzed event's field, with archetype counts overridden by field"""
+    analysis = json.load(open(OUTPUT_FILE))
+    archetype_counts = dict(analysis['archetype_counts'])
+    archetype_counts.update(field or {})
+
+    print(f"Simulating {tournaments} tournaments of {sum(archetype_counts.values())} players...")
+    if 'matchup_matrix' not in analysis:
+        raise ValueError(f"{OUTPUT_FILE} has no matchup matrix - rerun analyze.py without --legacy-format")
+    result = simulate(archetype_counts, analysis['matchup_matrix'], tournaments, rounds, prior_matches,
+                      workers, seed)
+
+    print(f"\n{result['rounds']} Swiss rounds, top {TOP_CUT}:")
+    ranked = sorted(result['archetypes'].items(), key=lambda item: -item[1]['win_probability'])
+    for archetype, stats in ranked:
+        print(f"  {archetype}: {stats['players']} players, top 8 {stats['top8_probability']:.1%}, "
+              f"win {stats['win_probability']:.2%} per player")
+
+    if output_path:
+        json.dump(result, open(output_path, 'w'), indent=2)
+        print(f"\nSimulation saved to {output_path}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simulate Swiss tournaments from the measured matchups")
+    parser.add_argument('field', nargs='*',
+                        help="Archetype=count overrides of the analyzed field, e.g. 'Temur Otters=30'")
+    parser.add_argument('--tournaments', type=int, default=TOURNAMENTS)
+    parser.add_argument('--rounds', type=int, default=None,
+                        help="Swiss rounds (default: enough to leave one undefeated player)")
+    parser.add_argument('--prior', type=float, default=PRIOR_MATCHES,
+                        help="Pseudo-matches at 50%% blended into every matchup")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="Write the simulation results to this JSON file")
+    args = parser.parse_args()
+    main(parse_field(args.field), args.tournaments, args.rounds, args.prior, args.workers, args.seed, args.output)
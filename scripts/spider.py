@@ -1,23 +1,38 @@
 #!/usr/bin/env python3
 """
-Spider script to collect Magic World Championship 31 data from magic.gg
+Spider script to collect event decklists and results from magic.gg
 """
 
+import argparse
 import json
 import re
+import threading
 import time
-import unicodedata
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
+from decklist_parser import iter_chunks, iter_decklists_from_html
+from instrumentation import count, timed, timed_function
+from names import WinnerResolver
+from response_cache import CACHE_DIR as RESPONSE_CACHE_DIR, DEFAULT_MAX_BYTES, DEFAULT_TTL, ResponseCache
+from storage import (DB_FILE, DEFAULT_DRAFT_ROUNDS, DEFAULT_EVENT, EVENT_INFO_NAME, append_results, event_data_dir,
+                     iter_decklists, iter_results, read_event_info, results_path, write_json_atomic)
+
 
 BASE_URL = "https://magic.gg"
-EVENT_URL = f"{BASE_URL}/events/magic-world-championship-31"
-DRAFT_ROUNDS = {1, 2, 3, 8, 9, 10}  # Draft rounds (still fetch them, just mark them)
+# Rounds to try when the event page doesn't reveal the round count
+MAX_ROUNDS = 15
+ROUND_LINK_PATTERN = re.compile(r'round-(\d+)-(?:results|pairings|standings)', re.I)
+ROUND_TEXT_PATTERN = re.compile(r'\bround\s+(\d{1,2})\b', re.I)
+# Draft rounds named on the event page, e.g. "Rounds 1-3: Booster Draft" or "Round 8 (Draft)"
+DRAFT_ROUNDS_PATTERN = re.compile(
+    r'\brounds?\s+(\d{1,2})(?:\s*(?:-|\u2013|to|through)\s*(\d{1,2}))?[^.\n]{0,40}?\bdraft\b', re.I)
 # Data directory relative to project root
 DATA_DIR = Path(__file__).parent.parent / "data"
 DATA_DIR.mkdir(exist_ok=True)
@@ -27,35 +42,166 @@ DECKLISTS_FILE = DATA_DIR / "decklists.json"
 RESULTS_FILE = DATA_DIR / "results.json"
 PAIRINGS_FILE = DATA_DIR / "pairings.json"
 
+# Concurrency defaults - keep request rate polite to magic.gg
+MAX_WORKERS = 4
+REQUESTS_PER_SECOND = 2.0
+BURST = 2
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting request rate to a single host"""
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class RateLimiter:
+    """Per-host token buckets shared by all spider worker threads"""
+    
+    def __init__(self, rate: float = REQUESTS_PER_SECOND, capacity: int = BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.lock = threading.Lock()
+    
+    def acquire(self, url: str):
+        """Wait for permission to send a request to the host of url"""
+        host = urlparse(url).netloc
+        with self.lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                bucket = self.buckets[host] = TokenBucket(self.rate, self.capacity)
+        bucket.acquire()
+
 
 class MagicSpider:
-    def __init__(self):
+    def __init__(self, max_workers: int = MAX_WORKERS, requests_per_second: float = REQUESTS_PER_SECOND,
+                 use_cache: bool = True, event: str = DEFAULT_EVENT, data_dir: Path = DATA_DIR,
+                 db_path: Optional[Path] = None, draft_rounds: Optional[Iterable[int]] = None,
+                 base_url: str = BASE_URL, cache_ttl: float = DEFAULT_TTL, cache_max_bytes: int = DEFAULT_MAX_BYTES,
+                 cache_dir: Path = RESPONSE_CACHE_DIR):
+        # SQLite store that also receives the collected data (optional)
+        self.db_path = db_path
+        # Draft rounds saved to event.json; found on the event page when not given or saved before
+        self.draft_rounds = set(draft_rounds) if draft_rounds else None
+        self.event = event
+        # Site root that event pages, decklists and results are fetched from
+        self.base_url = base_url.rstrip('/')
+        self.event_url = f"{self.base_url}/events/{event}"
+        self.data_dir = Path(data_dir)
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.decklists_file = self.data_dir / DECKLISTS_FILE.name
+        self.results_file = self.data_dir / RESULTS_FILE.name
+        self.max_workers = max(1, max_workers)
+        self.rate_limiter = RateLimiter(requests_per_second)
+        # Responses younger than cache_ttl seconds skip revalidation; cached bodies are capped at cache_max_bytes
+        self.cache = ResponseCache(cache_dir, cache_ttl, cache_max_bytes) if use_cache else None
+        # Parsed pages shared within a run, so repeated fetches of a page parse it once
+        self.soups: Dict[str, BeautifulSoup] = {}
+        self.soup_locks: Dict[str, threading.Lock] = {}
+        self.soups_lock = threading.Lock()
+        # Results whose winner matched neither player, reported at the end of the run
+        self.unresolved_winners: List[Dict] = []
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
+        # Size the connection pool so worker threads don't block on each other
+        adapter = HTTPAdapter(pool_connections=self.max_workers, pool_maxsize=self.max_workers)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+    
+    def map_concurrent(self, func, items: List) -> List:
+        """Apply func to each item on the worker pool, returning results in input order"""
+        if self.max_workers == 1 or len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(func, items))
+    
+    def fetch_content(self, url: str) -> bytes:
+        """Fetch a response body, serving or revalidating it through the response cache"""
+        with timed('fetch'):
+            if self.cache is None:
+                response = self.get(url)
+                response.raise_for_status()
+                return response.content
+            
+            if self.cache.is_fresh(url):
+                content = self.cache.read(url)
+                if content is not None:
+                    count('cache.hits')
+                    return content
+            
+            response = self.get(url, headers=self.cache.conditional_headers(url))
+            if response.status_code == 304:
+                content = self.cache.read(url)
+                if content is not None:
+                    count('cache.revalidated')
+                    self.cache.revalidated(url)
+                    return content
+                # Cached body went missing - fetch it again unconditionally
+                response = self.get(url)
+            response.raise_for_status()
+            self.cache.store(url, response.content, response.headers)
+            return response.content
+    
+    def get(self, url: str, headers: Optional[Dict[str, str]] = None) -> requests.Response:
+        """Rate-limited GET, counting requests and bytes downloaded"""
+        self.rate_limiter.acquire(url)
+        response = self.session.get(url, headers=headers, timeout=30)
+        count('http.requests')
+        count('http.bytes', len(response.content))
+        return response
     
     def fetch_page(self, url: str) -> BeautifulSoup:
-        """Fetch and parse a page"""
-        print(f"Fetching: {url}")
-        response = self.session.get(url, timeout=30)
-        response.raise_for_status()
-        return BeautifulSoup(response.content, 'html.parser')
+        """Fetch and parse a page, reusing the parsed page within a run"""
+        with self.soups_lock:
+            lock = self.soup_locks.setdefault(url, threading.Lock())
+        with lock:
+            soup = self.soups.get(url)
+            if soup is None:
+                print(f"Fetching: {url}")
+                content = self.fetch_content(url)
+                with timed('parse_html'):
+                    soup = BeautifulSoup(content, 'html.parser')
+                count('pages.parsed')
+                self.soups[url] = soup
+            return soup
+    
+    def forget_page(self, url: str):
+        """Drop a parsed page so the next fetch_page sees the current version"""
+        with self.soups_lock:
+            self.soups.pop(url, None)
     
     def fetch_json(self, url: str) -> Optional[Dict]:
         """Fetch JSON data from an API endpoint"""
         try:
             print(f"Fetching JSON: {url}")
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            return response.json()
+            return json.loads(self.fetch_content(url))
         except Exception as e:
             print(f"Error fetching JSON from {url}: {e}")
             return None
     
     def find_api_endpoints(self) -> Dict[str, str]:
         """Try to find API endpoints from the main page"""
-        soup = self.fetch_page(EVENT_URL)
+        soup = self.fetch_page(self.event_url)
         endpoints = {}
         
         # Look for script tags with API URLs
@@ -64,17 +210,17 @@ class MagicSpider:
                 # Look for API URLs in JavaScript
                 api_match = re.search(r'["\']([^"\']*api[^"\']*decklist[^"\']*)["\']', script.string, re.I)
                 if api_match:
-                    endpoints['decklists'] = urljoin(BASE_URL, api_match.group(1))
+                    endpoints['decklists'] = urljoin(self.base_url, api_match.group(1))
                 
                 api_match = re.search(r'["\']([^"\']*api[^"\']*result[^"\']*)["\']', script.string, re.I)
                 if api_match:
-                    endpoints['results'] = urljoin(BASE_URL, api_match.group(1))
+                    endpoints['results'] = urljoin(self.base_url, api_match.group(1))
         
         return endpoints
     
     def get_decklist_links(self) -> List[str]:
         """Get all decklist page URLs"""
-        soup = self.fetch_page(EVENT_URL)
+        soup = self.fetch_page(self.event_url)
         decklist_links = []
         
         # Look for decklist links in navigation and content
@@ -82,21 +228,21 @@ class MagicSpider:
             href = link['href']
             text = link.get_text(strip=True).lower()
             if 'decklist' in text or 'deck' in text or '/decklist' in href.lower():
-                full_url = urljoin(BASE_URL, href)
-                if full_url not in decklist_links and 'magic-world-championship-31' in full_url:
+                full_url = urljoin(self.base_url, href)
+                if full_url not in decklist_links and self.event in full_url:
                     decklist_links.append(full_url)
         
         # Try to find the decklists article/page
         decklist_article = soup.find('a', href=re.compile('decklist', re.I))
         if decklist_article:
-            decklist_url = urljoin(BASE_URL, decklist_article['href'])
+            decklist_url = urljoin(self.base_url, decklist_article['href'])
             try:
                 decklist_soup = self.fetch_page(decklist_url)
                 # Find all links to individual decklists
                 for link in decklist_soup.find_all('a', href=True):
                     href = link['href']
                     if '/decklist/' in href or '/deck/' in href or 'decklist' in href.lower():
-                        full_url = urljoin(BASE_URL, href)
+                        full_url = urljoin(self.base_url, href)
                         if full_url not in decklist_links:
                             decklist_links.append(full_url)
             except:
@@ -220,215 +366,85 @@ class MagicSpider:
         
         return None
     
+    def iter_decklist_index_page(self, url: str) -> Iterator[Dict]:
+        """Stream player names, archetypes, and decklists from a decklist index page"""
+        print(f"Fetching: {url}")
+        content = self.fetch_content(url)
+        # Single pass over the raw HTML - no parse tree or full-document string copy
+        yield from iter_decklists_from_html(iter_chunks(content), url)
+    
     def parse_decklist_index_page(self, url: str) -> List[Dict]:
         """Parse a decklist index page to extract player names, archetypes, and decklists"""
-        soup = self.fetch_page(url)
-        decklists = []
-        
-        # Parse the raw HTML for deck-list tags (BeautifulSoup might not parse custom tags)
-        html_content = str(soup)
-        
-        # Find all deck-list elements with their content
-        deck_list_pattern = r'<deck-list[^>]*deck-title=["\']([^"\']+)["\'][^>]*subtitle=["\']([^"\']+)["\']([^>]*)>([\s\S]*?)</deck-list>'
-        matches = re.findall(deck_list_pattern, html_content, re.I)
-        
-        for player, archetype, attrs, content in matches:
-            player = player.strip()
-            archetype = archetype.strip()
-            
-            if not player or not archetype:
-                continue
-            
-            # Parse the decklist content
-            main_deck = []
-            sideboard = []
-            
-            # Extract main deck
-            main_match = re.search(r'<main-deck>([\s\S]*?)</main-deck>', content, re.I)
-            if main_match:
-                main_content = main_match.group(1)
-                # Parse card lines (format: "4 Card Name" or "1 Card Name")
-                for line in main_content.split('\n'):
-                    line = line.strip()
-                    if line and not line.startswith('<'):
-                        card_match = re.match(r'(\d+)\s+(.+)', line)
-                        if card_match:
-                            count = int(card_match.group(1))
-                            card_name = card_match.group(2).strip()
-                            main_deck.append({'count': count, 'name': card_name})
-            
-            # Extract sideboard
-            side_match = re.search(r'<side-board>([\s\S]*?)</side-board>', content, re.I)
-            if side_match:
-                side_content = side_match.group(1)
-                for line in side_content.split('\n'):
-                    line = line.strip()
-                    if line and not line.startswith('<'):
-                        card_match = re.match(r'(\d+)\s+(.+)', line)
-                        if card_match:
-                            count = int(card_match.group(1))
-                            card_name = card_match.group(2).strip()
-                            sideboard.append({'count': count, 'name': card_name})
-            
-            decklists.append({
-                'player': player,
-                'archetype': archetype,
-                'url': url,
-                'main_deck': main_deck,
-                'sideboard': sideboard
-            })
-        
+        with timed('parse_decklist_index_page'):
+            decklists = list(self.iter_decklist_index_page(url))
+        count('rows.decklists', len(decklists))
         return decklists
     
-    def get_all_decklists(self) -> Dict[str, Dict]:
-        """Get all decklists with player names and archetypes"""
-        existing = {}
-        if DECKLISTS_FILE.exists():
-            existing = json.load(open(DECKLISTS_FILE))
-        
-        # Find the decklist index pages (A-L and M-Z)
-        soup = self.fetch_page(EVENT_URL)
+    def find_decklist_index_pages(self) -> List[str]:
+        """Decklist index page URLs (A-L and M-Z) linked from the event page, plus the known ones"""
+        soup = self.fetch_page(self.event_url)
         index_pages = []
         
         # Look for links to decklist index pages
         for link in soup.find_all('a', href=True):
             href = link['href']
             text = link.get_text(strip=True).lower()
-            if 'decklist' in href and 'magic-world-championship-31' in href:
-                full_url = urljoin(BASE_URL, href)
+            if 'decklist' in href and self.event in href:
+                full_url = urljoin(self.base_url, href)
                 if 'standard-decklists' in href and full_url not in index_pages:
                     index_pages.append(full_url)
         
         # Also try the known index pages
         known_indexes = [
-            f"{BASE_URL}/decklists/magic-world-championship-31-standard-decklists-a-l",
-            f"{BASE_URL}/decklists/magic-world-championship-31-standard-decklists-m-z",
+            f"{self.base_url}/decklists/{self.event}-standard-decklists-a-l",
+            f"{self.base_url}/decklists/{self.event}-standard-decklists-m-z",
         ]
         for idx_url in known_indexes:
             if idx_url not in index_pages:
                 index_pages.append(idx_url)
-        
-        # Parse each index page to extract decklist info directly
-        for index_url in index_pages:
+        return index_pages
+    
+    def get_all_decklists(self, index_pages: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """Get all decklists with player names and archetypes, from the given index pages or all of them"""
+        existing = dict(iter_decklists(self.decklists_file))
+        found_new = False
+        if index_pages is None:
+            index_pages = self.find_decklist_index_pages()
+        
+        # Parse index pages concurrently to extract decklist info directly
+        def parse_index(index_url: str) -> List[Dict]:
             print(f"Parsing index page: {index_url}")
-            decklists_from_page = self.parse_decklist_index_page(index_url)
+            return self.parse_decklist_index_page(index_url)
+        
+        for index_url, decklists_from_page in zip(index_pages, self.map_concurrent(parse_index, index_pages)):
             for decklist in decklists_from_page:
                 player = decklist.get('player', '')
                 # Use player name as key (normalized)
                 key = f"{index_url}::{player}"
                 if key not in existing:
                     existing[key] = decklist
+                    found_new = True
                     print(f"  Found: {player} - {decklist.get('archetype', 'Unknown')}")
-            time.sleep(0.5)
         
-        json.dump(existing, open(DECKLISTS_FILE, 'w'), indent=2)
+        # Only rewrite the file when new decklists were found
+        if found_new or not self.decklists_file.exists():
+            write_json_atomic(self.decklists_file, existing)
         return existing
     
-    def normalize_name_for_matching(self, name: str) -> str:
-        """Normalize a name for fuzzy matching: convert weird characters, handle formats"""
-        if not name:
-            return ""
-        
-        # Convert to lowercase
-        name = name.lower().strip()
-        
-        # Handle "Last, First Middle" format - convert to "First Middle Last"
-        if ',' in name:
-            parts = [p.strip() for p in name.split(',')]
-            if len(parts) >= 2:
-                name = f"{parts[1]} {parts[0]}"
-        
-        # Normalize unicode characters (e.g., é -> e, ñ -> n)
-        name = unicodedata.normalize('NFKD', name)
-        name = ''.join(c for c in name if not unicodedata.combining(c))
-        
-        # Replace common punctuation and special characters with spaces
-        name = re.sub(r'[^\w\s]', ' ', name)
-        
-        # Normalize whitespace
-        name = ' '.join(name.split())
-        
-        return name
-    
-    def split_name_into_pieces(self, name: str) -> List[str]:
-        """Split a normalized name into pieces (words)"""
-        if not name:
-            return []
-        return [piece for piece in name.split() if piece]
-    
-    def count_matching_pieces(self, name1_pieces: List[str], name2_pieces: List[str]) -> int:
-        """Count how many pieces match between two names (order-independent)"""
-        if not name1_pieces or not name2_pieces:
-            return 0
-        
-        # Create sets for faster lookup
-        set1 = set(name1_pieces)
-        set2 = set(name2_pieces)
-        
-        # Count exact matches
-        exact_matches = len(set1 & set2)
-        
-        # Also count substring matches (e.g., "sam" matches "samuel")
-        substring_matches = 0
-        for piece1 in name1_pieces:
-            for piece2 in name2_pieces:
-                if piece1 != piece2:  # Don't double-count exact matches
-                    if piece1 in piece2 or piece2 in piece1:
-                        substring_matches += 1
-        
-        # Return total matches (exact + substring, but cap at reasonable number)
-        return exact_matches + min(substring_matches, len(name1_pieces))
-    
-    def find_closest_match(self, winner: str, player1: str, player2: str) -> Optional[str]:
-        """Find which player name is closest to the winner name using fuzzy matching"""
-        if not winner or not player1 or not player2:
-            return None
-        
-        # Normalize all names
-        winner_norm = self.normalize_name_for_matching(winner)
-        player1_norm = self.normalize_name_for_matching(player1)
-        player2_norm = self.normalize_name_for_matching(player2)
-        
-        # Split into pieces
-        winner_pieces = self.split_name_into_pieces(winner_norm)
-        player1_pieces = self.split_name_into_pieces(player1_norm)
-        player2_pieces = self.split_name_into_pieces(player2_norm)
-        
-        if not winner_pieces:
-            return None
-        
-        # Count matches for each player
-        p1_matches = self.count_matching_pieces(winner_pieces, player1_pieces)
-        p2_matches = self.count_matching_pieces(winner_pieces, player2_pieces)
-        
-        # Return the player with the most matches
-        if p1_matches > p2_matches:
-            return player1
-        elif p2_matches > p1_matches:
-            return player2
-        else:
-            # Tie - prefer the player with more pieces in common relative to their name length
-            # This helps when one name is longer (e.g., "Mario Alejandro Flores Silva" vs "Mario Flores")
-            if p1_matches > 0:
-                p1_ratio = p1_matches / max(len(player1_pieces), 1)
-                p2_ratio = p2_matches / max(len(player2_pieces), 1)
-                if p1_ratio > p2_ratio:
-                    return player1
-                elif p2_ratio > p1_ratio:
-                    return player2
-            
-            # Still tied - return None (can't determine)
-            return None
+    def round_results_url(self, round_num: int) -> str:
+        """Results article of a round: /news/{event}-round-{N}-results"""
+        return f"{self.base_url}/news/{self.event}-round-{round_num}-results"
     
+    @timed_function('get_round_results')
     def get_round_results(self, round_num: int) -> List[Dict]:
         """Get results for a specific round"""
         # Fetch all rounds including draft rounds
         
         # Try to find JSON API endpoint first
         api_urls = [
-            f"{BASE_URL}/api/events/magic-world-championship-31/results?round={round_num}",
-            f"{BASE_URL}/api/results?event=magic-world-championship-31&round={round_num}",
-            f"{BASE_URL}/api/v1/events/magic-world-championship-31/results?round={round_num}",
+            f"{self.base_url}/api/events/{self.event}/results?round={round_num}",
+            f"{self.base_url}/api/results?event={self.event}&round={round_num}",
+            f"{self.base_url}/api/v1/events/{self.event}/results?round={round_num}",
         ]
         
         for api_url in api_urls:
@@ -466,7 +482,7 @@ class MagicSpider:
         
         # Try the main event page - results might be embedded there
         try:
-            soup = self.fetch_page(EVENT_URL)
+            soup = self.fetch_page(self.event_url)
             # Look for results data in script tags
             for script in soup.find_all('script'):
                 if script.string and f'round-{round_num}' in script.string.lower():
@@ -484,12 +500,13 @@ class MagicSpider:
         except:
             pass
         
-        # Results are at /news/magic-world-championship-31-round-{N}-results
-        results_url = f"{BASE_URL}/news/magic-world-championship-31-round-{round_num}-results"
+        results_url = self.round_results_url(round_num)
         
         try:
             soup = self.fetch_page(results_url)
             results = []
+            # Caches each player's name tokens across the round's rows
+            resolver = WinnerResolver()
             
             # Parse HTML tables - results are in tables
             tables = soup.find_all('table')
@@ -521,70 +538,17 @@ class MagicSpider:
                             loser_wins = int(result_match.group(3))
                             draws = int(result_match.group(4))
                             
-                            def names_match(name1, name2):
-                                """Check if two names match (handles variations like Sam/Samuel, middle names)"""
-                                # Normalize both names for comparison
-                                def normalize_for_match(name):
-                                    """Normalize name for matching - remove extra spaces, handle commas"""
-                                    name = name.strip()
-                                    # If it's "Last, First Middle" format, convert to "First Middle Last"
-                                    if ',' in name:
-                                        parts = [p.strip() for p in name.split(',')]
-                                        if len(parts) >= 2:
-                                            return f"{parts[1]} {parts[0]}".lower()
-                                    return name.lower()
-                                
-                                n1_norm = normalize_for_match(name1)
-                                n2_norm = normalize_for_match(name2)
-                                
-                                # Direct exact match after normalization
-                                if n1_norm == n2_norm:
-                                    return True
-                                
-                                # Check if one name is contained in the other (handles middle names)
-                                if n1_norm in n2_norm or n2_norm in n1_norm:
-                                    return True
-                                
-                                # Last name match - extract last word from normalized names
-                                n1_parts = n1_norm.split()
-                                n2_parts = n2_norm.split()
-                                if n1_parts and n2_parts:
-                                    # Last name is the last word
-                                    if n1_parts[-1] == n2_parts[-1]:
-                                        # Also check if first name matches (more reliable)
-                                        if n1_parts[0] == n2_parts[0]:
-                                            return True
-                                        # Or if one first name is contained in the other
-                                        if n1_parts[0] in n2_parts[0] or n2_parts[0] in n1_parts[0]:
-                                            return True
-                                
-                                return False
-                            
                             # Determine which player won
-                            if names_match(winner, player1):
-                                p1_wins = winner_wins
-                                p2_wins = loser_wins
-                            elif names_match(winner, player2):
+                            winner_player, confidence = resolver.resolve(winner, player1, player2)
+                            if winner_player == player2:
                                 p1_wins = loser_wins
                                 p2_wins = winner_wins
                             else:
-                                # Try fuzzy matching - find closest match by counting matching name pieces
-                                closest_match = self.find_closest_match(winner, player1, player2)
-                                if closest_match == player1:
-                                    p1_wins = winner_wins
-                                    p2_wins = loser_wins
-                                    print(f"Fuzzy match: '{winner}' matched to '{player1}'")
-                                elif closest_match == player2:
-                                    p1_wins = loser_wins
-                                    p2_wins = winner_wins
-                                    print(f"Fuzzy match: '{winner}' matched to '{player2}'")
-                                else:
-                                    # Still couldn't determine - default to first player (shouldn't happen often)
-                                    print(f"Warning: Could not match winner '{winner}' to players '{player1}' or '{player2}'")
-                                    p1_wins = winner_wins
-                                    p2_wins = loser_wins
+                                # Unresolved winners default to the first player and are reported
+                                p1_wins = winner_wins
+                                p2_wins = loser_wins
                             
-                            results.append({
+                            result = {
                                 'round': round_num,
                                 'player1': player1,
                                 'player2': player2,
@@ -592,7 +556,17 @@ class MagicSpider:
                                 'p2_wins': p2_wins,
                                 'p1_games': p1_wins,
                                 'p2_games': p2_wins
-                            })
+                            }
+                            if confidence < 1:
+                                result['winner_confidence'] = round(confidence, 2)
+                                if winner_player is None:
+                                    print(f"Warning: round {round_num}: could not match winner '{winner}' "
+                                          f"to '{player1}' or '{player2}', recorded as '{player1}'")
+                                    self.unresolved_winners.append(result)
+                                else:
+                                    print(f"Fuzzy match: round {round_num}: '{winner}' matched to "
+                                          f"'{winner_player}' (confidence {confidence:.2f})")
+                            results.append(result)
                         elif draw_match:
                             # Handle draws: "1-1-0 Draw" means both players have same wins
                             p1_wins = int(draw_match.group(1))
@@ -616,7 +590,7 @@ class MagicSpider:
     
     def parse_results_from_event_page(self) -> List[Dict]:
         """Try to parse results from the main event page"""
-        soup = self.fetch_page(EVENT_URL)
+        soup = self.fetch_page(self.event_url)
         results = []
         
         # Look for results tables or data
@@ -682,11 +656,61 @@ class MagicSpider:
         
         return results
     
+    def discover_round_count(self) -> int:
+        """Number of rounds, read from round links and headings on the event page"""
+        try:
+            soup = self.fetch_page(self.event_url)
+        except Exception as e:
+            print(f"Error fetching event page, assuming {MAX_ROUNDS} rounds: {e}")
+            return MAX_ROUNDS
+        
+        rounds = set()
+        for link in soup.find_all('a', href=True):
+            round_match = ROUND_LINK_PATTERN.search(link['href'])
+            if round_match:
+                rounds.add(int(round_match.group(1)))
+        for round_match in ROUND_TEXT_PATTERN.finditer(soup.get_text(' ')):
+            rounds.add(int(round_match.group(1)))
+        
+        return max(rounds) if rounds else MAX_ROUNDS
+    
+    def discover_draft_rounds(self) -> Set[int]:
+        """Draft rounds named on the event page, empty when it names none"""
+        try:
+            soup = self.fetch_page(self.event_url)
+        except Exception as e:
+            print(f"Error fetching event page, draft rounds unknown: {e}")
+            return set()
+        
+        rounds = set()
+        for round_match in DRAFT_ROUNDS_PATTERN.finditer(soup.get_text(' ')):
+            first = int(round_match.group(1))
+            last = int(round_match.group(2) or first)
+            rounds.update(range(first, last + 1))
+        return rounds
+    
+    def save_event_info(self):
+        """
+        Save the event's draft rounds to event.json, where the analysis reads
+        them: the ones given to the spider, else the ones saved by an earlier
+        run, else the ones named on the event page.
+        """
+        info = read_event_info(self.data_dir)
+        if self.draft_rounds:
+            info['draft_rounds'] = sorted(self.draft_rounds)
+        elif 'draft_rounds' not in info:
+            rounds = self.discover_draft_rounds()
+            if not rounds:
+                rounds = DEFAULT_DRAFT_ROUNDS
+                print(f"No draft rounds named on the event page, assuming rounds {', '.join(map(str, rounds))} "
+                      f"- pass --draft-rounds to correct them")
+            info['draft_rounds'] = sorted(rounds)
+        print(f"Draft rounds: {', '.join(map(str, info['draft_rounds']))}")
+        write_json_atomic(self.data_dir / EVENT_INFO_NAME, info)
+    
     def get_all_results(self) -> List[Dict]:
         """Get all results for all rounds"""
-        existing = []
-        if RESULTS_FILE.exists():
-            existing = json.load(open(RESULTS_FILE))
+        existing = list(iter_results(results_path(self.data_dir)))
         
         # Get existing rounds
         existing_rounds = {r['round'] for r in existing}
@@ -696,24 +720,33 @@ class MagicSpider:
         page_results = self.parse_results_from_event_page()
         if page_results:
             print(f"Found {len(page_results)} results on main page")
-            for result in page_results:
-                if result['round'] not in existing_rounds:
-                    existing.append(result)
+            new_results = [result for result in page_results if result['round'] not in existing_rounds]
+            if new_results:
+                append_results(new_results, results_path(self.data_dir))
+            existing.extend(new_results)
             existing_rounds.update({r['round'] for r in page_results})
         
-        # Try rounds 1-15 (covering all possible rounds)
+        # Try every round of the event
         all_results = existing.copy()
-        for round_num in range(1, 16):
+        rounds_to_fetch = []
+        round_count = self.discover_round_count()
+        print(f"Event has {round_count} rounds")
+        for round_num in range(1, round_count + 1):
             if round_num in existing_rounds:
                 print(f"Skipping round {round_num} (already cached)")
                 continue
-            
-            # Fetch all rounds including draft rounds
-            results = self.get_round_results(round_num)
+            rounds_to_fetch.append(round_num)
+        
+        # Fetch all rounds including draft rounds; the rate limiter keeps this polite
+        for results in self.map_concurrent(self.get_round_results, rounds_to_fetch):
+            count('rows.results', len(results))
+            # Each new round is persisted with a single append (JSON Lines) or atomic rewrite (JSON)
+            if results:
+                append_results(results, results_path(self.data_dir))
             all_results.extend(results)
-            time.sleep(1)  # Be polite
         
-        json.dump(all_results, open(RESULTS_FILE, 'w'), indent=2)
+        if not results_path(self.data_dir).exists():
+            write_json_atomic(self.results_file, [])
         return all_results
     
     def run(self):
@@ -724,13 +757,49 @@ class MagicSpider:
         print(f"Found {len(decklists)} decklists")
         
         print("\nFetching results...")
+        self.save_event_info()
         results = self.get_all_results()
         print(f"Found {len(results)} match results")
+        if self.unresolved_winners:
+            print(f"\n{len(self.unresolved_winners)} results recorded with an unresolved winner "
+                  f"(player 1 credited, winner_confidence 0):")
+            for result in self.unresolved_winners:
+                print(f"  Round {result['round']}: {result['player1']} vs {result['player2']}")
+        
+        if self.db_path:
+            from analyze import detect_special_archetypes
+            from sqlite_store import MetagameStore
+            # Stored archetypes match the ones analyze.py and import_data_dir write
+            with MetagameStore(self.db_path) as store:
+                store.import_event(self.event, detect_special_archetypes(decklists), results)
+            print(f"Saved {self.event} to {self.db_path}")
         
         print("\nSpider complete!")
 
 
 if __name__ == "__main__":
-    spider = MagicSpider()
+    parser = argparse.ArgumentParser(description="Collect decklists and results for an event from magic.gg")
+    parser.add_argument('--event', default=None,
+                        help=f"Event slug from magic.gg/events/<slug>, stored in data/<slug>/ "
+                             f"(default: {DEFAULT_EVENT} in data/)")
+    parser.add_argument('--db', type=Path, nargs='?', const=DB_FILE, default=None,
+                        help=f"Also write the event into this SQLite store (default: {DB_FILE.name} in .cache/)")
+    parser.add_argument('--draft-rounds', type=int, nargs='+', default=None,
+                        help="Rounds played in draft, left out of archetype statistics "
+                             "(default: as saved in the event's event.json, else read from the event page)")
+    parser.add_argument('--cache-ttl', type=float, default=DEFAULT_TTL,
+                        help="Seconds a cached response is used without revalidating it "
+                             f"(default: {DEFAULT_TTL}, revalidate every run)")
+    parser.add_argument('--cache-max-bytes', type=int, default=DEFAULT_MAX_BYTES,
+                        help=f"Total bytes of cached responses before the least recently used are evicted "
+                             f"(default: {DEFAULT_MAX_BYTES})")
+    args = parser.parse_args()
+    
+    cache_options = {'cache_ttl': args.cache_ttl, 'cache_max_bytes': args.cache_max_bytes}
+    if args.event:
+        spider = MagicSpider(event=args.event, data_dir=event_data_dir(args.event), db_path=args.db,
+                             draft_rounds=args.draft_rounds, **cache_options)
+    else:
+        spider = MagicSpider(db_path=args.db, draft_rounds=args.draft_rounds, **cache_options)
     spider.run()
 
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Optional SQLite store for decklists and match results.
+
+Events are kept in normalized tables (players, decklists, deck cards and
+matches) indexed on player, round, archetype and card name, so ad-hoc
+queries across many events don't need the JSON files loaded. The spider can
+write into the store and analyze.py can read from it; the 'sqlite' analysis
+engine computes the archetype and matchup counters with GROUP BY queries.
+
+The store is for querying, not speed. Copying an event into an in-memory
+store and aggregating it with the 'sqlite' engine runs about ten times
+slower than the default dict engine (benchmarks/run.py), mostly inserting
+rows; aggregating an event already in the database is about three times
+slower.
+"""
+
+import argparse
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from analyze import PlayerNameIndex, detect_special_archetypes, normalize_player_name
+from matchups import MatchupMatrix
+from storage import DATA_DIR, DB_FILE, DEFAULT_EVENT, event_data_dir, iter_decklists, iter_results, results_path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    slug TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    event_id INTEGER NOT NULL REFERENCES events(id),
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS decklists (
+    id INTEGER PRIMARY KEY,
+    event_id INTEGER NOT NULL REFERENCES events(id),
+    position INTEGER NOT NULL,
+    decklist_key TEXT NOT NULL,
+    player_id INTEGER NOT NULL REFERENCES players(id),
+    archetype TEXT NOT NULL,
+    url TEXT
+);
+CREATE TABLE IF NOT EXISTS deck_cards (
+    decklist_id INTEGER NOT NULL REFERENCES decklists(id),
+    board TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    event_id INTEGER NOT NULL REFERENCES events(id),
+    position INTEGER NOT NULL,
+    round INTEGER NOT NULL,
+    player1 TEXT NOT NULL,
+    player2 TEXT NOT NULL,
+    archetype1 TEXT NOT NULL,
+    archetype2 TEXT NOT NULL,
+    p1_wins INTEGER NOT NULL,
+    p2_wins INTEGER NOT NULL,
+    p1_games INTEGER NOT NULL,
+    p2_games INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS players_event_key ON players(event_id, name_key);
+CREATE INDEX IF NOT EXISTS players_key ON players(name_key);
+CREATE INDEX IF NOT EXISTS decklists_event ON decklists(event_id, position);
+CREATE INDEX IF NOT EXISTS decklists_player ON decklists(player_id);
+CREATE INDEX IF NOT EXISTS decklists_archetype ON decklists(archetype);
+CREATE INDEX IF NOT EXISTS deck_cards_decklist ON deck_cards(decklist_id);
+CREATE INDEX IF NOT EXISTS deck_cards_name ON deck_cards(name, count);
+CREATE INDEX IF NOT EXISTS matches_event_round ON matches(event_id, round);
+CREATE INDEX IF NOT EXISTS matches_player1 ON matches(player1);
+CREATE INDEX IF NOT EXISTS matches_player2 ON matches(player2);
+CREATE INDEX IF NOT EXISTS matches_archetypes ON matches(archetype1, archetype2);
+"""
+
+# Constructed matches of one event, numbered in result order like accumulate_results
+CONSTRUCTED_MATCHES = """
+WITH m AS (
+    SELECT row_number() OVER (ORDER BY position) - 1 AS match_id, round, trim(player1) AS player1,
+           trim(player2) AS player2, archetype1, archetype2, p1_wins, p2_wins
+    FROM matches
+    WHERE event_id = :event_id AND trim(player1) != '' AND trim(player2) != ''
+      AND round NOT IN (SELECT value FROM json_each(:skip_rounds))
+)
+"""
+
+# Each match seen from both sides. 'touch' orders the two sides the way the
+# dict engine first touches their counters: the winner first, player 1 on a draw.
+MATCH_SIDES = CONSTRUCTED_MATCHES + """,
+sides AS (
+    SELECT match_id, archetype1 AS arch, archetype2 AS opp, p1_wins AS won, p2_wins AS lost,
+           p2_wins > p1_wins AS touch
+    FROM m
+    UNION ALL
+    SELECT match_id, archetype2, archetype1, p2_wins, p1_wins, p2_wins <= p1_wins
+    FROM m
+)
+"""
+
+
+class MetagameStore:
+    """SQLite database holding the decklists and results of any number of events"""
+
+    def __init__(self, path=DB_FILE):
+        self.path = path
+        self.conn = sqlite3.connect(str(path))
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> 'MetagameStore':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def event_id(self, event: str) -> Optional[int]:
+        row = self.conn.execute("SELECT id FROM events WHERE slug = ?", (event,)).fetchone()
+        return row[0] if row else None
+
+    def delete_event(self, event: str):
+        """Remove an event and everything stored for it"""
+        event_id = self.event_id(event)
+        if event_id is None:
+            return
+        with self.conn:
+            self.conn.execute(
+                "DELETE FROM deck_cards WHERE decklist_id IN (SELECT id FROM decklists WHERE event_id = ?)",
+                (event_id,)
+            )
+            for table in ('decklists', 'players', 'matches'):
+                self.conn.execute(f"DELETE FROM {table} WHERE event_id = ?", (event_id,))
+            self.conn.execute("DELETE FROM events WHERE id = ?", (event_id,))
+
+    def import_event(self, event: str, decklists: Dict, results: Iterable[Dict],
+                     name_index: Optional[PlayerNameIndex] = None):
+        """
+        Replace an event's rows with the given decklists and results. Result
+        names are resolved to archetypes once here, so matches can be queried
+        by archetype directly.
+        """
+        if name_index is None:
+            name_index = PlayerNameIndex(decklists)
+        self.delete_event(event)
+
+        with self.conn:
+            event_id = self.conn.execute("INSERT INTO events (slug) VALUES (?)", (event,)).lastrowid
+            for position, (decklist_key, decklist) in enumerate(decklists.items()):
+                player = decklist.get('player', '')
+                player_id = self.conn.execute(
+                    "INSERT INTO players (event_id, name, name_key) VALUES (?, ?, ?)",
+                    (event_id, player, normalize_player_name(player))
+                ).lastrowid
+                decklist_id = self.conn.execute(
+                    "INSERT INTO decklists (event_id, position, decklist_key, player_id, archetype, url) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (event_id, position, decklist_key, player_id, decklist.get('archetype', 'Unknown'),
+                     decklist.get('url'))
+                ).lastrowid
+                self.conn.executemany(
+                    "INSERT INTO deck_cards (decklist_id, board, position, name, count) VALUES (?, ?, ?, ?, ?)",
+                    [(decklist_id, board, card_position, card['name'], card['count'])
+                     for board, field in (('main', 'main_deck'), ('side', 'sideboard'))
+                     for card_position, card in enumerate(decklist.get(field, []))]
+                )
+
+            rows = []
+            for position, result in enumerate(results):
+                p1_name = result.get('player1', '')
+                p2_name = result.get('player2', '')
+                rows.append((
+                    event_id, position, result.get('round', 0), p1_name, p2_name,
+                    name_index.lookup(p1_name.strip()), name_index.lookup(p2_name.strip()),
+                    result.get('p1_wins', 0), result.get('p2_wins', 0),
+                    result.get('p1_games', result.get('p1_wins', 0)), result.get('p2_games', result.get('p2_wins', 0))
+                ))
+            self.conn.executemany(
+                "INSERT INTO matches (event_id, position, round, player1, player2, archetype1, archetype2, "
+                "p1_wins, p2_wins, p1_games, p2_games) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def load_event(self, event: str) -> Tuple[Dict, List]:
+        """Decklists and results of an event, in the shapes load_data returns"""
+        event_id = self.event_id(event)
+        if event_id is None:
+            return {}, []
+
+        cards = {}
+        for decklist_id, board, name, count in self.conn.execute(
+                "SELECT deck_cards.decklist_id, board, name, count FROM deck_cards "
+                "JOIN decklists ON decklists.id = deck_cards.decklist_id "
+                "WHERE decklists.event_id = ? ORDER BY deck_cards.decklist_id, board, deck_cards.position",
+                (event_id,)):
+            cards.setdefault((decklist_id, board), []).append({'count': count, 'name': name})
+
+        decklists = {}
+        for decklist_id, decklist_key, player, archetype, url in self.conn.execute(
+                "SELECT decklists.id, decklist_key, players.name, archetype, url FROM decklists "
+                "JOIN players ON players.id = decklists.player_id "
+                "WHERE decklists.event_id = ? ORDER BY decklists.position",
+                (event_id,)):
+            decklists[decklist_key] = {
+                'player': player,
+                'archetype': archetype,
+                'url': url,
+                'main_deck': cards.get((decklist_id, 'main'), []),
+                'sideboard': cards.get((decklist_id, 'side'), [])
+            }
+
+        results = [
+            {
+                'round': round_num,
+                'player1': player1,
+                'player2': player2,
+                'p1_wins': p1_wins,
+                'p2_wins': p2_wins,
+                'p1_games': p1_games,
+                'p2_games': p2_games
+            }
+            for round_num, player1, player2, p1_wins, p2_wins, p1_games, p2_games in self.conn.execute(
+                "SELECT round, player1, player2, p1_wins, p2_wins, p1_games, p2_games FROM matches "
+                "WHERE event_id = ? ORDER BY position",
+                (event_id,)
+            )
+        ]
+        return decklists, results
+
+    def aggregate(self, event: str, skip_rounds: Iterable[int]) -> Tuple[Dict, MatchupMatrix, List[Dict]]:
+        """
+        Compute per-archetype and directed matchup counters with GROUP BY
+        queries, leaving out the event's skip_rounds (its draft rounds).
+        Returns (match_stats, matchups, match_table) with the same contents
+        and order as analyze.accumulate_results.
+        """
+        params = {'event_id': self.event_id(event), 'skip_rounds': f"[{','.join(map(str, sorted(skip_rounds)))}]"}
+
+        match_table = [
+            {
+                'round': round_num,
+                'player1': player1,
+                'player2': player2,
+                'archetype1': arch1,
+                'archetype2': arch2,
+                'p1_wins': p1_wins,
+                'p2_wins': p2_wins
+            }
+            for round_num, player1, player2, arch1, arch2, p1_wins, p2_wins in self.conn.execute(
+                CONSTRUCTED_MATCHES + "SELECT round, player1, player2, archetype1, archetype2, p1_wins, p2_wins "
+                                      "FROM m ORDER BY match_id",
+                params
+            )
+        ]
+
+        # Match ids per archetype and per directed pair, mirrors listed twice
+        arch_matches = {}
+        pair_matches = {}
+        for arch, opp, match_id in self.conn.execute(
+                MATCH_SIDES + "SELECT arch, opp, match_id FROM sides ORDER BY match_id", params):
+            arch_matches.setdefault(arch, []).append(match_id)
+            pair_matches.setdefault((arch, opp), []).append(match_id)
+
+        # Mirror wins and losses don't count for the archetype, mirror draws do
+        match_stats = {}
+        for arch, wins, losses, draws, games_won, games_lost in self.conn.execute(
+                MATCH_SIDES + """
+                SELECT arch, SUM(won > lost AND arch != opp), SUM(lost > won AND arch != opp),
+                       SUM(won = lost), SUM(won), SUM(lost)
+                FROM sides GROUP BY arch ORDER BY MIN(match_id * 2 + touch)
+                """, params):
+            match_stats[arch] = {
+                'wins': wins,
+                'losses': losses,
+                'draws': draws,
+                'games_won': games_won,
+                'games_lost': games_lost,
+                'matches': arch_matches[arch]
+            }
+
+        matchups = MatchupMatrix()
+        for arch, opp, *counters in self.conn.execute(
+                MATCH_SIDES + """
+                SELECT arch, opp, SUM(won > lost), SUM(lost > won), SUM(won = lost), SUM(won), SUM(lost)
+                FROM sides GROUP BY arch, opp ORDER BY MIN(match_id * 2 + touch)
+                """, params):
+            matchups.add_pair(arch, opp, counters, pair_matches[(arch, opp)])
+
+        return match_stats, matchups, match_table
+
+    def decks_with_card(self, card: str, min_copies: int = 1, board: Optional[str] = None,
+                        event: Optional[str] = None) -> List[Dict]:
+        """Decks playing at least min_copies of a card (in 'main', 'side' or either board)"""
+        query = (
+            "SELECT events.slug, players.name, decklists.archetype, SUM(deck_cards.count) AS copies "
+            "FROM deck_cards "
+            "JOIN decklists ON decklists.id = deck_cards.decklist_id "
+            "JOIN players ON players.id = decklists.player_id "
+            "JOIN events ON events.id = decklists.event_id "
+            "WHERE deck_cards.name = ?"
+        )
+        params = [card]
+        if board:
+            query += " AND deck_cards.board = ?"
+            params.append(board)
+        if event:
+            query += " AND events.slug = ?"
+            params.append(event)
+        query += " GROUP BY deck_cards.decklist_id HAVING copies >= ? ORDER BY copies DESC, players.name"
+        params.append(min_copies)
+        return [
+            {'event': slug, 'player': player, 'archetype': archetype, 'copies': copies}
+            for slug, player, archetype, copies in self.conn.execute(query, params)
+        ]
+
+
+def import_data_dir(store: MetagameStore, event: str, data_dir: Path) -> Tuple[int, int]:
+    """Import an event's decklists.json and results into the store"""
+    decklists = detect_special_archetypes(dict(iter_decklists(Path(data_dir) / "decklists.json")))
+    results = list(iter_results(results_path(data_dir)))
+    store.import_event(event, decklists, results)
+    return len(decklists), len(results)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Import events into the SQLite store and query it")
+    parser.add_argument('--db', type=Path, default=DB_FILE, help=f"Database file (default: {DB_FILE})")
+    commands = parser.add_subparsers(dest='command', required=True)
+    import_parser = commands.add_parser('import', help="Import an event's JSON files")
+    import_parser.add_argument('--event', default=None,
+                               help=f"Event slug, read from data/<slug>/ (default: {DEFAULT_EVENT} in data/)")
+    card_parser = commands.add_parser('card', help="List decks playing a card")
+    card_parser.add_argument('name')
+    card_parser.add_argument('--min-copies', type=int, default=1)
+    card_parser.add_argument('--board', choices=('main', 'side'), default=None)
+    card_parser.add_argument('--event', default=None)
+    args = parser.parse_args()
+
+    with MetagameStore(args.db) as store:
+        if args.command == 'import':
+            event = args.event or DEFAULT_EVENT
+            decklist_count, result_count = import_data_dir(
+                store, event, event_data_dir(args.event) if args.event else DATA_DIR
+            )
+            print(f"Imported {decklist_count} decklists and {result_count} results for {event} into {args.db}")
+        else:
+            decks = store.decks_with_card(args.name, args.min_copies, args.board, args.event)
+            for deck in decks:
+                print(f"  {deck['copies']}x  {deck['player']} ({deck['archetype']}, {deck['event']})")
+            print(f"{len(decks)} decks with at least {args.min_copies} {args.name}")
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Streaming persistence for data/*.json: iterative readers, atomic writes and
+append-only JSON Lines storage for match results.
+
+The dashboard's event lives directly in data/; other events are partitioned
+into data/<event>/ with the same file names.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+# Data directory relative to project root
+DATA_DIR = Path(__file__).parent.parent / "data"
+DECKLISTS_FILE = DATA_DIR / "decklists.json"
+RESULTS_FILE = DATA_DIR / "results.json"
+RESULTS_JSONL_FILE = DATA_DIR / "results.jsonl"
+# Working files kept out of data/, which the dashboard build publishes as is
+CACHE_DIR = Path(__file__).parent.parent / ".cache"
+# Optional SQLite store (see sqlite_store.py)
+DB_FILE = CACHE_DIR / "metagame.db"
+# Outputs of analyze.py and card_db.py, published for the dashboard by publish.py
+ANALYSIS_FILE = DATA_DIR / "analysis.json"
+CARDS_FILE = DATA_DIR / "cards.json"
+PLAYERS_FILE = DATA_DIR / "players.json"
+CARD_INDEX_FILE = DATA_DIR / "card_index.json"
+DECKLISTS_NAME = DECKLISTS_FILE.name
+RESULTS_NAME = RESULTS_FILE.name
+RESULTS_JSONL_NAME = RESULTS_JSONL_FILE.name
+# Event shown on the dashboard, stored directly in data/
+DEFAULT_EVENT = "magic-world-championship-31"
+# Per-event settings next to an event's data, written by the spider
+EVENT_INFO_NAME = "event.json"
+# Draft rounds of the World Championship format, for events without their own event.json
+DEFAULT_DRAFT_ROUNDS = (1, 2, 3, 8, 9, 10)
+
+CHUNK_SIZE = 64 * 1024
+WHITESPACE = ' \t\n\r'
+
+_decoder = json.JSONDecoder()
+
+
+class _JSONStream:
+    """Chunked reader that decodes one JSON value at a time from a file"""
+
+    def __init__(self, path: Path, chunk_size: int = CHUNK_SIZE):
+        self.file = open(path, encoding='utf-8')
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def close(self):
+        self.file.close()
+
+    def _fill(self) -> bool:
+        """Read another chunk, discarding consumed input. Returns False at EOF."""
+        if self.eof:
+            return False
+        chunk = self.file.read(self.chunk_size)
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        if not chunk:
+            self.eof = True
+        return bool(chunk)
+
+    def peek(self, skip: str = WHITESPACE) -> str:
+        """Skip the given characters and return the next one ('' at EOF)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in skip:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ''
+
+    def expect(self, char: str, skip: str = WHITESPACE):
+        found = self.peek(skip)
+        if found != char:
+            raise ValueError(f"Expected {char!r} in {self.file.name}, found {found!r}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete value, reading more input as needed"""
+        while True:
+            try:
+                value, end = _decoder.raw_decode(self.buffer, self.pos)
+                # A value that ends exactly at the buffer edge (e.g. a number) may be truncated
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self._fill()
+
+
+def iter_json_array(path: Path) -> Iterator:
+    """Yield the items of a top-level JSON array without loading the whole file"""
+    stream = _JSONStream(path)
+    try:
+        stream.expect('[')
+        if stream.peek() == ']':
+            return
+        while True:
+            stream.peek()
+            yield stream.value()
+            if stream.peek() == ']':
+                return
+            stream.expect(',')
+    finally:
+        stream.close()
+
+
+def iter_json_object(path: Path) -> Iterator[Tuple[str, object]]:
+    """Yield the (key, value) pairs of a top-level JSON object without loading the whole file"""
+    stream = _JSONStream(path)
+    try:
+        stream.expect('{')
+        if stream.peek() == '}':
+            return
+        while True:
+            stream.peek()
+            key = stream.value()
+            stream.expect(':')
+            stream.peek()
+            yield key, stream.value()
+            if stream.peek() == '}':
+                return
+            stream.expect(',')
+    finally:
+        stream.close()
+
+
+def iter_json_lines(path: Path) -> Iterator:
+    """Yield one value per line of a JSON Lines file, ignoring a torn final line"""
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            if not line.endswith('\n'):
+                # Interrupted append - the record was never committed
+                break
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def read_json_lines(path: Path) -> List:
+    """
+    Every value of a JSON Lines file, ignoring a torn final line. The lines
+    are decoded as one array, which is faster than iter_json_lines when the
+    whole file is needed at once.
+    """
+    text = Path(path).read_text(encoding='utf-8')
+    # Anything after the last newline is an interrupted append
+    lines = [line for line in text[:text.rfind('\n') + 1].splitlines() if line.strip()]
+    return json.loads('[' + ','.join(lines) + ']')
+
+
+def event_data_dir(event: str) -> Path:
+    """Data directory of an event: data/ for the dashboard's event, otherwise its data/<event>/ partition"""
+    return DATA_DIR if event == DEFAULT_EVENT else DATA_DIR / event
+
+
+def event_cache_dir(event: str) -> Path:
+    """Directory under .cache/ for an event's working files (incremental state, season counters)"""
+    return CACHE_DIR / "events" / event
+
+
+def iter_events(data_dir: Path = DATA_DIR) -> Iterator[str]:
+    """Slugs of the events stored under data_dir: the dashboard's event, then the partitions in name order"""
+    if (Path(data_dir) / DECKLISTS_NAME).exists():
+        yield DEFAULT_EVENT
+    for path in sorted(Path(data_dir).iterdir()):
+        if path.is_dir() and (path / DECKLISTS_NAME).exists():
+            yield path.name
+
+
+def read_event_info(data_dir: Path = DATA_DIR) -> Dict:
+    """Settings saved in an event's event.json, empty when there are none"""
+    path = Path(data_dir) / EVENT_INFO_NAME
+    return json.load(open(path)) if path.exists() else {}
+
+
+def event_draft_rounds(data_dir: Path = DATA_DIR) -> Set[int]:
+    """Rounds of an event played in draft, which don't count toward archetype statistics"""
+    return set(read_event_info(data_dir).get('draft_rounds', DEFAULT_DRAFT_ROUNDS))
+
+
+def results_path(data_dir: Path = DATA_DIR) -> Path:
+    """Results store in use: the JSON Lines file once it exists, otherwise results.json"""
+    jsonl_path = Path(data_dir) / RESULTS_JSONL_NAME
+    return jsonl_path if jsonl_path.exists() else Path(data_dir) / RESULTS_NAME
+
+
+def iter_results(path: Path = None) -> Iterator[Dict]:
+    """Stream match results from results.json or results.jsonl"""
+    path = Path(path) if path else results_path()
+    if not path.exists():
+        return iter(())
+    if path.suffix == '.jsonl':
+        return iter_json_lines(path)
+    return iter_json_array(path)
+
+
+def iter_decklists(path: Path = DECKLISTS_FILE) -> Iterator[Tuple[str, Dict]]:
+    """Stream (key, decklist) pairs from decklists.json"""
+    if not Path(path).exists():
+        return iter(())
+    return iter_json_object(path)
+
+
+def write_json_atomic(path: Path, data, indent: Optional[int] = 2,
+                      separators: Optional[Tuple[str, str]] = None):
+    """Write JSON to a temporary file and rename it over path"""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        # Without indent, one dumps call runs the C encoder; json.dump and indented output never do
+        f.write(json.dumps(data, indent=indent, separators=separators))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def append_json_lines(path: Path, records: Iterable[Dict]):
+    """
+    Append records to a JSON Lines file with a single write. Readers ignore a
+    torn final line, so an interrupted append never yields partial records.
+    """
+    payload = ''.join(json.dumps(record, separators=(',', ':')) + '\n' for record in records)
+    if not payload:
+        return
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        # Drop a torn line left by an earlier interrupted append
+        size = os.fstat(fd).st_size
+        if size:
+            with open(path, 'rb') as f:
+                f.seek(size - 1)
+                if f.read(1) != b'\n':
+                    os.ftruncate(fd, _last_line_end(path))
+        os.write(fd, payload.encode('utf-8'))
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _last_line_end(path: Path) -> int:
+    """Offset just past the last newline in a file (0 if there is none)"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        while end > 0:
+            start = max(0, end - CHUNK_SIZE)
+            f.seek(start)
+            chunk = f.read(end - start)
+            newline = chunk.rfind(b'\n')
+            if newline >= 0:
+                return start + newline + 1
+            end = start
+    return 0
+
+
+def append_results(results: List[Dict], path: Path = None):
+    """Persist new match results: one append for JSON Lines, an atomic rewrite for JSON"""
+    path = Path(path) if path else results_path()
+    if path.suffix == '.jsonl':
+        append_json_lines(path, results)
+    else:
+        write_json_atomic(path, list(iter_results(path)) + list(results))
+
+
+def convert_results_to_jsonl(source: Path = RESULTS_FILE, target: Path = RESULTS_JSONL_FILE):
+    """Migrate results.json to the append-only JSON Lines store"""
+    target = Path(target)
+    tmp_path = target.with_name(target.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for record in iter_results(source):
+            f.write(json.dumps(record, separators=(',', ':')) + '\n')
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, target)
+
+
+if __name__ == "__main__":
+    convert_results_to_jsonl()
+    print(f"Converted {RESULTS_FILE} to {RESULTS_JSONL_FILE}")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Confidence intervals for archetype and matchup win rates.
+
+Win rates count decisive matches only, so a group's matches are n
+independent win/loss outcomes with w wins. Wilson score intervals are
+computed in plain Python. Resampling a group's matches with replacement
+gives a win count distributed Binomial(n, w / n), which lets every
+bootstrap resample of every group be drawn as one (groups, resamples)
+NumPy array instead of indexing the match table in a Python loop; only the
+bootstrap needs numpy.
+"""
+
+from math import sqrt
+from statistics import NormalDist
+from typing import Dict, List, Tuple
+
+# Resamples per group when bootstrap intervals are requested, and interval coverage
+BOOTSTRAP_RESAMPLES = 10000
+CONFIDENCE = 0.95
+# Decimal places kept in the emitted bounds
+PRECISION = 4
+
+
+def z_score(confidence: float) -> float:
+    """Two-sided standard normal quantile for a confidence level"""
+    if not 0 < confidence < 1:
+        raise ValueError(f"Confidence must be between 0 and 1, got {confidence}")
+    return NormalDist().inv_cdf((1 + confidence) / 2)
+
+
+def wilson_interval(wins: int, total: int, z: float) -> Tuple[float, float]:
+    """Wilson score interval of a wins/total rate at a z score; (0, 1) when total is 0"""
+    if not total:
+        return 0.0, 1.0
+    rate = wins / total
+    denominator = 1 + z * z / total
+    center = (rate + z * z / (2 * total)) / denominator
+    margin = z * sqrt(rate * (1 - rate) / total + z * z / (4 * total * total)) / denominator
+    return max(center - margin, 0.0), min(center + margin, 1.0)
+
+
+def wilson_intervals(wins: List[int], totals: List[int], confidence: float = CONFIDENCE) -> List[Tuple[float, float]]:
+    """Wilson score interval of each wins/totals rate"""
+    z = z_score(confidence)
+    return [wilson_interval(group_wins, total, z) for group_wins, total in zip(wins, totals)]
+
+
+def bootstrap_intervals(wins: List[int], totals: List[int], resamples: int = BOOTSTRAP_RESAMPLES,
+                        confidence: float = CONFIDENCE, seed: int = 0) -> List[Tuple[float, float]]:
+    """Percentile bootstrap interval of each wins/totals rate; (0, 1) where totals is 0. Requires numpy."""
+    import numpy as np
+
+    wins = np.asarray(wins, dtype=np.int64)
+    totals = np.asarray(totals, dtype=np.int64)
+    intervals = np.tile([0.0, 1.0], (len(totals), 1))
+    played = totals > 0
+    if not played.any():
+        return [tuple(interval) for interval in intervals.tolist()]
+
+    rng = np.random.default_rng(seed)
+    n = totals[played]
+    resampled_wins = rng.binomial(n[:, None], (wins[played] / n)[:, None], size=(len(n), resamples))
+
+    # Resampled win counts are integers in [0, n], so percentiles come from
+    # each group's cumulative count histogram rather than sorting the resamples
+    width = int(n.max()) + 1
+    offsets = np.arange(len(n))[:, None] * width
+    histogram = np.bincount((resampled_wins + offsets).ravel(), minlength=len(n) * width).reshape(len(n), width)
+    cdf = np.cumsum(histogram, axis=1) / resamples
+    tail = (1 - confidence) / 2
+    lower = np.argmax(cdf > tail, axis=1)
+    upper = np.argmax(cdf >= 1 - tail, axis=1)
+    intervals[played] = np.column_stack([lower / n, upper / n])
+    return [tuple(interval) for interval in intervals.tolist()]
+
+
+def add_confidence_intervals(archetype_stats: Dict, matchup_summary: Dict, matchup_matrix: Dict,
+                             resamples: int = 0, confidence: float = CONFIDENCE, seed: int = 0):
+    """
+    Add Wilson intervals next to the win rates, in place: 'win_rate_wilson'
+    on archetype stats, 'arch1_win_rate_wilson' (and arch2_*) on matchups,
+    and a 'win_rate_wilson' matrix of [low, high] cells for the row
+    archetype on the matchup matrix (MatchupMatrix.to_json). With resamples,
+    '*_bootstrap' intervals are added as well, every group resampled in a
+    single batch.
+
+    Matchup counts come from the directed matrix, since the summaries add
+    up both directions. A mirror is 50% by construction (each match is a
+    win for one side and a loss for the other), so its interval is [0.5, 0.5].
+    Entries that already carry Wilson intervals, reused from an earlier
+    incremental summary, keep them.
+    """
+    ids = {archetype: i for i, archetype in enumerate(matchup_matrix['archetypes'])}
+    matrix_wins = matchup_matrix['wins']
+    matrix_losses = matchup_matrix['losses']
+    mirror = [0.5, 0.5]
+
+    groups: List[Tuple[Dict, str, int, int]] = []
+    for stats in archetype_stats.values():
+        groups.append((stats, 'win_rate', stats['wins'], stats['wins'] + stats['losses']))
+    for matchup in matchup_summary.values():
+        arch1, arch2 = ids[matchup['archetype1']], ids[matchup['archetype2']]
+        if arch1 == arch2:
+            for method in ('wilson', 'bootstrap') if resamples else ('wilson',):
+                for side in ('arch1', 'arch2'):
+                    matchup[f'{side}_win_rate_{method}'] = list(mirror)
+            continue
+        wins = matrix_wins[arch1][arch2]
+        groups.append((matchup, 'arch1_win_rate', wins, wins + matrix_losses[arch1][arch2]))
+
+    z = z_score(confidence)
+    cells = []
+    for row, (wins_row, losses_row) in enumerate(zip(matrix_wins, matrix_losses)):
+        cells.append([_bounds(*wilson_interval(wins, wins + losses, z)) for wins, losses in zip(wins_row, losses_row)])
+        cells[row][row] = list(mirror)
+    matchup_matrix['win_rate_wilson'] = cells
+
+    batches = {'wilson': [group for group in groups if f'{group[1]}_wilson' not in group[0]]}
+    if resamples:
+        # Every group is resampled, as each group's draws depend on the whole batch
+        batches['bootstrap'] = groups
+
+    for method, batch in batches.items():
+        if not batch:
+            continue
+        wins = [group[2] for group in batch]
+        totals = [group[3] for group in batch]
+        if method == 'wilson':
+            method_intervals = wilson_intervals(wins, totals, confidence)
+        else:
+            method_intervals = bootstrap_intervals(wins, totals, resamples, confidence, seed)
+        for (entry, field, _, _), (low, high) in zip(batch, method_intervals):
+            entry[f'{field}_{method}'] = _bounds(low, high)
+            if field == 'arch1_win_rate':
+                # arch2's rate is 1 - arch1's, so its interval is the mirror image
+                entry[f'arch2_win_rate_{method}'] = _bounds(1 - high, 1 - low)
+
+
+def _bounds(low: float, high: float) -> List[float]:
+    return [round(low, PRECISION), round(high, PRECISION)]
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Watch a live event and keep the dashboard data current.
+
+Polls the event page, the decklist index pages and the next round's results
+page, comparing content hashes with the previous poll. Only pages that
+changed are parsed; new results trigger an incremental re-analysis and a
+republish, which rewrites only the bundles whose content changed. The poll
+interval backs off while nothing changes and resets when something does.
+"""
+
+import argparse
+import hashlib
+import time
+from typing import Dict, List, Optional
+
+from analyze import main as analyze_main
+from card_db import CARD_DUMP_FILE, build_card_index
+from instrumentation import count, timed
+from publish import main as publish_main
+from spider import MagicSpider
+from storage import append_results, iter_decklists, iter_results, results_path
+
+# Seconds between polls: the first poll after a change, and the backed-off ceiling
+MIN_INTERVAL = 30
+MAX_INTERVAL = 600
+BACKOFF = 2
+
+
+class EventWatcher:
+    """Detects changed event pages by content hash and fetches only what changed"""
+
+    def __init__(self, spider: MagicSpider):
+        self.spider = spider
+        self.hashes: Dict[str, str] = {}
+        self.round_count: Optional[int] = None
+        self.index_pages: List[str] = []
+
+    def page_changed(self, url: str) -> bool:
+        """Fetch a page (revalidated through the response cache) and compare its hash to the last poll"""
+        try:
+            content = self.spider.fetch_content(url)
+        except Exception:
+            # Not posted yet
+            return False
+        digest = hashlib.sha256(content).hexdigest()
+        if self.hashes.get(url) == digest:
+            return False
+        self.hashes[url] = digest
+        self.spider.forget_page(url)
+        count('watch.changed_pages')
+        return True
+
+    def poll_decklists(self, event_changed: bool) -> bool:
+        """Parse decklist index pages that changed, returning whether new decklists were saved"""
+        if event_changed or not self.index_pages:
+            self.index_pages = self.spider.find_decklist_index_pages()
+        changed = [url for url in self.index_pages if self.page_changed(url)]
+        if not changed:
+            return False
+        known = sum(1 for _ in iter_decklists(self.spider.decklists_file))
+        return len(self.spider.get_all_decklists(changed)) > known
+
+    def poll_results(self, event_changed: bool) -> bool:
+        """
+        Fetch results for rounds not stored yet, in order, stopping at the
+        first round whose results page isn't posted (or hasn't changed).
+        """
+        if event_changed or self.round_count is None:
+            self.round_count = self.spider.discover_round_count()
+
+        results_file = results_path(self.spider.data_dir)
+        stored_rounds = {result['round'] for result in iter_results(results_file)}
+        found_new = False
+        for round_num in range(1, self.round_count + 1):
+            if round_num in stored_rounds:
+                continue
+            if not self.page_changed(self.spider.round_results_url(round_num)):
+                break
+            results = self.spider.get_round_results(round_num)
+            if not results:
+                break
+            append_results(results, results_path(self.spider.data_dir))
+            print(f"Round {round_num}: stored {len(results)} results")
+            found_new = True
+        return found_new
+
+    def poll(self) -> Dict[str, bool]:
+        """One poll of the event; reports which inputs changed"""
+        event_changed = self.page_changed(self.spider.event_url)
+        return {
+            'decklists': self.poll_decklists(event_changed),
+            'results': self.poll_results(event_changed)
+        }
+
+
+def refresh(changes: Dict[str, bool]):
+    """Re-analyze and republish after a change"""
+    if changes['decklists'] and CARD_DUMP_FILE.exists():
+        with timed('step.card_index'):
+            build_card_index()
+    with timed('step.analyze'):
+        analyze_main(incremental=True)
+    with timed('step.publish'):
+        publish_main()
+
+
+def watch(min_interval: float = MIN_INTERVAL, max_interval: float = MAX_INTERVAL, once: bool = False):
+    """Poll the dashboard's event until interrupted"""
+    watcher = EventWatcher(MagicSpider())
+    interval = min_interval
+    # Changes not yet refreshed; kept after a failed refresh so the next poll retries it
+    pending: Dict[str, bool] = {}
+    while True:
+        started = time.time()
+        try:
+            with timed('watch.poll'):
+                changes = watcher.poll()
+        except Exception as e:
+            print(f"Error polling the event: {e}")
+            changes = {}
+        for name, changed in changes.items():
+            pending[name] = pending.get(name, False) or changed
+        if any(pending.values()):
+            changed = ', '.join(name for name, value in pending.items() if value)
+            print(f"\n[{time.strftime('%H:%M:%S')}] New {changed} - refreshing dashboard data")
+            try:
+                refresh(pending)
+            except Exception as e:
+                print(f"Error refreshing dashboard data, retrying after the next poll: {e}")
+            else:
+                print(f"Dashboard data updated {time.time() - started:.1f}s after the poll started")
+                pending = {}
+                interval = min_interval
+        else:
+            interval = min(interval * BACKOFF, max_interval)
+            print(f"[{time.strftime('%H:%M:%S')}] No changes, next poll in {interval:.0f}s")
+
+        if once:
+            return
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Watch the live event and refresh the dashboard data as results post")
+    parser.add_argument('--min-interval', type=float, default=MIN_INTERVAL,
+                        help="Seconds between polls after a change")
+    parser.add_argument('--max-interval', type=float, default=MAX_INTERVAL,
+                        help="Longest wait between polls while nothing changes")
+    parser.add_argument('--once', action='store_true', help="Poll once and exit")
+    args = parser.parse_args()
+    try:
+        watch(args.min_interval, args.max_interval, args.once)
+    except KeyboardInterrupt:
+        print("\nStopped watching")
@@ -8,6 +8,7 @@ import { ErrorPage } from '@pages/ErrorPage'
 import { LoadingPage } from '@pages/LoadingPage'
 import { PlayerDetailPage } from '@pages/PlayerDetailPage'
 import type { AnalysisData } from '@/types'
+import { fetchBundle } from '@/utils/dataBundles'
 
 // Create context for sharing data across routes
 const DataContext = createContext<AnalysisData | null>(null)
@@ -66,13 +67,11 @@ function AppContent() {
     try {
       setLoading(true)
       setError(null)
-      const response = await fetch('/analysis.json')
-      if (!response.ok) {
+      const analysisData = await fetchBundle<AnalysisData>('analysis', '/analysis.json').catch(() => {
         throw new Error(
           "Failed to load analysis data. Make sure you've run the spider and analysis scripts first."
         )
-      }
-      const analysisData: AnalysisData = await response.json()
+      })
       setData(analysisData)
     } catch (err) {
       setError(err instanceof Error ? err.message : 'Unknown error occurred')
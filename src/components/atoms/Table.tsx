@@ -113,6 +113,7 @@ export function TableCell({
   left,
   zIndex,
   minWidth,
+  title,
 }: TableProps & {
   colSpan?: number
   textAlign?: 'left' | 'center' | 'right'
@@ -126,6 +127,7 @@ export function TableCell({
   left?: string
   zIndex?: number
   minWidth?: string
+  title?: string
 }) {
   const paddingClasses = padding
     ? padding === 'none'
@@ -182,7 +184,7 @@ export function TableCell({
   const backgroundClass = (sticky && background === 'gradient-dark') ? '' : backgroundClasses[background]
 
   return (
-    <td colSpan={colSpan} className={`${paddingClasses} ${textAlignClasses} ${textColorClasses} ${backgroundClass} ${borderClass} ${cursorClass} ${hoverClass} ${stickyClass} ${className}`} style={style}>
+    <td colSpan={colSpan} className={`${paddingClasses} ${textAlignClasses} ${textColorClasses} ${backgroundClass} ${borderClass} ${cursorClass} ${hoverClass} ${stickyClass} ${className}`} style={style} title={title}>
       {children}
     </td>
   )
@@ -4,6 +4,7 @@ import * as Tooltip from '@radix-ui/react-tooltip'
 import { Box } from '@atoms/Box'
 import { Image } from '@atoms/Image'
 import { Text } from '@atoms/Text'
+import { fetchCardImage } from '@/utils/scryfall'
 
 interface CardTooltipProps {
   cardName: string
@@ -18,15 +19,9 @@ function CardTooltip({ cardName, children }: CardTooltipProps) {
     (newOpen: boolean) => {
       if (newOpen && !imageUrl && !loading) {
         setLoading(true)
-        const searchName = cardName.replace(/\/\/.*$/, '').trim()
-        fetch(`https://api.scryfall.com/cards/named?fuzzy=${encodeURIComponent(searchName)}`)
-          .then(res => res.json())
-          .then(data => {
-            if (data.image_uris && data.image_uris.normal) {
-              setImageUrl(data.image_uris.normal)
-            } else if (data.card_faces && data.card_faces[0]?.image_uris?.normal) {
-              setImageUrl(data.card_faces[0].image_uris.normal)
-            }
+        fetchCardImage(cardName)
+          .then(url => {
+            setImageUrl(url)
             setLoading(false)
           })
           .catch(() => setLoading(false))
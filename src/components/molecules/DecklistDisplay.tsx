@@ -21,7 +21,7 @@ export function DecklistDisplay({ decklist }: DecklistDisplayProps) {
   const [cardTypes, setCardTypes] = useState<Record<string, string>>({})
   const [copied, setCopied] = useState(false)
 
-  // Fetch card types from Scryfall when decklist is loaded
+  // Resolve card types from the local card index (Scryfall for any it lacks) when decklist is loaded
   useEffect(() => {
     if (!decklist?.main_deck || decklist.main_deck.length === 0) return
 
@@ -7,24 +7,11 @@ import { SortIcon } from '@atoms/SortIcon'
 import { Table, TableHead, TableBody, TableRow, TableHeader, TableCell } from '@atoms/Table'
 import { Text } from '@atoms/Text'
 import { EmptyState } from '@molecules/EmptyState'
-
-interface MatchResult {
-  round: number
-  player1: string
-  player2: string
-  p1_wins: number
-  p2_wins: number
-}
-
-interface DecklistData {
-  player: string
-  archetype: string
-}
+import type { MatchInfo } from '@/types'
 
 interface MatchesTableProps {
-  matches: MatchResult[]
+  matches: MatchInfo[]
   currentPlayerName: string
-  decklists: Record<string, DecklistData>
   normalizePlayerName: (name: string) => string
   draftRounds: Set<number>
 }
@@ -35,7 +22,6 @@ type SortDirection = 'asc' | 'desc'
 export function MatchesTable({
   matches,
   currentPlayerName,
-  decklists,
   normalizePlayerName,
   draftRounds,
 }: MatchesTableProps) {
@@ -55,19 +41,8 @@ export function MatchesTable({
       const aOpponentWins = aIsPlayer1 ? a.p2_wins : a.p1_wins
       const bOpponentWins = bIsPlayer1 ? b.p2_wins : b.p1_wins
 
-      // Try to find opponent archetypes
-      const aOpponentNormalized = normalizePlayerName(aOpponent)
-      const bOpponentNormalized = normalizePlayerName(bOpponent)
-      let aOpponentArchetype = 'Unknown'
-      let bOpponentArchetype = 'Unknown'
-      for (const dl of Object.values(decklists)) {
-        if (normalizePlayerName(dl.player) === aOpponentNormalized) {
-          aOpponentArchetype = dl.archetype
-        }
-        if (normalizePlayerName(dl.player) === bOpponentNormalized) {
-          bOpponentArchetype = dl.archetype
-        }
-      }
+      const aOpponentArchetype = aIsPlayer1 ? a.archetype2 : a.archetype1
+      const bOpponentArchetype = bIsPlayer1 ? b.archetype2 : b.archetype1
 
       let comparison = 0
       switch (sortColumn) {
@@ -88,7 +63,7 @@ export function MatchesTable({
       return sortDirection === 'asc' ? comparison : -comparison
     })
     return sorted
-  }, [matches, normalizedPlayerName, decklists, sortColumn, sortDirection, normalizePlayerName])
+  }, [matches, normalizedPlayerName, sortColumn, sortDirection, normalizePlayerName])
 
   const handleSort = (column: SortColumn) => {
     if (sortColumn === column) {
@@ -158,7 +133,7 @@ export function MatchesTable({
           {sortedMatches.length === 0 ? (
             <EmptyState message="No matches found" colSpan={4} />
           ) : (
-            sortedMatches.map((match: MatchResult, idx: number) => {
+            sortedMatches.map((match: MatchInfo, idx: number) => {
               const aIsPlayer1 = normalizePlayerName(match.player1) === normalizedPlayerName
               const opponent = aIsPlayer1 ? match.player2 : match.player1
               const playerWins = aIsPlayer1 ? match.p1_wins : match.p2_wins
@@ -167,21 +142,8 @@ export function MatchesTable({
               const draw = playerWins === opponentWins
               const isDraft = draftRounds.has(match.round)
 
-              // Try to find opponent's decklist using normalized matching
-              let opponentDecklist: DecklistData | undefined
-              const opponentNormalized = normalizePlayerName(opponent)
-              // First try direct lookup
-              opponentDecklist = decklists[opponent]
-              // If not found, try normalized lookup
-              if (!opponentDecklist) {
-                for (const dl of Object.values(decklists)) {
-                  if (normalizePlayerName(dl.player) === opponentNormalized) {
-                    opponentDecklist = dl
-                    break
-                  }
-                }
-              }
-              const opponentArchetype = opponentDecklist?.archetype || 'Unknown'
+              // Archetypes are resolved by the analysis pipeline
+              const opponentArchetype = aIsPlayer1 ? match.archetype2 : match.archetype1
 
               // Determine result badge variant
               let resultVariant: 'success' | 'warning' | 'danger' = 'danger'
@@ -1,4 +1,4 @@
-import { useState, useEffect, useMemo } from 'react'
+import { useState, useMemo } from 'react'
 import { useParams } from 'react-router-dom'
 
 import { Box } from '@atoms/Box'
@@ -16,8 +16,9 @@ import { PageHeader } from '@molecules/PageHeader'
 import { StatDisplay } from '@molecules/StatDisplay'
 import { EmptyState } from '@molecules/EmptyState'
 import { LoadingState } from '@molecules/LoadingState'
-import { normalizePlayerName } from '@/utils/playerName'
-import { DRAFT_ROUNDS } from '@/utils/constants'
+import { useCards } from '@/hooks/useCards'
+import { usePlayers } from '@/hooks/usePlayers'
+import { archetypeCardsBundle, archetypePlayersBundle } from '@/utils/dataBundles'
 import type { AnalysisData } from '@/types'
 
 interface ArchetypeDetailProps {
@@ -35,21 +36,6 @@ interface PlayerData {
   totalMatches: number
 }
 
-interface MatchResult {
-  round: number
-  player1: string
-  player2: string
-  p1_wins: number
-  p2_wins: number
-}
-
-interface DecklistData {
-  player: string
-  archetype: string
-  main_deck?: Array<{ count: number; name: string }>
-  sideboard?: Array<{ count: number; name: string }>
-}
-
 interface CardStats {
   name: string
   mainDeckTotal: number
@@ -75,104 +61,35 @@ type SortDirection = 'asc' | 'desc'
 function ArchetypeDetail({ data }: ArchetypeDetailProps) {
   const { archetypeName } = useParams<{ archetypeName: string }>()
   const decodedName = decodeURIComponent(archetypeName || '')
-  const [players, setPlayers] = useState<Array<{ player: string; archetype: string }>>([])
-  const [decklists, setDecklists] = useState<DecklistData[]>([])
-  const [results, setResults] = useState<MatchResult[]>([])
+  const { cards } = useCards(archetypeCardsBundle(decodedName))
+  const { players } = usePlayers(archetypePlayersBundle(decodedName))
   const [sortColumn, setSortColumn] = useState<SortColumn>('winRate')
   const [sortDirection, setSortDirection] = useState<SortDirection>('desc')
   const [cardSortColumn, setCardSortColumn] = useState<CardSortColumn>('mainDeckAverage')
   const [cardSortDirection, setCardSortDirection] = useState<SortDirection>('desc')
 
-  useEffect(() => {
-    fetch('/decklists.json')
-      .then(res => res.json())
-      .then(decklistsData => {
-        const playersList: Array<{ player: string; archetype: string }> = []
-        const decklistsList: DecklistData[] = []
-        for (const decklist of Object.values(decklistsData)) {
-          const dl = decklist as DecklistData
-          if (dl.archetype === decodedName) {
-            playersList.push({ player: dl.player, archetype: dl.archetype })
-            decklistsList.push(dl)
-          }
-        }
-        setPlayers(playersList)
-        setDecklists(decklistsList)
-      })
-      .catch(err => console.error('Error loading decklists:', err))
-  }, [decodedName])
-
-  useEffect(() => {
-    fetch('/results.json')
-      .then(res => res.json())
-      .then((resultsData: MatchResult[]) => {
-        setResults(resultsData)
-      })
-      .catch(err => console.error('Error loading results:', err))
-  }, [])
-
+  // Constructed records of the archetype's players (draft rounds are excluded)
   const playerStats = useMemo(() => {
-    const statsMap = new Map<string, PlayerData>()
-
-    // Initialize stats for each player (using normalized names as keys)
-    const normalizedPlayerMap = new Map<string, string>() // normalized -> original
-    players.forEach(p => {
-      const normalized = normalizePlayerName(p.player)
-      normalizedPlayerMap.set(normalized, p.player)
-      statsMap.set(normalized, {
-        player: p.player,
-        archetype: p.archetype,
-        wins: 0,
-        losses: 0,
-        draws: 0,
-        gamesWon: 0,
-        gamesLost: 0,
-        totalMatches: 0,
-      })
-    })
-
-    // Calculate stats from match results (excluding draft rounds)
-    results.forEach((match: MatchResult) => {
-      // Skip draft rounds for constructed statistics
-      if (DRAFT_ROUNDS.has(match.round)) {
-        return
-      }
-
-      const p1Normalized = normalizePlayerName(match.player1)
-      const p2Normalized = normalizePlayerName(match.player2)
+    if (!players) return []
 
-      const p1Stats = statsMap.get(p1Normalized)
-      const p2Stats = statsMap.get(p2Normalized)
+    const stats: PlayerData[] = []
+    Object.values(players.players).forEach(info => {
+      if (info.archetype !== decodedName) return
 
-      if (p1Stats) {
-        p1Stats.totalMatches++
-        if (match.p1_wins > match.p2_wins) {
-          p1Stats.wins++
-        } else if (match.p2_wins > match.p1_wins) {
-          p1Stats.losses++
-        } else {
-          p1Stats.draws++
-        }
-        p1Stats.gamesWon += match.p1_wins
-        p1Stats.gamesLost += match.p2_wins
-      }
-
-      if (p2Stats) {
-        p2Stats.totalMatches++
-        if (match.p2_wins > match.p1_wins) {
-          p2Stats.wins++
-        } else if (match.p1_wins > match.p2_wins) {
-          p2Stats.losses++
-        } else {
-          p2Stats.draws++
-        }
-        p2Stats.gamesWon += match.p2_wins
-        p2Stats.gamesLost += match.p1_wins
-      }
+      stats.push({
+        player: info.player,
+        archetype: info.archetype,
+        wins: info.constructed.wins,
+        losses: info.constructed.losses,
+        draws: info.constructed.draws,
+        gamesWon: info.constructed.games_won,
+        gamesLost: info.constructed.games_lost,
+        totalMatches: info.constructed.total_matches,
+      })
     })
 
-    return Array.from(statsMap.values())
-  }, [players, results])
+    return stats
+  }, [players, decodedName])
 
   const sortedPlayerStats = useMemo(() => {
     const sorted = [...playerStats]
@@ -229,69 +146,33 @@ function ArchetypeDetail({ data }: ArchetypeDetailProps) {
     return 'danger'
   }
 
-  // Calculate card statistics
-  const cardStats = useMemo(() => {
-    const cardMap = new Map<
-      string,
-      {
-        mainDeckTotal: number
-        mainDeckDecksIncluded: number
-        sideboardTotal: number
-        sideboardDecksIncluded: number
-      }
-    >()
-    const totalDecks = decklists.length
-
-    decklists.forEach(decklist => {
-      // Process main deck
-      if (decklist.main_deck) {
-        decklist.main_deck.forEach(card => {
-          const existing = cardMap.get(card.name) || {
-            mainDeckTotal: 0,
-            mainDeckDecksIncluded: 0,
-            sideboardTotal: 0,
-            sideboardDecksIncluded: 0,
-          }
-          existing.mainDeckTotal += card.count
-          existing.mainDeckDecksIncluded += 1
-          cardMap.set(card.name, existing)
-        })
-      }
+  // Card statistics from the precomputed per-archetype usage
+  const totalDecks = cards?.archetype_decks[decodedName] ?? 0
 
-      // Process sideboard
-      if (decklist.sideboard) {
-        decklist.sideboard.forEach(card => {
-          const existing = cardMap.get(card.name) || {
-            mainDeckTotal: 0,
-            mainDeckDecksIncluded: 0,
-            sideboardTotal: 0,
-            sideboardDecksIncluded: 0,
-          }
-          existing.sideboardTotal += card.count
-          existing.sideboardDecksIncluded += 1
-          cardMap.set(card.name, existing)
-        })
-      }
-    })
+  const cardStats = useMemo(() => {
+    if (!cards || totalDecks === 0) return []
 
     const stats: CardStats[] = []
 
-    cardMap.forEach((stat, name) => {
+    Object.entries(cards.cards).forEach(([name, usage]) => {
+      const stat = usage.archetypes[decodedName]
+      if (!stat) return
+
       stats.push({
         name,
-        mainDeckTotal: stat.mainDeckTotal,
-        mainDeckAverage: stat.mainDeckTotal / totalDecks,
-        mainDeckDecksIncluded: stat.mainDeckDecksIncluded,
-        mainDeckPercentage: (stat.mainDeckDecksIncluded / totalDecks) * 100,
-        sideboardTotal: stat.sideboardTotal,
-        sideboardAverage: stat.sideboardTotal / totalDecks,
-        sideboardDecksIncluded: stat.sideboardDecksIncluded,
-        sideboardPercentage: (stat.sideboardDecksIncluded / totalDecks) * 100,
+        mainDeckTotal: stat.main_copies,
+        mainDeckAverage: stat.main_copies / totalDecks,
+        mainDeckDecksIncluded: stat.main_decks,
+        mainDeckPercentage: (stat.main_decks / totalDecks) * 100,
+        sideboardTotal: stat.side_copies,
+        sideboardAverage: stat.side_copies / totalDecks,
+        sideboardDecksIncluded: stat.side_decks,
+        sideboardPercentage: (stat.side_decks / totalDecks) * 100,
       })
     })
 
     return stats
-  }, [decklists])
+  }, [cards, decodedName, totalDecks])
 
   const sortedCardStats = useMemo(() => {
     const sorted = [...cardStats]
@@ -512,7 +393,7 @@ function ArchetypeDetail({ data }: ArchetypeDetailProps) {
           </VStack>
         </Box>
 
-        {decklists.length > 0 && (
+        {totalDecks > 0 && (
           <Box padding="lg">
             <VStack spacing="md">
               <SectionHeader>Card Breakdown</SectionHeader>
@@ -12,6 +12,7 @@ import { HStack } from '@atoms/HStack'
 import { SectionHeader } from '@molecules/SectionHeader'
 import { EmptyState } from '@molecules/EmptyState'
 import type { AnalysisData, ArchetypeStats } from '@/types'
+import { formatInterval } from '@/utils/confidence'
 
 interface ArchetypeTableProps {
   data: AnalysisData | null
@@ -201,7 +202,7 @@ function ArchetypeTable({ data }: ArchetypeTableProps) {
                             : `${stats.wins}-${stats.losses}`}
                         </Text>
                       </TableCell>
-                      <TableCell>
+                      <TableCell title={formatInterval(stats.win_rate_wilson).trim()}>
                         <Text color={getWinRateColor(winRate)} className="font-bold">
                           {(winRate * 100).toFixed(1)}%
                         </Text>
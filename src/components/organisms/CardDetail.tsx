@@ -17,19 +17,15 @@ import { PageHeader } from '@molecules/PageHeader'
 import { StatDisplay } from '@molecules/StatDisplay'
 import { EmptyState } from '@molecules/EmptyState'
 import { LoadingState } from '@molecules/LoadingState'
+import { useCards } from '@/hooks/useCards'
+import { cardBundle } from '@/utils/dataBundles'
+import { fetchCardImage } from '@/utils/scryfall'
 import type { AnalysisData } from '@/types'
 
 interface CardDetailProps {
   data: AnalysisData | null
 }
 
-interface DecklistData {
-  player: string
-  archetype: string
-  main_deck?: Array<{ count: number; name: string }>
-  sideboard?: Array<{ count: number; name: string }>
-}
-
 interface ArchetypeCardStat {
   archetype: string
   totalCopies: number
@@ -54,156 +50,57 @@ type SortDirection = 'asc' | 'desc'
 function CardDetail({ data }: CardDetailProps) {
   const { cardName } = useParams<{ cardName: string }>()
   const decodedName = decodeURIComponent(cardName || '')
-  const [decklists, setDecklists] = useState<Record<string, DecklistData>>({})
+  const { cards } = useCards(cardBundle(decodedName))
   const [sortColumn, setSortColumn] = useState<SortColumn>('percentageIncluded')
   const [sortDirection, setSortDirection] = useState<SortDirection>('desc')
   const [cardImageUrl, setCardImageUrl] = useState<string | null>(null)
 
-  useEffect(() => {
-    fetch('/decklists.json')
-      .then(res => res.json())
-      .then(decklistsData => {
-        setDecklists(decklistsData)
-      })
-      .catch(err => console.error('Error loading decklists:', err))
-  }, [])
-
   useEffect(() => {
     if (!decodedName) return
 
-    const searchName = decodedName.replace(/\/\/.*$/, '').trim()
-    fetch(`https://api.scryfall.com/cards/named?fuzzy=${encodeURIComponent(searchName)}`)
-      .then(res => res.json())
-      .then(data => {
-        if (data.image_uris && data.image_uris.normal) {
-          setCardImageUrl(data.image_uris.normal)
-        } else if (data.card_faces && data.card_faces[0]?.image_uris?.normal) {
-          setCardImageUrl(data.card_faces[0].image_uris.normal)
-        }
+    fetchCardImage(decodedName)
+      .then(url => {
+        if (url) setCardImageUrl(url)
       })
       .catch(() => {})
   }, [decodedName])
 
-  const archetypeStats = useMemo(() => {
-    const archetypeMap = new Map<
-      string,
-      {
-        totalCopies: number
-        mainDeckCopies: number
-        sideboardCopies: number
-        decksIncluded: Set<string>
-        totalDecks: Set<string>
-      }
-    >()
-
-    Object.values(decklists).forEach((decklist: DecklistData) => {
-      const archetype = decklist.archetype
-      const deckKey = `${decklist.player}-${archetype}`
-
-      const existing = archetypeMap.get(archetype) || {
-        totalCopies: 0,
-        mainDeckCopies: 0,
-        sideboardCopies: 0,
-        decksIncluded: new Set<string>(),
-        totalDecks: new Set<string>(),
-      }
-
-      existing.totalDecks.add(deckKey)
-
-      let cardFound = false
-
-      if (decklist.main_deck) {
-        decklist.main_deck.forEach(card => {
-          if (card.name === decodedName) {
-            existing.mainDeckCopies += card.count
-            existing.totalCopies += card.count
-            existing.decksIncluded.add(deckKey)
-            cardFound = true
-          }
-        })
-      }
+  const usage = cards?.cards[decodedName]
 
-      if (decklist.sideboard) {
-        decklist.sideboard.forEach(card => {
-          if (card.name === decodedName) {
-            existing.sideboardCopies += card.count
-            existing.totalCopies += card.count
-            if (!cardFound) {
-              existing.decksIncluded.add(deckKey)
-            }
-          }
-        })
-      }
-
-      archetypeMap.set(archetype, existing)
-    })
+  const archetypeStats = useMemo(() => {
+    if (!cards || !usage) return []
 
-    const stats: ArchetypeCardStat[] = []
-    archetypeMap.forEach((stat, archetype) => {
-      const totalDecks = stat.totalDecks.size
-      stats.push({
+    const stats: ArchetypeCardStat[] = Object.entries(usage.archetypes).map(([archetype, stat]) => {
+      const totalDecks = cards.archetype_decks[archetype]
+      return {
         archetype,
-        totalCopies: stat.totalCopies,
-        mainDeckCopies: stat.mainDeckCopies,
-        sideboardCopies: stat.sideboardCopies,
-        averageMainDeck: stat.mainDeckCopies / totalDecks,
-        averageSideboard: stat.sideboardCopies / totalDecks,
-        decksIncluded: stat.decksIncluded.size,
+        totalCopies: stat.total_copies,
+        mainDeckCopies: stat.main_copies,
+        sideboardCopies: stat.side_copies,
+        averageMainDeck: stat.main_copies / totalDecks,
+        averageSideboard: stat.side_copies / totalDecks,
+        decksIncluded: stat.decks,
         totalDecks,
-        percentageIncluded: (stat.decksIncluded.size / totalDecks) * 100,
-      })
+        percentageIncluded: stat.share * 100,
+      }
     })
 
-    // Filter out archetypes with 0 copies and sort by total copies descending
-    return stats.filter(stat => stat.totalCopies > 0).sort((a, b) => b.totalCopies - a.totalCopies)
-  }, [decklists, decodedName])
+    return stats.sort((a, b) => b.totalCopies - a.totalCopies)
+  }, [cards, usage])
 
   const totalStats = useMemo(() => {
-    let totalCopies = 0
-    let mainDeckCopies = 0
-    let sideboardCopies = 0
-    let decksIncluded = 0
-    let totalDecks = 0
-
-    Object.values(decklists).forEach((decklist: DecklistData) => {
-      totalDecks++
-      let found = false
-
-      if (decklist.main_deck) {
-        decklist.main_deck.forEach(card => {
-          if (card.name === decodedName) {
-            totalCopies += card.count
-            mainDeckCopies += card.count
-            if (!found) {
-              decksIncluded++
-              found = true
-            }
-          }
-        })
-      }
-
-      if (decklist.sideboard) {
-        decklist.sideboard.forEach(card => {
-          if (card.name === decodedName) {
-            totalCopies += card.count
-            sideboardCopies += card.count
-            if (!found) {
-              decksIncluded++
-            }
-          }
-        })
-      }
-    })
+    const totalDecks = cards?.total_decks ?? 0
+    const decksIncluded = usage?.decks ?? 0
 
     return {
-      totalCopies,
-      mainDeckCopies,
-      sideboardCopies,
+      totalCopies: usage?.total_copies ?? 0,
+      mainDeckCopies: usage?.main_copies ?? 0,
+      sideboardCopies: usage?.side_copies ?? 0,
       decksIncluded,
       totalDecks,
       percentageIncluded: totalDecks > 0 ? (decksIncluded / totalDecks) * 100 : 0,
     }
-  }, [decklists, decodedName])
+  }, [cards, usage])
 
   const sortedArchetypeStats = useMemo(() => {
     const sorted = [...archetypeStats].sort((a, b) => {
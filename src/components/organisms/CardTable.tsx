@@ -11,8 +11,8 @@ import { VStack } from '@atoms/VStack'
 import { SectionHeader } from '@molecules/SectionHeader'
 import { EmptyState } from '@molecules/EmptyState'
 import { Pagination } from '@molecules/Pagination'
-import { useDecklists } from '@/hooks/useDecklists'
-import type { AnalysisData, DecklistData } from '@/types'
+import { useCards } from '@/hooks/useCards'
+import type { AnalysisData } from '@/types'
 
 interface CardTableProps {
   data: AnalysisData | null
@@ -30,7 +30,7 @@ type SortColumn = 'name' | 'totalCopies' | 'mainDeckCopies' | 'sideboardCopies'
 type SortDirection = 'asc' | 'desc'
 
 function CardTable({ data }: CardTableProps) {
-  const { decklists } = useDecklists()
+  const { cards } = useCards()
   const [sortColumn, setSortColumn] = useState<SortColumn>('totalCopies')
   const [sortDirection, setSortDirection] = useState<SortDirection>('desc')
   const [searchTerm, setSearchTerm] = useState<string>('')
@@ -38,63 +38,18 @@ function CardTable({ data }: CardTableProps) {
   const itemsPerPage = 50
 
   const cardStats = useMemo(() => {
-    const cardMap = new Map<
-      string,
-      {
-        totalCopies: number
-        mainDeckCopies: number
-        sideboardCopies: number
-        decksIncluded: Set<string>
-      }
-    >()
-
-    Object.values(decklists).forEach((decklist: DecklistData) => {
-      const deckKey = `${decklist.player}-${decklist.archetype}`
-
-      if (decklist.main_deck) {
-        decklist.main_deck.forEach(card => {
-          const existing = cardMap.get(card.name) || {
-            totalCopies: 0,
-            mainDeckCopies: 0,
-            sideboardCopies: 0,
-            decksIncluded: new Set<string>(),
-          }
-          existing.totalCopies += card.count
-          existing.mainDeckCopies += card.count
-          existing.decksIncluded.add(deckKey)
-          cardMap.set(card.name, existing)
-        })
-      }
-
-      if (decklist.sideboard) {
-        decklist.sideboard.forEach(card => {
-          const existing = cardMap.get(card.name) || {
-            totalCopies: 0,
-            mainDeckCopies: 0,
-            sideboardCopies: 0,
-            decksIncluded: new Set<string>(),
-          }
-          existing.totalCopies += card.count
-          existing.sideboardCopies += card.count
-          existing.decksIncluded.add(deckKey)
-          cardMap.set(card.name, existing)
-        })
-      }
-    })
+    if (!cards) return []
 
-    const stats: CardStat[] = []
-    cardMap.forEach((stat, name) => {
-      stats.push({
+    return Object.entries(cards.cards).map(
+      ([name, usage]): CardStat => ({
         name,
-        totalCopies: stat.totalCopies,
-        mainDeckCopies: stat.mainDeckCopies,
-        sideboardCopies: stat.sideboardCopies,
-        decksIncluded: stat.decksIncluded.size,
+        totalCopies: usage.total_copies,
+        mainDeckCopies: usage.main_copies,
+        sideboardCopies: usage.side_copies,
+        decksIncluded: usage.decks,
       })
-    })
-
-    return stats
-  }, [decklists])
+    )
+  }, [cards])
 
   const sortedCardStats = useMemo(() => {
     let sorted = cardStats.filter(card =>
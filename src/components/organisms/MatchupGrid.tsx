@@ -7,42 +7,38 @@ import { Table, TableHead, TableBody, TableRow, TableHeader, TableCell } from '@
 import { Text } from '@atoms/Text'
 import { VStack } from '@atoms/VStack'
 import { SectionHeader } from '@molecules/SectionHeader'
-import type { AnalysisData, MatchupStats } from '@/types'
+import type { AnalysisData } from '@/types'
+import { formatInterval } from '@/utils/confidence'
 
 interface MatchupGridProps {
   data: AnalysisData | null
 }
 
 function MatchupGrid({ data }: MatchupGridProps) {
-  const matchupStats = useMemo(() => data?.matchup_stats || {}, [data?.matchup_stats])
+  const matrix = data?.matchup_matrix
   const archetypeCounts = useMemo(() => data?.archetype_counts || {}, [data?.archetype_counts])
 
   // Get all unique archetypes, sorted
   const archetypes = useMemo(() => {
-    const archSet = new Set<string>()
-    Object.keys(archetypeCounts).forEach(arch => archSet.add(arch))
-    Object.values(matchupStats).forEach((matchup: MatchupStats) => {
-      archSet.add(matchup.archetype1)
-      archSet.add(matchup.archetype2)
-    })
+    const archSet = new Set<string>(Object.keys(archetypeCounts))
+    matrix?.archetypes.forEach(arch => archSet.add(arch))
     return Array.from(archSet).sort()
-  }, [archetypeCounts, matchupStats])
+  }, [archetypeCounts, matrix])
 
-  // Create a lookup map for matchups
-  const matchupMap = useMemo(() => {
-    const map = new Map<string, MatchupStats>()
-    Object.values(matchupStats).forEach((matchup: MatchupStats) => {
-      const key = `${matchup.archetype1} vs ${matchup.archetype2}`
-      map.set(key, matchup)
-    })
-    return map
-  }, [matchupStats])
+  // Row/column of each archetype in the matchup matrix
+  const matrixIndex = useMemo(
+    () => new Map((matrix?.archetypes || []).map((arch, index) => [arch, index])),
+    [matrix]
+  )
 
-  const getMatchup = (arch1: string, arch2: string): MatchupStats | null => {
-    if (arch1 === arch2) return null // Mirror match
-    const key1 = `${arch1} vs ${arch2}`
-    const key2 = `${arch2} vs ${arch1}`
-    return matchupMap.get(key1) || matchupMap.get(key2) || null
+  const getMatchup = (rowArch: string, colArch: string) => {
+    const row = matrixIndex.get(rowArch)
+    const col = matrixIndex.get(colArch)
+    if (!matrix || row === undefined || col === undefined) return null
+    const wins = matrix.wins[row][col]
+    const losses = matrix.losses[row][col]
+    if (wins + losses === 0) return null
+    return { wins, losses, interval: matrix.win_rate_wilson?.[row][col] }
   }
 
   const getWinRateColor = (rate: number): 'success' | 'warning' | 'danger' => {
@@ -150,12 +146,9 @@ function MatchupGrid({ data }: MatchupGridProps) {
                         )
                       }
 
-                      // Determine which archetype is which
-                      const isRowFirst = matchup.archetype1 === rowArch
-                      const wins = isRowFirst ? matchup.arch1_wins : matchup.arch2_wins
-                      const losses = isRowFirst ? matchup.arch2_wins : matchup.arch1_wins
-                      const winRate = isRowFirst ? matchup.arch1_win_rate : matchup.arch2_win_rate
-                      const totalMatches = matchup.total_matches
+                      const { wins, losses, interval } = matchup
+                      const totalMatches = wins + losses
+                      const winRate = wins / totalMatches
                       const winRateColor = getWinRateColor(winRate)
                       const winRateBg = getWinRateBackground(winRate)
 
@@ -167,7 +160,7 @@ function MatchupGrid({ data }: MatchupGridProps) {
                           border
                           cursor="pointer"
                           hover
-                          title={`${rowArch} vs ${colArch}: ${wins}-${losses} (${(winRate * 100).toFixed(1)}%)`}
+                          title={`${rowArch} vs ${colArch}: ${wins}-${losses} (${(winRate * 100).toFixed(1)}%)${formatInterval(interval)}`}
                         >
                           <VStack spacing="xs" align="center">
                             <Text variant="small" className="font-bold">
@@ -1,4 +1,4 @@
-import { useState, useEffect, useMemo } from 'react'
+import { useState, useMemo } from 'react'
 
 import { Box } from '@atoms/Box'
 import { Card } from '@atoms/Card'
@@ -9,7 +9,7 @@ import { VStack } from '@atoms/VStack'
 import { Link } from '@atoms/Link'
 import { SectionHeader } from '@molecules/SectionHeader'
 import { EmptyState } from '@molecules/EmptyState'
-import { normalizePlayerName } from '@/utils/playerName'
+import { usePlayers } from '@/hooks/usePlayers'
 import { DAY_2_START_ROUND } from '@/utils/constants'
 import type { AnalysisData } from '@/types'
 
@@ -17,17 +17,6 @@ interface MetagameBreakdownProps {
   data: AnalysisData | null
 }
 
-interface MatchResult {
-  round: number
-  player1: string
-  player2: string
-}
-
-interface DecklistData {
-  player: string
-  archetype: string
-}
-
 
 interface ArchetypeMetagameData {
   archetype: string
@@ -42,51 +31,17 @@ type SortColumn = 'archetype' | 'day1Players' | 'day1Percentage' | 'day2Percenta
 type SortDirection = 'asc' | 'desc'
 
 function MetagameBreakdown({ data }: MetagameBreakdownProps) {
-  const [results, setResults] = useState<MatchResult[]>([])
-  const [decklists, setDecklists] = useState<Record<string, DecklistData>>({})
+  const { players } = usePlayers()
   const [sortColumn, setSortColumn] = useState<SortColumn>('day1Percentage')
   const [sortDirection, setSortDirection] = useState<SortDirection>('desc')
 
-  useEffect(() => {
-    fetch('/results.json')
-      .then(res => res.json())
-      .then((resultsData: MatchResult[]) => {
-        setResults(resultsData)
-      })
-      .catch(err => console.error('Error loading results:', err))
-  }, [])
-
-  useEffect(() => {
-    fetch('/decklists.json')
-      .then(res => res.json())
-      .then(decklistsData => {
-        setDecklists(decklistsData)
-      })
-      .catch(err => console.error('Error loading decklists:', err))
-  }, [])
-
   const metagameData = useMemo(() => {
-    if (!data || results.length === 0 || Object.keys(decklists).length === 0) {
+    if (!data || !players) {
       return []
     }
 
     const archetypeCounts = data.archetype_counts || {}
     
-    // Get all players who made day 2 (played in round 11+)
-    const day2PlayersSet = new Set<string>()
-    results.forEach((result: MatchResult) => {
-      if (result.round >= DAY_2_START_ROUND) {
-        day2PlayersSet.add(result.player1)
-        day2PlayersSet.add(result.player2)
-      }
-    })
-
-    // Normalize day 2 players for matching
-    const day2PlayersNormalized = new Set<string>()
-    day2PlayersSet.forEach(player => {
-      day2PlayersNormalized.add(normalizePlayerName(player))
-    })
-
     // Count players per archetype for day 1 and day 2
     const archetypeDay1Counts: Record<string, number> = {}
     const archetypeDay2Counts: Record<string, number> = {}
@@ -97,11 +52,10 @@ function MetagameBreakdown({ data }: MetagameBreakdownProps) {
       archetypeDay2Counts[archetype] = 0
     })
 
-    // Day 2: count players who made day 2 by archetype
-    Object.values(decklists).forEach((decklist: DecklistData) => {
-      const normalizedPlayer = normalizePlayerName(decklist.player)
-      if (day2PlayersNormalized.has(normalizedPlayer)) {
-        const archetype = decklist.archetype
+    // Day 2: count players who made day 2 (played in round 11+) by archetype
+    Object.values(players.players).forEach(info => {
+      if (info.last_round >= DAY_2_START_ROUND) {
+        const archetype = info.archetype
         archetypeDay2Counts[archetype] = (archetypeDay2Counts[archetype] || 0) + 1
       }
     })
@@ -129,7 +83,7 @@ function MetagameBreakdown({ data }: MetagameBreakdownProps) {
     })
 
     return metagame
-  }, [data, results, decklists])
+  }, [data, players])
 
   const sortedMetagame = useMemo(() => {
     const sorted = [...metagameData].sort((a, b) => {
@@ -12,11 +12,11 @@ import { LoadingState } from '@molecules/LoadingState'
 import { MatchStatsGrid } from '@molecules/MatchStatsGrid'
 import { MatchesTable } from '@molecules/MatchesTable'
 import { DecklistDisplay } from '@molecules/DecklistDisplay'
-import { usePlayerDecklist, useDecklists } from '@/hooks/useDecklists'
-import { usePlayerMatches, type MatchResult } from '@/hooks/useResults'
+import { usePlayerDecklist } from '@/hooks/useDecklists'
+import { usePlayer } from '@/hooks/usePlayers'
 import { normalizePlayerName } from '@/utils/playerName'
 import { DRAFT_ROUNDS } from '@/utils/constants'
-import type { AnalysisData } from '@/types'
+import type { AnalysisData, PlayerRecord } from '@/types'
 
 interface PlayerDetailProps {
   data: AnalysisData | null
@@ -27,8 +27,7 @@ function PlayerDetail({ data }: PlayerDetailProps) {
   const decodedName = decodeURIComponent(playerName || '')
   
   const { decklist, loading: decklistLoading, error: decklistError } = usePlayerDecklist(decodedName)
-  const { playerMatches, loading: matchesLoading, error: matchesError } = usePlayerMatches(decodedName)
-  const { decklists } = useDecklists()
+  const { player, matches: playerMatches, loading: matchesLoading, error: matchesError } = usePlayer(decodedName)
 
   if (decklistLoading || matchesLoading) {
     return <LoadingState />
@@ -42,44 +41,17 @@ function PlayerDetail({ data }: PlayerDetailProps) {
     return <LoadingState />
   }
   
-  const draftStats = {
-    wins: 0,
-    losses: 0,
-    draws: 0,
-    gamesWon: 0,
-    gamesLost: 0,
-  }
-  
-  const constructedStats = {
-    wins: 0,
-    losses: 0,
-    draws: 0,
-    gamesWon: 0,
-    gamesLost: 0,
-  }
-
-  const normalizedPlayerName = normalizePlayerName(decodedName)
-  playerMatches.forEach((match: MatchResult) => {
-    const isDraft = DRAFT_ROUNDS.has(match.round)
-    const stats = isDraft ? draftStats : constructedStats
-    
-    const p1Normalized = normalizePlayerName(match.player1)
-    const isPlayer1 = p1Normalized === normalizedPlayerName
-    if (isPlayer1) {
-      if (match.p1_wins > match.p2_wins) stats.wins++
-      else if (match.p2_wins > match.p1_wins) stats.losses++
-      else stats.draws++
-      stats.gamesWon += match.p1_wins
-      stats.gamesLost += match.p2_wins
-    } else {
-      if (match.p2_wins > match.p1_wins) stats.wins++
-      else if (match.p1_wins > match.p2_wins) stats.losses++
-      else stats.draws++
-      stats.gamesWon += match.p2_wins
-      stats.gamesLost += match.p1_wins
-    }
+  const toStats = (record?: PlayerRecord) => ({
+    wins: record?.wins ?? 0,
+    losses: record?.losses ?? 0,
+    draws: record?.draws ?? 0,
+    gamesWon: record?.games_won ?? 0,
+    gamesLost: record?.games_lost ?? 0,
   })
 
+  const draftStats = toStats(player?.draft)
+  const constructedStats = toStats(player?.constructed)
+
   const draftWinRate =
     draftStats.wins + draftStats.losses > 0
       ? draftStats.wins / (draftStats.wins + draftStats.losses)
@@ -131,11 +103,11 @@ function PlayerDetail({ data }: PlayerDetailProps) {
               }}
               draft={{
                 ...draftStats,
-                matches: playerMatches.filter(m => DRAFT_ROUNDS.has(m.round)).length,
+                matches: player?.draft.total_matches ?? 0,
               }}
               constructed={{
                 ...constructedStats,
-                matches: playerMatches.filter(m => !DRAFT_ROUNDS.has(m.round)).length,
+                matches: player?.constructed.total_matches ?? 0,
               }}
               overallWinRate={totalWinRate}
               draftWinRate={draftWinRate}
@@ -152,7 +124,6 @@ function PlayerDetail({ data }: PlayerDetailProps) {
             <MatchesTable
               matches={playerMatches}
               currentPlayerName={decodedName}
-              decklists={decklists}
               normalizePlayerName={normalizePlayerName}
               draftRounds={DRAFT_ROUNDS}
             />
@@ -11,8 +11,7 @@ import { VStack } from '@atoms/VStack'
 import { SectionHeader } from '@molecules/SectionHeader'
 import { EmptyState } from '@molecules/EmptyState'
 import { Pagination } from '@molecules/Pagination'
-import { normalizePlayerName } from '@/utils/playerName'
-import { DRAFT_ROUNDS } from '@/utils/constants'
+import { usePlayers } from '@/hooks/usePlayers'
 import type { AnalysisData } from '@/types'
 
 interface PlayerTableProps {
@@ -30,114 +29,35 @@ interface PlayerData {
   totalMatches: number
 }
 
-interface MatchResult {
-  round: number
-  player1: string
-  player2: string
-  p1_wins: number
-  p2_wins: number
-}
-
-interface DecklistData {
-  player: string
-  archetype: string
-}
-
 
 type SortColumn = 'player' | 'archetype' | 'matchRecord' | 'winRate' | 'gameRecord' | 'gameWinRate' | 'matches'
 type SortDirection = 'asc' | 'desc'
 
 function PlayerTable({ data }: PlayerTableProps) {
-  const [results, setResults] = useState<MatchResult[]>([])
-  const [decklists, setDecklists] = useState<Record<string, DecklistData>>({})
+  const { players } = usePlayers()
   const [sortColumn, setSortColumn] = useState<SortColumn>('winRate')
   const [sortDirection, setSortDirection] = useState<SortDirection>('desc')
   const [searchTerm, setSearchTerm] = useState<string>('')
   const [currentPage, setCurrentPage] = useState<number>(1)
   const itemsPerPage = 50
 
-  useEffect(() => {
-    fetch('/results.json')
-      .then(res => res.json())
-      .then((resultsData: MatchResult[]) => {
-        setResults(resultsData)
-      })
-      .catch(err => console.error('Error loading results:', err))
-  }, [])
-
-  useEffect(() => {
-    fetch('/decklists.json')
-      .then(res => res.json())
-      .then(decklistsData => {
-        setDecklists(decklistsData)
-      })
-      .catch(err => console.error('Error loading decklists:', err))
-  }, [])
-
+  // Constructed records (draft rounds are excluded)
   const playerStats = useMemo(() => {
-    if (results.length === 0 || Object.keys(decklists).length === 0) {
-      return []
-    }
-
-    const statsMap = new Map<string, PlayerData>()
+    if (!players) return []
 
-    // Initialize stats for each player from decklists
-    Object.values(decklists).forEach((decklist: DecklistData) => {
-      const normalized = normalizePlayerName(decklist.player)
-      statsMap.set(normalized, {
-        player: decklist.player,
-        archetype: decklist.archetype,
-        wins: 0,
-        losses: 0,
-        draws: 0,
-        gamesWon: 0,
-        gamesLost: 0,
-        totalMatches: 0,
+    return Object.values(players.players).map(
+      (info): PlayerData => ({
+        player: info.player,
+        archetype: info.archetype,
+        wins: info.constructed.wins,
+        losses: info.constructed.losses,
+        draws: info.constructed.draws,
+        gamesWon: info.constructed.games_won,
+        gamesLost: info.constructed.games_lost,
+        totalMatches: info.constructed.total_matches,
       })
-    })
-
-    // Calculate stats from match results (excluding draft rounds)
-    results.forEach((match: MatchResult) => {
-      // Skip draft rounds for constructed statistics
-      if (DRAFT_ROUNDS.has(match.round)) {
-        return
-      }
-
-      const p1Normalized = normalizePlayerName(match.player1)
-      const p2Normalized = normalizePlayerName(match.player2)
-
-      const p1Stats = statsMap.get(p1Normalized)
-      const p2Stats = statsMap.get(p2Normalized)
-
-      if (p1Stats) {
-        p1Stats.totalMatches++
-        if (match.p1_wins > match.p2_wins) {
-          p1Stats.wins++
-        } else if (match.p2_wins > match.p1_wins) {
-          p1Stats.losses++
-        } else {
-          p1Stats.draws++
-        }
-        p1Stats.gamesWon += match.p1_wins
-        p1Stats.gamesLost += match.p2_wins
-      }
-
-      if (p2Stats) {
-        p2Stats.totalMatches++
-        if (match.p2_wins > match.p1_wins) {
-          p2Stats.wins++
-        } else if (match.p1_wins > match.p2_wins) {
-          p2Stats.losses++
-        } else {
-          p2Stats.draws++
-        }
-        p2Stats.gamesWon += match.p2_wins
-        p2Stats.gamesLost += match.p1_wins
-      }
-    })
-
-    return Array.from(statsMap.values())
-  }, [results, decklists])
+    )
+  }, [players])
 
   const filteredAndSortedPlayers = useMemo(() => {
     // Filter by search term
@@ -0,0 +1,29 @@
+import { useState, useEffect } from 'react'
+import type { CardsData } from '@/types'
+import { fetchBundle } from '@/utils/dataBundles'
+
+/**
+ * Hook to fetch the card usage aggregates computed by analyze.py, or one of
+ * their shards (e.g. a single card or archetype)
+ */
+export function useCards(bundle: string = 'cards') {
+  const [cards, setCards] = useState<CardsData | null>(null)
+  const [loading, setLoading] = useState(true)
+  const [error, setError] = useState<string | null>(null)
+
+  useEffect(() => {
+    setLoading(true)
+    fetchBundle<CardsData>(bundle, '/cards.json')
+      .then(cardsData => {
+        setCards(cardsData)
+        setLoading(false)
+      })
+      .catch(err => {
+        console.error('Error loading card usage:', err)
+        setError(err.message)
+        setLoading(false)
+      })
+  }, [bundle])
+
+  return { cards, loading, error }
+}
@@ -1,5 +1,6 @@
 import { useState, useEffect } from 'react'
 import { normalizePlayerName } from '@/utils/playerName'
+import { fetchBundle, playerDecklistBundle } from '@/utils/dataBundles'
 
 export interface DecklistData {
   player: string
@@ -9,16 +10,19 @@ export interface DecklistData {
 }
 
 /**
- * Hook to fetch all decklists
+ * Hook to fetch all decklists, or the shard of a bundle when given one
  */
-export function useDecklists() {
+export function useDecklists(bundle?: string) {
   const [decklists, setDecklists] = useState<Record<string, DecklistData>>({})
   const [loading, setLoading] = useState(true)
   const [error, setError] = useState<string | null>(null)
 
   useEffect(() => {
-    fetch('/decklists.json')
-      .then(res => res.json())
+    setLoading(true)
+    const request = bundle
+      ? fetchBundle<Record<string, DecklistData>>(bundle, '/decklists.json')
+      : fetch('/decklists.json').then(res => res.json())
+    request
       .then(decklistsData => {
         setDecklists(decklistsData)
         setLoading(false)
@@ -28,7 +32,7 @@ export function useDecklists() {
         setError(err.message)
         setLoading(false)
       })
-  }, [])
+  }, [bundle])
 
   return { decklists, loading, error }
 }
@@ -37,7 +41,7 @@ export function useDecklists() {
  * Hook to fetch a specific player's decklist
  */
 export function usePlayerDecklist(playerName: string) {
-  const { decklists, loading, error } = useDecklists()
+  const { decklists, loading, error } = useDecklists(playerDecklistBundle(normalizePlayerName(playerName)))
   const [decklist, setDecklist] = useState<DecklistData | null>(null)
 
   useEffect(() => {
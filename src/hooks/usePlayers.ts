@@ -0,0 +1,43 @@
+import { useState, useEffect } from 'react'
+import { normalizePlayerName } from '@/utils/playerName'
+import { fetchBundle, playerBundle } from '@/utils/dataBundles'
+import type { MatchInfo, PlayerInfo, PlayersData } from '@/types'
+
+/**
+ * Hook to fetch the per-player table computed by analyze.py, or one of its
+ * shards (e.g. a single player or archetype)
+ */
+export function usePlayers(bundle: string = 'players') {
+  const [players, setPlayers] = useState<PlayersData | null>(null)
+  const [loading, setLoading] = useState(true)
+  const [error, setError] = useState<string | null>(null)
+
+  useEffect(() => {
+    setLoading(true)
+    fetchBundle<PlayersData>(bundle, '/players.json')
+      .then(playersData => {
+        setPlayers(playersData)
+        setLoading(false)
+      })
+      .catch(err => {
+        console.error('Error loading players:', err)
+        setError(err.message)
+        setLoading(false)
+      })
+  }, [bundle])
+
+  return { players, loading, error }
+}
+
+/**
+ * Hook to look up a specific player's record and matches
+ */
+export function usePlayer(playerName: string) {
+  const playerKey = normalizePlayerName(playerName)
+  const { players, loading, error } = usePlayers(playerBundle(playerKey))
+
+  const player: PlayerInfo | null = players?.players[playerKey] ?? null
+  const matches: MatchInfo[] = player && players ? player.matches.map(id => players.matches[id]) : []
+
+  return { player, matches, loading, error }
+}
@@ -6,8 +6,12 @@ export interface ArchetypeStats {
   games_lost: number
   win_rate: number
   game_win_rate: number
+  // 95% confidence intervals of win_rate as [low, high]
+  win_rate_wilson?: [number, number]
+  win_rate_bootstrap?: [number, number]
   total_matches: number
-  matches: MatchInfo[]
+  // Ids into AnalysisData.matches
+  matches: number[]
 }
 
 export interface MatchInfo {
@@ -31,7 +35,26 @@ export interface MatchupStats {
   arch2_win_rate: number
   arch1_game_win_rate: number
   arch2_game_win_rate: number
+  // 95% confidence intervals of the match win rates as [low, high]
+  arch1_win_rate_wilson?: [number, number]
+  arch2_win_rate_wilson?: [number, number]
+  arch1_win_rate_bootstrap?: [number, number]
+  arch2_win_rate_bootstrap?: [number, number]
   total_matches: number
+  // Ids into AnalysisData.matches
+  matches: number[]
+}
+
+// Directed matchup counters, row archetype against column archetype
+export interface MatchupMatrix {
+  archetypes: string[]
+  wins: number[][]
+  losses: number[][]
+  draws: number[][]
+  games_won: number[][]
+  games_lost: number[][]
+  // 95% Wilson interval of the row archetype's match win rate as [low, high]
+  win_rate_wilson?: [number, number][][]
 }
 
 export interface DecklistData {
@@ -47,4 +70,56 @@ export interface AnalysisData {
   matchup_stats: Record<string, MatchupStats>
   total_players: number
   total_matches: number
+  // Constructed-round matches, referenced by id from archetype and matchup stats
+  matches: MatchInfo[]
+  matchup_matrix: MatchupMatrix
+}
+
+export interface CardUsage {
+  total_copies: number
+  main_copies: number
+  side_copies: number
+  // Decks playing the card anywhere, in the main deck, and in the sideboard
+  decks: number
+  main_decks: number
+  side_decks: number
+  // Copies per deck that plays the card
+  avg_copies: number
+}
+
+export interface CardArchetypeUsage extends CardUsage {
+  // Fraction of the archetype's decks that play the card
+  share: number
+}
+
+export interface CardsData {
+  total_decks: number
+  archetype_decks: Record<string, number>
+  cards: Record<string, CardUsage & { archetypes: Record<string, CardArchetypeUsage> }>
+}
+
+export interface PlayerRecord {
+  wins: number
+  losses: number
+  draws: number
+  games_won: number
+  games_lost: number
+  total_matches: number
+}
+
+export interface PlayerInfo {
+  player: string
+  archetype: string
+  constructed: PlayerRecord
+  draft: PlayerRecord
+  last_round: number
+  // Ids into PlayersData.matches
+  matches: number[]
+}
+
+export interface PlayersData {
+  // Keyed by normalized player name
+  players: Record<string, PlayerInfo>
+  // Every match, draft rounds included
+  matches: MatchInfo[]
 }
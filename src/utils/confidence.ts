@@ -0,0 +1,10 @@
+/**
+ * Formatting for the win rate confidence intervals in analysis.json
+ */
+
+// " (95% CI 34-54%)", or '' when the analysis has no interval
+export function formatInterval(interval?: [number, number]): string {
+  if (!interval) return ''
+  const [low, high] = interval
+  return ` (95% CI ${(low * 100).toFixed(0)}-${(high * 100).toFixed(0)}%)`
+}
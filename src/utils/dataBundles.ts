@@ -0,0 +1,81 @@
+/**
+ * Loader for the sharded data bundles written by scripts/publish.py
+ */
+
+interface SectionManifest {
+  // Bundle name -> content-hashed shard path
+  files: Record<string, string>
+}
+
+interface Manifest extends SectionManifest {
+  version: number
+  // Section of per-card, per-archetype or per-player bundles -> section manifest shard path
+  sections?: Record<string, string>
+}
+
+let manifestPromise: Promise<Manifest | null> | null = null
+const sectionPromises = new Map<string, Promise<SectionManifest | null>>()
+
+// Fetch the manifest once per page load; null when bundles haven't been published
+function loadManifest(): Promise<Manifest | null> {
+  if (!manifestPromise) {
+    manifestPromise = fetch('/manifest.json', { cache: 'no-cache' })
+      .then(res => (res.ok ? (res.json() as Promise<Manifest>) : null))
+      .catch(() => null)
+  }
+  return manifestPromise
+}
+
+// Section of a bundle name ('cards/card' for 'cards/card/<name>'), mirroring scripts/publish.py
+function bundleSection(name: string): string | null {
+  const parts = name.split('/')
+  return parts.length >= 3 ? `${parts[0]}/${parts[1]}` : null
+}
+
+// Fetch a section manifest once per page load; section manifests are content-hashed shards
+function loadSection(manifest: Manifest, section: string): Promise<SectionManifest | null> {
+  const path = manifest.sections?.[section]
+  if (!path) {
+    return Promise.resolve(null)
+  }
+  let sectionPromise = sectionPromises.get(section)
+  if (!sectionPromise) {
+    sectionPromise = fetch(`/${path}`)
+      .then(res => (res.ok ? (res.json() as Promise<SectionManifest>) : null))
+      .catch(() => null)
+    sectionPromises.set(section, sectionPromise)
+  }
+  return sectionPromise
+}
+
+async function bundlePath(name: string): Promise<string | undefined> {
+  const manifest = await loadManifest()
+  if (!manifest) {
+    return undefined
+  }
+  const section = bundleSection(name)
+  if (!section) {
+    return manifest.files[name]
+  }
+  const sectionManifest = await loadSection(manifest, section)
+  return sectionManifest?.files[name]
+}
+
+/**
+ * Fetch a bundle by name. Shards have the same shape as the file they are
+ * split from, so without a published shard the full file is used instead.
+ */
+export async function fetchBundle<T>(name: string, fallbackUrl: string): Promise<T> {
+  const path = await bundlePath(name)
+  const res = await fetch(path ? `/${path}` : fallbackUrl)
+  if (!res.ok) {
+    throw new Error(`Failed to load ${path ?? fallbackUrl}`)
+  }
+  return res.json() as Promise<T>
+}
+
+export const cardBundle = (cardName: string) => `cards/card/${cardName}`
+export const archetypeCardsBundle = (archetype: string) => `cards/archetype/${archetype}`
+export const archetypePlayersBundle = (archetype: string) => `players/archetype/${archetype}`
+export const playerBundle = (playerKey: string) => `players/player/${playerKey}`
+export const playerDecklistBundle = (playerKey: string) => `decklists/player/${playerKey}`
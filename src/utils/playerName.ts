@@ -2,21 +2,24 @@
  * Player name normalization utilities
  */
 
-// Normalize player name for matching - handles both 'First Last' and 'Last, First' formats
+// Normalize player name for matching - handles both 'First Last' and 'Last, First' formats.
+// Mirrors normalize_player_name in scripts/names.py, which keys players.json.
 export function normalizePlayerName(name: string): string {
   if (!name) return ''
 
   name = name.trim()
 
+  // Remove accents/diacritics for better matching
+  name = name.normalize('NFD').replace(/\p{Mn}/gu, '')
+
   // If it's in "Last, First" format, convert to "First Last"
   if (name.includes(',')) {
     const parts = name.split(',').map(p => p.trim())
     if (parts.length >= 2) {
-      name = `${parts[1]} ${parts[0]}`
+      name = `${parts.slice(1).join(' ')} ${parts[0]}`
     }
   }
 
   // Normalize to lowercase and remove extra spaces
-  return name.toLowerCase().split(/\s+/).join(' ')
+  return name.toLowerCase().split(/\s+/).filter(Boolean).join(' ')
 }
-
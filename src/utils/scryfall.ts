@@ -2,6 +2,8 @@
  * Scryfall API utilities
  */
 
+import { fetchBundle } from '@/utils/dataBundles'
+
 // Normalize card name for Scryfall query (handle split cards and variations)
 export function normalizeCardNameForScryfall(name: string): string {
   // Handle split cards - normalize " // " to " // " (with spaces)
@@ -37,10 +39,34 @@ interface ScryfallCard {
   }>
 }
 
+// Card metadata resolved offline by scripts/card_db.py
+export interface CardIndexEntry {
+  type_line: string
+  image: string | null
+  colors: string[]
+}
+
+let cardIndexPromise: Promise<Record<string, CardIndexEntry>> | null = null
+
+// Load the local card index once; empty when it hasn't been built
+export function loadCardIndex(): Promise<Record<string, CardIndexEntry>> {
+  if (!cardIndexPromise) {
+    cardIndexPromise = fetchBundle<Record<string, CardIndexEntry>>('card-index', '/card_index.json').catch(
+      () => ({})
+    )
+  }
+  return cardIndexPromise
+}
+
 /**
- * Fetch a single card image URL from Scryfall
+ * Fetch a single card image URL, from the local card index when possible
  */
 export async function fetchCardImage(cardName: string): Promise<string | null> {
+  const cardIndex = await loadCardIndex()
+  if (cardIndex[cardName]?.image) {
+    return cardIndex[cardName].image
+  }
+
   try {
     const searchName = cardName.replace(/\/\/.*$/, '').trim()
     const response = await fetch(`https://api.scryfall.com/cards/named?fuzzy=${encodeURIComponent(searchName)}`)
@@ -64,14 +90,24 @@ export async function fetchCardImage(cardName: string): Promise<string | null> {
 
 /**
  * Fetch card types (supertypes) for multiple cards in batch
- * Returns a map of card name -> supertype
+ * Returns a map of card name -> supertype. Cards in the local card index
+ * are resolved without network requests.
  */
 export async function fetchCardTypes(cardNames: string[]): Promise<Record<string, string>> {
   const typesMap: Record<string, string> = {}
   const nameMapping: Record<string, string> = {} // Map original name to normalized name
 
+  const cardIndex = await loadCardIndex()
+  const unresolvedNames = cardNames.filter(name => {
+    if (cardIndex[name]) {
+      typesMap[name] = extractSupertype(cardIndex[name].type_line)
+      return false
+    }
+    return true
+  })
+
   // Normalize card names and create mapping
-  cardNames.forEach(originalName => {
+  unresolvedNames.forEach(originalName => {
     const normalized = normalizeCardNameForScryfall(originalName)
     nameMapping[normalized] = originalName
   })
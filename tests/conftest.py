@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The pipeline modules import each other by bare name from scripts/
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
@@ -0,0 +1,46 @@
+import json
+import shutil
+
+import pytest
+
+import analyze
+import storage
+
+
+@pytest.fixture
+def partition(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, 'DATA_DIR', tmp_path / "data")
+    monkeypatch.setattr(storage, 'CACHE_DIR', tmp_path / "cache")
+    partition = tmp_path / "data" / "other-event"
+    partition.mkdir(parents=True)
+    shutil.copy(analyze.DECKLISTS_FILE, partition)
+    shutil.copy(storage.results_path(analyze.DATA_DIR), partition)
+    return partition
+
+
+def test_main_writes_other_events_into_their_partition(partition, tmp_path):
+    analyze.main(incremental=True, event='other-event')
+    assert {'analysis.json', 'cards.json', 'players.json'} <= {path.name for path in partition.iterdir()}
+    assert [path.name for path in (tmp_path / "data").iterdir()] == ['other-event']
+    # Incremental state stays out of the published data directory
+    assert not any(path.name.startswith('.') for path in partition.iterdir())
+    assert (tmp_path / "cache" / "events" / "other-event" / "analysis_state.json").exists()
+
+
+def test_each_event_skips_its_own_draft_rounds(partition):
+    storage.write_json_atomic(partition / storage.EVENT_INFO_NAME, {'draft_rounds': [1, 2, 3]})
+
+    analyze.main(incremental=True, event='other-event')
+    analysis = json.load(open(partition / "analysis.json"))
+    assert {match['round'] for match in analysis['matches']} & {1, 2, 3} == set()
+    assert {match['round'] for match in analysis['matches']} & {8, 9, 10} == {8, 9, 10}
+    draft_matches = sum(player['draft']['total_matches']
+                        for player in json.load(open(partition / "players.json"))['players'].values())
+
+    # Changing the draft rounds rebuilds the incremental state
+    storage.write_json_atomic(partition / storage.EVENT_INFO_NAME, {'draft_rounds': [1, 2, 3, 8, 9, 10]})
+    analyze.main(incremental=True, event='other-event')
+    analysis = json.load(open(partition / "analysis.json"))
+    assert json.dumps(analysis) == json.dumps(analyze.analyze_metagame(*analyze.load_data()))
+    assert sum(player['draft']['total_matches']
+               for player in json.load(open(partition / "players.json"))['players'].values()) > draft_matches
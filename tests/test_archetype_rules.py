@@ -0,0 +1,53 @@
+import pytest
+
+from archetype_rules import ArchetypeRules
+
+RULES = [
+    {'base': 'Izzet Lessons', 'archetype': 'Izzet Lessons (Monument)',
+     'require': [{'card': 'Monument to Endurance', 'min_copies': 2, 'board': 'main'}]},
+    {'base': 'Izzet', 'archetype': 'Izzet (Sideboard Drake)',
+     'require': [{'card': 'Drake Hatcher', 'min_copies': 3}]},
+]
+
+
+def deck(archetype, main=(), side=()):
+    return {
+        'archetype': archetype,
+        'main_deck': [{'count': count, 'name': name} for name, count in main],
+        'sideboard': [{'count': count, 'name': name} for name, count in side],
+    }
+
+
+@pytest.mark.parametrize('decklist, archetype', [
+    (deck('Izzet Lessons', main=[('Monument to Endurance', 2)]), 'Izzet Lessons (Monument)'),
+    # Card names and the base archetype match case-insensitively
+    (deck('izzet lessons', main=[('monument to endurance', 3)]), 'Izzet Lessons (Monument)'),
+    # Copies on the wrong board or below min_copies don't count
+    (deck('Izzet Lessons', main=[('Monument to Endurance', 1)], side=[('Monument to Endurance', 2)]), None),
+    # 'any' adds both boards, and a later rule applies when the first doesn't
+    (deck('Izzet Lessons', main=[('Drake Hatcher', 1)], side=[('Drake Hatcher', 2)]), 'Izzet (Sideboard Drake)'),
+    (deck('Mono-Red', main=[('Monument to Endurance', 4), ('Drake Hatcher', 4)]), None),
+])
+def test_rules_classify_by_base_archetype_board_and_copies(decklist, archetype):
+    assert ArchetypeRules(RULES).classify(decklist) == archetype
+
+
+def test_apply_copies_only_reclassified_decks():
+    rules = ArchetypeRules(RULES)
+    decklists = {
+        'a': deck('Izzet Lessons', main=[('Monument to Endurance', 2)]),
+        'b': deck('Mono-Red'),
+    }
+    classified = rules.apply(decklists)
+    assert classified['a']['archetype'] == 'Izzet Lessons (Monument)'
+    assert decklists['a']['archetype'] == 'Izzet Lessons'
+    assert classified['b'] is decklists['b']
+    assert rules.base_archetype('Izzet Lessons (Monument)') == 'Izzet Lessons'
+
+
+def test_rules_need_a_requirement_and_a_known_board():
+    with pytest.raises(ValueError):
+        ArchetypeRules([{'base': 'Izzet', 'archetype': 'Izzet (Drake)', 'require': []}])
+    with pytest.raises(ValueError):
+        ArchetypeRules([{'base': 'Izzet', 'archetype': 'Izzet (Drake)',
+                         'require': [{'card': 'Drake Hatcher', 'board': 'maybe'}]}])
@@ -0,0 +1,40 @@
+import json
+
+from card_db import build_card_index
+
+
+def test_card_index_resolves_faces_accents_and_skips_tokens(tmp_path):
+    dump = [
+        {'name': 'Fable of the Mirror-Breaker', 'layout': 'token', 'type_line': 'Token Creature'},
+        {'name': 'Fable of the Mirror-Breaker // Reflection of Kiki-Jiki', 'layout': 'transform',
+         'card_faces': [
+             {'type_line': 'Enchantment — Saga', 'colors': ['R'], 'image_uris': {'normal': 'fable.jpg'}},
+             {'type_line': 'Enchantment Creature — Goblin Shaman', 'colors': ['R']},
+         ]},
+        {'name': 'Fire // Ice', 'layout': 'split', 'type_line': 'Instant // Instant', 'colors': ['U', 'R'],
+         'image_uris': {'normal': 'fire-ice.jpg'}},
+        {'name': 'Fire', 'layout': 'normal', 'type_line': 'Instant', 'colors': ['R']},
+        {'name': 'Lim-Dûl\'s Vault', 'layout': 'normal', 'type_line': 'Instant', 'colors': ['U', 'B']},
+    ]
+    decklists = {
+        'player': {'player': 'Dang, Nam', 'archetype': 'Izzet',
+                   'main_deck': [{'count': 4, 'name': 'Fable of the Mirror-Breaker'},
+                                 {'count': 2, 'name': 'Fire // Ice'}, {'count': 1, 'name': 'Fire'}],
+                   'sideboard': [{'count': 1, 'name': "Lim-Dul's Vault"}, {'count': 1, 'name': 'Unprinted Card'}]},
+    }
+    (tmp_path / "dump.json").write_text(json.dumps(dump), encoding='utf-8')
+    (tmp_path / "decklists.json").write_text(json.dumps(decklists), encoding='utf-8')
+
+    index = build_card_index(tmp_path / "dump.json", tmp_path / "decklists.json", tmp_path / "cards.json")
+    assert json.loads((tmp_path / "cards.json").read_text()) == index
+    # A front face listed alone resolves to its double-faced card, not the token
+    assert index['Fable of the Mirror-Breaker'] == {
+        'type_line': 'Enchantment — Saga // Enchantment Creature — Goblin Shaman',
+        'image': 'fable.jpg',
+        'colors': ['R']
+    }
+    # A full-name match wins over an earlier card with a face of that name
+    assert index['Fire // Ice']['image'] == 'fire-ice.jpg'
+    assert index['Fire'] == {'type_line': 'Instant', 'image': None, 'colors': ['R']}
+    assert index["Lim-Dul's Vault"]['colors'] == ['U', 'B']
+    assert 'Unprinted Card' not in index
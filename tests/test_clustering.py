@@ -0,0 +1,30 @@
+import pytest
+
+pytest.importorskip('numpy')
+
+from clustering import cluster_archetypes  # noqa: E402
+
+
+def deck(archetype, cards, variant):
+    # 15 shared playsets plus one flex card, so decks of a list are about 0.9 similar
+    main = [{'count': 4, 'name': card} for card in cards] + [{'count': 4, 'name': f"Flex Card {variant}"}]
+    return {'player': f"{archetype} {variant}", 'archetype': archetype, 'main_deck': main}
+
+
+def test_clusters_label_decks_and_flag_disagreements():
+    izzet = [f"Izzet Card {number}" for number in range(15)]
+    red = [f"Red Card {number}" for number in range(15)]
+    decklists = {f"izzet-{variant}": deck('Izzet Lessons', izzet, variant) for variant in range(4)}
+    # A rule variant counts as its base archetype, a mislabel is flagged
+    decklists['izzet-monument'] = deck('Izzet Lessons (Monument)', izzet, 'monument')
+    decklists['izzet-mislabeled'] = deck('Mono-Red', izzet, 'mislabeled')
+    decklists.update({f"red-{variant}": deck('Mono-Red', red, variant) for variant in range(3)})
+
+    result = cluster_archetypes(decklists)
+    izzet_cluster, red_cluster = result['clusters']
+    assert (izzet_cluster['archetype'], izzet_cluster['size']) == ('Izzet Lessons', 6)
+    assert izzet_cluster['labels'] == {'Izzet Lessons': 5, 'Mono-Red': 1}
+    assert sorted(red_cluster['decks']) == ['red-0', 'red-1', 'red-2']
+    assert [(deck['key'], deck['cluster_archetype']) for deck in result['flagged']] == [
+        ('izzet-mislabeled', 'Izzet Lessons')
+    ]
@@ -0,0 +1,23 @@
+import json
+
+import pytest
+
+from analyze import DEFAULT_DRAFT_ROUNDS, analyze_metagame, load_data
+
+pytest.importorskip('numpy')
+
+
+@pytest.mark.parametrize('draft_rounds', [DEFAULT_DRAFT_ROUNDS, (1, 2, 3), ()])
+def test_columnar_engine_matches_dict_engine(draft_rounds):
+    decklists, results = load_data()
+    # Blank players are dropped and unregistered ones count as Unknown in both engines
+    results = results + [
+        {'round': 4, 'player1': ' ', 'player2': results[0]['player2'], 'p1_wins': 2, 'p2_wins': 0},
+        {'round': 4, 'player1': 'Nobody Registered', 'player2': results[0]['player1'], 'p1_wins': 0, 'p2_wins': 2},
+    ]
+
+    for legacy_format in (False, True):
+        expected = analyze_metagame(decklists, results, legacy_format=legacy_format, draft_rounds=draft_rounds)
+        columnar = analyze_metagame(decklists, results, 'columnar', legacy_format=legacy_format,
+                                    draft_rounds=draft_rounds)
+        assert json.dumps(columnar) == json.dumps(expected)
@@ -0,0 +1,28 @@
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from decklist_parser import iter_chunks, iter_decklists_from_html
+
+BENCHMARKS_RUN = Path(__file__).parent.parent / "benchmarks" / "run.py"
+
+
+@pytest.fixture(scope='module')
+def benchmarks():
+    spec = importlib.util.spec_from_file_location('benchmarks_run', BENCHMARKS_RUN)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Odd-sized chunks split tags, attributes and multi-byte characters
+@pytest.mark.parametrize('chunk_size', [None, 7, 4096])
+def test_streaming_parser_matches_regex_extraction(benchmarks, chunk_size):
+    content = benchmarks.INDEX_FIXTURE.read_bytes()
+    url = 'https://magic.gg/decklists/index'
+    chunks = [content] if chunk_size is None else iter_chunks(content, chunk_size)
+
+    decklists = list(iter_decklists_from_html(chunks, url))
+    assert len(decklists) == content.count(b'</deck-list>')
+    assert decklists == benchmarks.regex_decklists(content, url)
@@ -0,0 +1,88 @@
+import json
+
+import pytest
+
+from analyze import analyze_metagame, analyze_metagame_incremental, load_data
+
+
+@pytest.fixture(scope='module')
+def event():
+    return load_data()
+
+
+@pytest.fixture
+def decklists_path(tmp_path, event):
+    path = tmp_path / "decklists.json"
+    json.dump(event[0], open(path, 'w'))
+    return path
+
+
+def run_in_batches(decklists, results, state_file, decklists_path, batches, **kwargs):
+    step = -(-len(results) // batches)
+    for end in range(step, len(results) + step, step):
+        analysis = analyze_metagame_incremental(decklists, results[:end], state_file,
+                                                decklists_path=decklists_path, **kwargs)
+    return analysis
+
+
+@pytest.mark.parametrize('legacy_format', [False, True])
+def test_incremental_batches_match_a_full_run(event, tmp_path, decklists_path, legacy_format):
+    decklists, results = event
+    analysis = run_in_batches(decklists, results, tmp_path / "state.json", decklists_path, 4,
+                              legacy_format=legacy_format)
+    expected = analyze_metagame(decklists, results, legacy_format=legacy_format)
+    assert json.dumps(analysis) == json.dumps(expected)
+
+
+def test_incremental_bootstrap_matches_a_full_run(event, tmp_path, decklists_path):
+    decklists, results = event
+    analysis = run_in_batches(decklists, results, tmp_path / "state.json", decklists_path, 2,
+                              bootstrap_resamples=200)
+    assert json.dumps(analysis) == json.dumps(analyze_metagame(decklists, results, bootstrap_resamples=200))
+
+
+def test_state_keeps_the_match_table_in_a_separate_log(event, tmp_path, decklists_path):
+    decklists, results = event
+    state_file = tmp_path / "state.json"
+    analysis = analyze_metagame_incremental(decklists, results, state_file, decklists_path=decklists_path)
+    state = json.load(open(state_file))
+    assert 'match_table' not in state
+    assert all(not stats['matches'] for stats in state['match_stats'].values())
+    log = state_file.with_name("state.matches.jsonl").read_text().splitlines()
+    assert [json.loads(line) for line in log] == analysis['matches']
+
+
+def test_rewritten_decklists_rebuild_the_state(event, tmp_path, decklists_path, capsys):
+    decklists, results = event
+    state_file = tmp_path / "state.json"
+    analyze_metagame_incremental(decklists, results[:100], state_file, decklists_path=decklists_path)
+
+    renamed = {key: dict(decklist, archetype='Renamed') for key, decklist in decklists.items()}
+    json.dump(renamed, open(decklists_path, 'w'), indent=1)
+    capsys.readouterr()
+    analysis = analyze_metagame_incremental(renamed, results, state_file, decklists_path=decklists_path)
+    assert "rebuilding from scratch" in capsys.readouterr().out
+    assert json.dumps(analysis) == json.dumps(analyze_metagame(renamed, results))
+
+
+def test_untouched_entries_reuse_saved_derived_fields(event, tmp_path, decklists_path):
+    decklists, results = event
+    state_file = tmp_path / "state.json"
+    analyze_metagame_incremental(decklists, results[:-1], state_file, decklists_path=decklists_path)
+    last = analyze_metagame(decklists, results[-1:])['matches'][0]
+    touched = {last['archetype1'], last['archetype2']}
+
+    # Mark every saved entry; only the ones the last match touched get derived again
+    state = json.load(open(state_file))
+    for fields in state['derived']['archetype_stats'].values():
+        fields['win_rate'] = 'saved'
+    for matchup in state['derived']['matchup_stats']:
+        matchup['arch1_win_rate'] = 'saved'
+    json.dump(state, open(state_file, 'w'))
+
+    analysis = analyze_metagame_incremental(decklists, results, state_file, decklists_path=decklists_path)
+    for arch, stats in analysis['archetype_stats'].items():
+        assert (stats['win_rate'] == 'saved') == (arch not in touched)
+    for matchup in analysis['matchup_stats'].values():
+        pair = {matchup['archetype1'], matchup['archetype2']}
+        assert (matchup['arch1_win_rate'] == 'saved') == (pair != touched)
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from matchups import MatchupMatrix
+
+
+def test_summary_keys_sort_archetype_names():
+    matchups = MatchupMatrix()
+    matchups.record(matchups.intern('Temur Otters'), matchups.intern('Izzet Lessons'), 2, 1, 0)
+    summary = matchups.summary()
+    assert list(summary) == ['Izzet Lessons vs Temur Otters']
+    # archetype1 is the side the first match was counted for, here the winner
+    assert summary['Izzet Lessons vs Temur Otters']['archetype1'] == 'Temur Otters'
+
+
+def test_colliding_summary_keys_fail_loudly():
+    matchups = MatchupMatrix()
+    # "A vs B" / "C" and "A" / "B vs C" would both be keyed "A vs B vs C"
+    matchups.record(matchups.intern('A vs B'), matchups.intern('C'), 2, 0, 0)
+    matchups.record(matchups.intern('A'), matchups.intern('B vs C'), 2, 0, 1)
+    with pytest.raises(ValueError, match="'A vs B vs C'"):
+        matchups.summary()
+
+
+def test_default_analysis_runs_without_numpy():
+    scripts = Path(__file__).parent.parent / "scripts"
+    code = ("import sys; sys.modules['numpy'] = None; "
+            "from analyze import analyze_metagame, load_data; analyze_metagame(*load_data())")
+    subprocess.run([sys.executable, '-c', code], cwd=scripts, check=True)
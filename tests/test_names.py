@@ -0,0 +1,82 @@
+import re
+import unicodedata
+
+import pytest
+
+from names import WinnerResolver
+
+
+def old_normalize(name):
+    """The spider's normalize_name_for_matching before WinnerResolver"""
+    name = name.lower().strip()
+    if ',' in name:
+        parts = [p.strip() for p in name.split(',')]
+        name = f"{parts[1]} {parts[0]}"
+    name = ''.join(c for c in unicodedata.normalize('NFKD', name) if not unicodedata.combining(c))
+    return ' '.join(re.sub(r'[^\w\s]', ' ', name).split())
+
+
+def old_names_match(name1, name2):
+    def normalize(name):
+        name = name.strip()
+        if ',' in name:
+            parts = [p.strip() for p in name.split(',')]
+            return f"{parts[1]} {parts[0]}".lower()
+        return name.lower()
+
+    n1, n2 = normalize(name1), normalize(name2)
+    if n1 in n2 or n2 in n1:
+        return True
+    n1_parts, n2_parts = n1.split(), n2.split()
+    return bool(n1_parts and n2_parts and n1_parts[-1] == n2_parts[-1]
+                and (n1_parts[0] in n2_parts[0] or n2_parts[0] in n1_parts[0]))
+
+
+def old_count_matching_pieces(pieces1, pieces2):
+    if not pieces1 or not pieces2:
+        return 0
+    substring_matches = sum(1 for piece1 in pieces1 for piece2 in pieces2
+                            if piece1 != piece2 and (piece1 in piece2 or piece2 in piece1))
+    return len(set(pieces1) & set(pieces2)) + min(substring_matches, len(pieces1))
+
+
+def old_find_closest_match(winner, player1, player2):
+    winner_pieces = old_normalize(winner).split()
+    player1_pieces = old_normalize(player1).split()
+    player2_pieces = old_normalize(player2).split()
+    if not winner_pieces:
+        return None
+    p1_matches = old_count_matching_pieces(winner_pieces, player1_pieces)
+    p2_matches = old_count_matching_pieces(winner_pieces, player2_pieces)
+    if p1_matches != p2_matches:
+        return player1 if p1_matches > p2_matches else player2
+    if p1_matches > 0:
+        p1_ratio = p1_matches / max(len(player1_pieces), 1)
+        p2_ratio = p2_matches / max(len(player2_pieces), 1)
+        if p1_ratio != p2_ratio:
+            return player1 if p1_ratio > p2_ratio else player2
+    return None
+
+
+def old_winner(winner, player1, player2):
+    """The spider's winner resolution before WinnerResolver"""
+    if old_names_match(winner, player1):
+        return player1
+    if old_names_match(winner, player2):
+        return player2
+    return old_find_closest_match(winner, player1, player2)
+
+
+@pytest.mark.parametrize('winner, player1, player2, expected, confidence', [
+    # Nicknames match their full first name, directly and by token prefix
+    ('Pardee, Sam', 'Dang, Nam', 'Pardee, Samuel', 'Pardee, Samuel', 1.0),
+    ('Sam P.', 'Pardee, Samuel', 'Dang, Nam', 'Pardee, Samuel', 1.0),
+    # Equal scores go to the player with more of their name matched
+    ('M. Flores', 'Mario Alejandro Flores Silva', 'Mario Flores Ruiz', 'Mario Flores Ruiz', 0.25),
+    # Neither player can be told apart
+    ('Lee', 'Kim, Jordan', 'Park, Alex', None, 0.0),
+])
+def test_winner_resolver_agrees_with_find_closest_match(winner, player1, player2, expected, confidence):
+    resolver = WinnerResolver()
+    assert old_winner(winner, player1, player2) == expected
+    assert resolver.resolve(winner, player1, player2) == (expected, confidence)
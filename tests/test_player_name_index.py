@@ -0,0 +1,65 @@
+import pytest
+
+from analyze import PlayerNameIndex, load_data
+from names import normalize_player_name
+
+
+def linear_scan_archetype(player_name, decklists):
+    """get_player_archetype as it was before PlayerNameIndex: three passes over every decklist"""
+    normalized = normalize_player_name(player_name)
+    if not normalized:
+        return 'Unknown'
+    players = [(normalize_player_name(decklist.get('player', '')), decklist.get('archetype', 'Unknown'))
+               for decklist in decklists.values()]
+    for player, archetype in players:
+        if player == normalized:
+            return archetype
+    name_parts = normalized.split()
+    if len(name_parts) >= 2:
+        for player, archetype in players:
+            parts = player.split()
+            if len(parts) >= 2 and parts[-1] == name_parts[-1] and parts[0] == name_parts[0]:
+                return archetype
+    for player, archetype in players:
+        if normalized in player or player in normalized:
+            return archetype
+    return 'Unknown'
+
+
+DECKLISTS = {
+    'a': {'player': 'Dang, Nam', 'archetype': 'Mono-Red'},
+    'b': {'player': 'Flores Silva, Mario Alejandro', 'archetype': 'Domain'},
+    'c': {'player': 'Pardee, Samuel', 'archetype': 'Esper'},
+    'd': {'player': 'Nguyen, Nam Anh', 'archetype': 'Golgari'},
+    'e': {'player': 'José Pérez', 'archetype': 'Azorius'},
+}
+
+
+@pytest.mark.parametrize('name, archetype', [
+    # Exact, in either name order and ignoring accents and case
+    ('Nam Dang', 'Mono-Red'),
+    ('PEREZ, Jose', 'Azorius'),
+    # First and last name with the middle names left out
+    ('Mario Silva', 'Domain'),
+    # Substring, taking the first decklist in order that matches
+    ('Samuel', 'Esper'),
+    ('Nam', 'Mono-Red'),
+    ('Dr. Samuel Pardee', 'Esper'),
+    ('Reid Duke', 'Unknown'),
+    ('', 'Unknown'),
+])
+def test_index_agrees_with_linear_scan(name, archetype):
+    assert linear_scan_archetype(name, DECKLISTS) == archetype
+    assert PlayerNameIndex(DECKLISTS).lookup(name) == archetype
+
+
+def test_index_agrees_with_linear_scan_on_event_data():
+    decklists, results = load_data()
+    names = {result[field] for result in results for field in ('player1', 'player2')}
+    # Partial names exercise the first/last and substring tiers
+    names |= {' '.join(name.replace(',', ' ').split()[::2]) for name in names}
+    names |= {name.split(',')[0] for name in names}
+
+    name_index = PlayerNameIndex(decklists)
+    for name in sorted(names):
+        assert name_index.lookup(name) == linear_scan_archetype(name, decklists), name
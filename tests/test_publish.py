@@ -0,0 +1,26 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from publish import publish
+
+
+def test_root_manifest_only_lists_sections(tmp_path):
+    bundles_dir = tmp_path / "bundles"
+    manifest = publish(bundles_dir, tmp_path / "manifest.json")
+    assert json.load(open(tmp_path / "manifest.json")) == manifest
+    assert all('/' not in name for name in manifest['files'])
+
+    cards = json.load(open(tmp_path / manifest['sections']['cards/card']))['files']
+    card_name, path = next(iter(cards.items()))
+    assert card_name.startswith('cards/card/')
+    assert list(json.load(open(tmp_path / path))['cards']) == [card_name[len('cards/card/'):]]
+
+
+def test_publish_needs_only_the_standard_library(tmp_path):
+    scripts = Path(__file__).parent.parent / "scripts"
+    code = ("import sys; sys.modules.update(dict.fromkeys(['numpy', 'requests', 'bs4', 'lxml'])); "
+            "from pathlib import Path; from publish import publish; "
+            f"publish(Path({str(tmp_path)!r}) / 'bundles', Path({str(tmp_path)!r}) / 'manifest.json')")
+    subprocess.run([sys.executable, '-c', code], cwd=scripts, check=True)
@@ -0,0 +1,32 @@
+import shutil
+
+import analyze
+import season
+import storage
+
+
+def test_season_includes_the_dashboard_event(tmp_path, monkeypatch):
+    data_dir = tmp_path / "data"
+    monkeypatch.setattr(storage, 'DATA_DIR', data_dir)
+    monkeypatch.setattr(storage, 'CACHE_DIR', tmp_path / "cache")
+    partition = data_dir / "other-event"
+    partition.mkdir(parents=True)
+    shutil.copy(analyze.DECKLISTS_FILE, data_dir)
+    shutil.copy(storage.results_path(analyze.DATA_DIR), data_dir)
+    shutil.copy(analyze.DECKLISTS_FILE, partition)
+    shutil.copy(storage.results_path(analyze.DATA_DIR), partition)
+
+    events = list(storage.iter_events(data_dir))
+    assert events == [storage.DEFAULT_EVENT, 'other-event']
+    merged = season.merge_aggregates([season.analyze_event(event) for event in events])
+    assert merged['events'] == events
+    # The dashboard's analysis.json is left to analyze.py, and counters stay out of data/
+    assert not (data_dir / "analysis.json").exists()
+    assert {path.name for path in partition.iterdir()} == {'decklists.json', 'results.json', 'analysis.json'}
+    for event in events:
+        assert (storage.event_cache_dir(event) / season.AGGREGATES_NAME).exists()
+
+    # Cached aggregates aren't reused while the partition's analysis.json is missing
+    (partition / "analysis.json").unlink()
+    season.analyze_event('other-event')
+    assert {path.name for path in partition.iterdir()} == {'decklists.json', 'results.json', 'analysis.json'}
@@ -0,0 +1,18 @@
+import numpy as np
+
+from simulate import simulate_batch, win_probabilities
+
+EMPTY_MATRIX = {'archetypes': [], 'wins': [], 'losses': []}
+
+
+def test_unmeasured_field_plays_even_matchups():
+    probability = win_probabilities(EMPTY_MATRIX, ['Izzet Lessons', 'Temur Otters'])
+    assert probability.tolist() == [[0.5, 0.5], [0.5, 0.5]]
+
+
+def test_batch_with_an_unmeasured_field():
+    probability = win_probabilities(EMPTY_MATRIX, ['Izzet Lessons', 'Temur Otters'])
+    field = np.array([0] * 8 + [1] * 8)
+    top8, wins = simulate_batch(probability, field, tournaments=50, rounds=4, seed=0)
+    assert top8.sum() == 50 * 8
+    assert wins.sum() == 50
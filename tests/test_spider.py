@@ -0,0 +1,166 @@
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+from spider import BURST, MagicSpider
+
+FIXTURES = Path(__file__).parent.parent / "benchmarks" / "fixtures"
+EVENT = 'test-event'
+ROUNDS = 4
+# Each response is held this long, so overlapping requests show up as concurrency
+RESPONSE_DELAY = 0.05
+LAST_MODIFIED = 'Sat, 04 Oct 2025 12:00:00 GMT'
+
+
+class StubSite(ThreadingHTTPServer):
+    """magic.gg stand-in serving an event page and a results page per round"""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.pages = {
+            f'/events/{EVENT}': ''.join(
+                f'<a href="/news/{EVENT}-round-{round_num}-results">Round {round_num}</a>'
+                for round_num in range(1, ROUNDS + 1)
+            ).encode('utf-8'),
+        }
+        results_page = (FIXTURES / "round-4-results.html").read_bytes()
+        for round_num in range(1, ROUNDS + 1):
+            self.pages[f'/news/{EVENT}-round-{round_num}-results'] = results_page
+        self.lock = threading.Lock()
+        self.requests = []
+        self.statuses = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        site = self.server
+        with site.lock:
+            site.requests.append((time.monotonic(), self.path))
+            site.in_flight += 1
+            site.max_in_flight = max(site.max_in_flight, site.in_flight)
+        try:
+            time.sleep(RESPONSE_DELAY)
+            content = site.pages.get(self.path.split('?')[0])
+            etag = f'"{hashlib.sha256(content).hexdigest()[:16]}"' if content is not None else None
+            if etag and (self.headers.get('If-None-Match') == etag
+                         or self.headers.get('If-Modified-Since') == LAST_MODIFIED):
+                status, content = 304, b''
+            else:
+                status = 200 if content is not None else 404
+            with site.lock:
+                site.statuses.append(status)
+            self.send_response(status)
+            if etag:
+                self.send_header('ETag', etag)
+                self.send_header('Last-Modified', LAST_MODIFIED)
+            self.send_header('Content-Length', str(len(content or b'')))
+            self.end_headers()
+            self.wfile.write(content or b'')
+        finally:
+            with site.lock:
+                site.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def site(monkeypatch):
+    monkeypatch.setenv('NO_PROXY', '127.0.0.1')
+    server = StubSite()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_rounds_are_fetched_concurrently(site, tmp_path):
+    spider = MagicSpider(max_workers=4, requests_per_second=1000, use_cache=False, event=EVENT,
+                         data_dir=tmp_path, base_url=site.base_url)
+    results = spider.get_all_results()
+
+    rows = (FIXTURES / "round-4-results.html").read_text(encoding='utf-8').count('<td>vs.</td>')
+    assert len(results) == ROUNDS * rows
+    assert sorted({result['round'] for result in results}) == list(range(1, ROUNDS + 1))
+    assert site.max_in_flight > 1
+    # Every request went to the stub rather than magic.gg
+    assert list(spider.rate_limiter.buckets) == [f"127.0.0.1:{site.server_address[1]}"]
+
+
+def test_rate_limiter_spaces_requests_to_one_host(site, tmp_path):
+    rate = 20
+    spider = MagicSpider(max_workers=4, requests_per_second=rate, use_cache=False, event=EVENT,
+                         data_dir=tmp_path, base_url=site.base_url)
+    urls = [f"{site.base_url}/events/{EVENT}?page={page}" for page in range(10)]
+    pages = spider.map_concurrent(spider.fetch_content, urls)
+
+    assert pages == [site.pages[f'/events/{EVENT}']] * len(urls)
+    # After the initial burst, requests start no faster than the rate allows
+    times = sorted(requested for requested, _ in site.requests)
+    assert times[-1] - times[0] >= (len(urls) - BURST) / rate * 0.9
+
+
+def test_fuzzy_and_unresolved_winners_record_their_confidence(site, tmp_path):
+    site.pages[f'/news/{EVENT}-round-1-results'] = (
+        '<table>'
+        '<tr><td>Pardee, Samuel</td><td>vs.</td><td>Dang, Nam</td><td>Sam P. won 2-1-0</td></tr>'
+        '<tr><td>Mario Alejandro Flores Silva</td><td>vs.</td><td>Mario Flores Ruiz</td>'
+        '<td>M. Flores won 2-0-0</td></tr>'
+        '<tr><td>Kim, Jordan</td><td>vs.</td><td>Park, Alex</td><td>Lee won 2-0-0</td></tr>'
+        '</table>'
+    ).encode('utf-8')
+    spider = MagicSpider(max_workers=1, requests_per_second=1000, use_cache=False, event=EVENT,
+                         data_dir=tmp_path, base_url=site.base_url)
+    sam, mario, unresolved = spider.get_round_results(1)
+
+    assert (sam['p1_wins'], sam['p2_wins']) == (2, 1) and 'winner_confidence' not in sam
+    assert (mario['p1_wins'], mario['p2_wins'], mario['winner_confidence']) == (0, 2, 0.25)
+    # Unresolved winners default to the first player and are reported
+    assert (unresolved['p1_wins'], unresolved['p2_wins'], unresolved['winner_confidence']) == (2, 0, 0)
+    assert spider.unresolved_winners == [unresolved]
+
+
+@pytest.mark.parametrize('validator', ['etag', 'last_modified'])
+def test_cached_responses_revalidate_to_the_cached_body(site, tmp_path, validator):
+    url = f"{site.base_url}/events/{EVENT}"
+    cache_dir = tmp_path / "http"
+    spider = MagicSpider(max_workers=1, requests_per_second=1000, event=EVENT, data_dir=tmp_path,
+                         base_url=site.base_url, cache_dir=cache_dir)
+    assert spider.fetch_content(url) == site.pages[f'/events/{EVENT}']
+    # Revalidate with one validator only
+    other = {'etag': 'last_modified', 'last_modified': 'etag'}[validator]
+    index = json.loads(spider.cache.index_file.read_text())
+    assert index[url][validator]
+    index[url][other] = None
+    spider.cache.index_file.write_text(json.dumps(index))
+
+    spider = MagicSpider(max_workers=1, requests_per_second=1000, event=EVENT, data_dir=tmp_path,
+                         base_url=site.base_url, cache_dir=cache_dir)
+    assert spider.fetch_content(url) == site.pages[f'/events/{EVENT}']
+    assert site.statuses == [200, 304]
+
+    # Within the TTL the cached body is served without a request
+    spider = MagicSpider(max_workers=1, requests_per_second=1000, event=EVENT, data_dir=tmp_path,
+                         base_url=site.base_url, cache_dir=cache_dir, cache_ttl=3600)
+    assert spider.fetch_content(url) == site.pages[f'/events/{EVENT}']
+    assert site.statuses == [200, 304]
+
+    # Bodies over the size limit are evicted as soon as they're stored
+    spider = MagicSpider(max_workers=1, requests_per_second=1000, event=EVENT, data_dir=tmp_path,
+                         base_url=site.base_url, cache_dir=tmp_path / "small", cache_max_bytes=1)
+    spider.fetch_content(url)
+    assert spider.cache.entries == {}
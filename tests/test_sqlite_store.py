@@ -0,0 +1,22 @@
+import json
+
+from analyze import analyze_metagame, detect_special_archetypes, load_data
+from sqlite_store import MetagameStore
+
+
+def test_sqlite_engine_aggregates_the_on_disk_store(tmp_path):
+    decklists, results = load_data()
+    db_path = tmp_path / "metagame.db"
+    with MetagameStore(db_path) as store:
+        store.import_event('other-event', detect_special_archetypes(decklists), results)
+        stored_decklists, stored_results = store.load_event('other-event')
+
+    analysis = analyze_metagame(stored_decklists, stored_results, 'sqlite', db_path=db_path, event='other-event')
+    assert json.dumps(analysis) == json.dumps(analyze_metagame(decklists, results))
+
+    # Aggregation reads the stored event, not a copy of the arguments
+    with MetagameStore(db_path) as store:
+        store.import_event('other-event', {}, [])
+    analysis = analyze_metagame(stored_decklists, stored_results, 'sqlite', db_path=db_path, event='other-event')
+    assert analysis['matches'] == []
+    assert not analysis['matchup_stats']
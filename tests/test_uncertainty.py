@@ -0,0 +1,55 @@
+from analyze import analyze_metagame
+from uncertainty import wilson_intervals
+
+
+def decklist(player, archetype):
+    return {'player': player, 'archetype': archetype, 'main_deck': [], 'sideboard': []}
+
+
+def result(round_num, player1, player2, p1_wins, p2_wins):
+    return {'round': round_num, 'player1': player1, 'player2': player2, 'p1_wins': p1_wins, 'p2_wins': p2_wins}
+
+
+DECKLISTS = {
+    'a1': decklist('Ann Able', 'Izzet Lessons'),
+    'a2': decklist('Bob Baker', 'Izzet Lessons'),
+    'b1': decklist('Cal Cole', 'Temur Otters'),
+}
+RESULTS = [
+    # A mirror and one Izzet Lessons win over Temur Otters
+    result(4, 'Able, Ann', 'Baker, Bob', 2, 0),
+    result(5, 'Able, Ann', 'Cole, Cal', 2, 1),
+]
+
+
+def test_mirror_intervals_are_fixed_at_half():
+    analysis = analyze_metagame(DECKLISTS, RESULTS, bootstrap_resamples=1000)
+    mirror = analysis['matchup_stats']['Izzet Lessons vs Izzet Lessons']
+    assert mirror['arch1_win_rate'] == 0.5
+    for field in ('arch1_win_rate_wilson', 'arch1_win_rate_bootstrap',
+                  'arch2_win_rate_wilson', 'arch2_win_rate_bootstrap'):
+        assert mirror[field] == [0.5, 0.5]
+
+    matrix = analysis['matchup_matrix']
+    lessons = matrix['archetypes'].index('Izzet Lessons')
+    assert matrix['win_rate_wilson'][lessons][lessons] == [0.5, 0.5]
+
+
+def test_matchup_intervals_use_true_match_counts():
+    analysis = analyze_metagame(DECKLISTS, RESULTS, bootstrap_resamples=1000)
+    matchup = analysis['matchup_stats']['Izzet Lessons vs Temur Otters']
+    # The summary counts the single match from both directions
+    assert matchup['total_matches'] == 2
+
+    low, high = wilson_intervals([1], [1])[0]
+    assert matchup['arch1_win_rate_wilson'] == [round(low, 4), round(high, 4)]
+    assert matchup['arch1_win_rate_bootstrap'] == [1.0, 1.0]
+    assert matchup['arch2_win_rate_bootstrap'] == [0.0, 0.0]
+
+
+def test_bootstrap_intervals_are_opt_in():
+    analysis = analyze_metagame(DECKLISTS, RESULTS)
+    stats = analysis['archetype_stats']['Izzet Lessons']
+    assert 'win_rate_wilson' in stats
+    assert 'win_rate_bootstrap' not in stats
+    assert not any(field.endswith('_bootstrap') for matchup in analysis['matchup_stats'].values() for field in matchup)
@@ -0,0 +1,39 @@
+import pytest
+
+import watch
+
+
+def test_failed_refresh_is_retried_after_the_next_poll(monkeypatch):
+    polls = iter([{'decklists': False, 'results': True}, {'decklists': False, 'results': False}])
+
+    class Watcher:
+        def __init__(self, spider):
+            pass
+
+        def poll(self):
+            return next(polls)
+
+    refreshed = []
+
+    def refresh(changes):
+        refreshed.append(dict(changes))
+        if len(refreshed) == 1:
+            raise OSError("disk full")
+
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) == 2:
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(watch, 'MagicSpider', lambda: None)
+    monkeypatch.setattr(watch, 'EventWatcher', Watcher)
+    monkeypatch.setattr(watch, 'refresh', refresh)
+    monkeypatch.setattr(watch.time, 'sleep', sleep)
+    with pytest.raises(KeyboardInterrupt):
+        watch.watch(min_interval=5, max_interval=40)
+
+    # The second poll saw nothing new but still refreshed the first poll's results
+    assert refreshed == [{'decklists': False, 'results': True}] * 2
+    assert sleeps == [5, 5]